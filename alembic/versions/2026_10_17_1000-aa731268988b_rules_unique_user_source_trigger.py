@@ -0,0 +1,55 @@
+"""rules unique (user_id, source_id, trigger_id)
+
+Revision ID: aa731268988b
+Revises: 8fbca39e64ed
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "aa731268988b"
+down_revision: Union[str, None] = "8fbca39e64ed"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Старая пересборка скрещивала все источники пользователя со всеми его
+    # триггерами; правила с чужим источником триггера больше не активны
+    op.execute(
+        """
+        UPDATE rules
+        SET is_active = false
+        FROM triggers AS t
+        WHERE rules.trigger_id = t.id
+          AND rules.source_id <> t.source_id
+          AND rules.is_active
+        """
+    )
+    # Полные пересборки вставляли дубли — оставляем самую раннюю строку
+    op.execute(
+        """
+        DELETE FROM rules AS a
+        USING rules AS b
+        WHERE a.id > b.id
+          AND a.user_id = b.user_id
+          AND a.source_id = b.source_id
+          AND a.trigger_id = b.trigger_id
+        """
+    )
+    op.create_unique_constraint(
+        "uq_rules_user_source_trigger",
+        "rules",
+        ["user_id", "source_id", "trigger_id"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint("uq_rules_user_source_trigger", "rules", type_="unique")
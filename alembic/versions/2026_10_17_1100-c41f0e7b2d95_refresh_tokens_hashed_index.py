@@ -0,0 +1,82 @@
+"""refresh_tokens: hashed token index, token families
+
+Revision ID: c41f0e7b2d95
+Revises: aa731268988b
+Create Date: 2026-10-17 11:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c41f0e7b2d95"
+down_revision: Union[str, None] = "aa731268988b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "refresh_tokens", sa.Column("token_hash", sa.String(length=64), nullable=True)
+    )
+    op.add_column(
+        "refresh_tokens", sa.Column("family_id", sa.String(length=32), nullable=True)
+    )
+    # Каждый существующий токен — отдельная цепочка
+    op.execute(
+        """
+        UPDATE refresh_tokens
+        SET token_hash = encode(sha256(convert_to(token, 'UTF8')), 'hex'),
+            family_id = md5(id::text || clock_timestamp()::text)
+        """
+    )
+    op.execute(
+        """
+        DELETE FROM refresh_tokens AS a
+        USING refresh_tokens AS b
+        WHERE a.id > b.id AND a.token_hash = b.token_hash
+        """
+    )
+    op.alter_column("refresh_tokens", "token_hash", nullable=False)
+    op.alter_column("refresh_tokens", "family_id", nullable=False)
+    op.create_unique_constraint(
+        "refresh_tokens_token_hash_key", "refresh_tokens", ["token_hash"]
+    )
+    op.create_index(
+        op.f("ix_refresh_tokens_user_id"), "refresh_tokens", ["user_id"], unique=False
+    )
+    op.create_index(
+        op.f("ix_refresh_tokens_family_id"),
+        "refresh_tokens",
+        ["family_id"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_refresh_tokens_expires_at"),
+        "refresh_tokens",
+        ["expires_at"],
+        unique=False,
+    )
+    op.drop_column("refresh_tokens", "token")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Исходные токены не восстановить: старые строки становятся недействительными
+    op.add_column("refresh_tokens", sa.Column("token", sa.String(), nullable=True))
+    op.execute("UPDATE refresh_tokens SET token = token_hash, revoked = true")
+    op.alter_column("refresh_tokens", "token", nullable=False)
+    op.drop_index(op.f("ix_refresh_tokens_expires_at"), table_name="refresh_tokens")
+    op.drop_index(op.f("ix_refresh_tokens_family_id"), table_name="refresh_tokens")
+    op.drop_index(op.f("ix_refresh_tokens_user_id"), table_name="refresh_tokens")
+    op.drop_constraint(
+        "refresh_tokens_token_hash_key", "refresh_tokens", type_="unique"
+    )
+    op.drop_column("refresh_tokens", "family_id")
+    op.drop_column("refresh_tokens", "token_hash")
@@ -0,0 +1,65 @@
+"""indexes for rules joins, list endpoints and trigger-by-source lookups
+
+Revision ID: 5e2a9c7d1f34
+Revises: c41f0e7b2d95
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5e2a9c7d1f34"
+down_revision: Union[str, None] = "c41f0e7b2d95"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (имя, таблица, колонки, условие частичного индекса)
+# Запросы фильтруют по `Model.is_active`, а не `is_active IS TRUE`:
+# из IS TRUE планировщик не выводит условие `WHERE is_active` и индекс не берёт
+INDEXES = [
+    ("ix_triggers_user_id_id", "triggers", ["user_id", "id"], None),
+    ("ix_triggers_source_id_active", "triggers", ["source_id"], "is_active"),
+    ("ix_sources_user_id_id", "sources", ["user_id", "id"], None),
+    ("ix_sources_id_active", "sources", ["id"], "is_active"),
+    ("ix_notifications_user_id_id", "notifications", ["user_id", "id"], None),
+    (
+        "ix_notifications_user_id_active",
+        "notifications",
+        ["user_id", "id"],
+        "is_active",
+    ),
+    ("ix_rules_trigger_id_active", "rules", ["trigger_id"], "is_active"),
+    ("ix_rules_source_id", "rules", ["source_id"], None),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY не блокирует запись в таблицы, но не работает в транзакции
+    with op.get_context().autocommit_block():
+        for name, table, columns, where in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                postgresql_where=sa.text(where) if where else None,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+    for table in dict.fromkeys(table for _, table, _, _ in INDEXES):
+        op.execute(f"ANALYZE {table}")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(
+                name, table_name=table, postgresql_concurrently=True, if_exists=True
+            )
@@ -0,0 +1,37 @@
+"""refresh_tokens: revoked_at for revoked-token retention
+
+Revision ID: 9b3f6d2e8a17
+Revises: 5e2a9c7d1f34
+Create Date: 2026-10-17 13:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9b3f6d2e8a17"
+down_revision: Union[str, None] = "5e2a9c7d1f34"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "refresh_tokens", sa.Column("revoked_at", sa.DateTime(), nullable=True)
+    )
+    # Момент отзыва старых строк неизвестен: срок хранения считаем с миграции,
+    # чтобы повторное использование недавно ротированных токенов ловилось
+    op.execute(
+        "UPDATE refresh_tokens SET revoked_at = timezone('utc', now()) WHERE revoked"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("refresh_tokens", "revoked_at")
@@ -0,0 +1,76 @@
+"""
+Бенчмарки движка триггеров.
+
+Запуск из корня репозитория:
+
+    python -m benchmarks                       # все замеры
+    python -m benchmarks --only triggers registry
+    python -m benchmarks --compare benchmarks/results/baseline.json
+
+Результаты пишутся в JSON (`--out`), чтобы сравнивать прогоны до и после
+изменений движка. Замер правил требует BENCH_DATABASE_URL.
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+from benchmarks.runner import BenchResult, compare, report, save
+
+SUITES = ("triggers", "registry", "rules", "pipeline")
+DEFAULT_OUT = Path(__file__).parent / "results" / "latest.json"
+
+
+async def _run(suites: list[str], quick: bool) -> list[BenchResult]:
+    from benchmarks.bench_pipeline import run_pipeline
+    from benchmarks.bench_rules import run_rules
+    from benchmarks.bench_triggers import run_registry, run_triggers
+
+    results: list[BenchResult] = []
+    if "triggers" in suites:
+        results += run_triggers((100, 1000) if quick else (100, 1000, 10000))
+    if "registry" in suites:
+        results += run_registry()
+    if "rules" in suites:
+        results += await run_rules(
+            users=50 if quick else 1000, sources=2, triggers=5 if quick else 10
+        )
+    if "pipeline" in suites:
+        results += await run_pipeline(
+            sources_count=100 if quick else 1000,
+            triggers_per_source=5,
+            cities=20 if quick else 100,
+        )
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("--only", nargs="+", choices=SUITES, default=list(SUITES))
+    parser.add_argument("--out", type=Path, default=DEFAULT_OUT)
+    parser.add_argument("--compare", type=Path, help="JSON предыдущего прогона")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="допустимый рост mean при сравнении (0.2 — 20%%)",
+    )
+    parser.add_argument("--quick", action="store_true", help="уменьшенные объёмы")
+    args = parser.parse_args()
+
+    results = asyncio.run(_run(args.only, args.quick))
+    print(report(results))
+    save(results, args.out)
+    print(f"Saved to {args.out}")
+
+    if args.compare:
+        regressions = compare(results, args.compare, args.threshold)
+        if regressions:
+            print("Regressions:\n" + "\n".join(regressions))
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,196 @@
+import asyncio
+import json
+import random
+import zlib
+from urllib.parse import parse_qs, urlsplit
+
+from benchmarks.runner import BenchResult, abench
+from src.modules.notifications.services.dispatch_service import (
+    NotificationDispatcher,
+    deliver_batch,
+)
+from src.modules.notifications.types.base_type_notify_class import (
+    BaseTypeNotificationClass,
+)
+from src.modules.source.services.open_weather_service import OpenWeatherService
+from src.modules.source.services.polling_service import SourcePollingService
+from src.modules.trigger.services.evaluation_engine import TriggerSpec
+from src.shared.db import Sources
+from src.shared.services.cache_service import ResponseCache
+from src.shared.services.http_client import SharedHttpClient
+
+
+class FakeOpenWeather:
+    """
+    Минимальный HTTP/1.1 сервер с keep-alive, отвечающий как
+    /data/2.5/weather OpenWeather. Температура зависит от города.
+    """
+
+    def __init__(self):
+        self.requests = 0
+        self._server: asyncio.Server | None = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.sockets[0].getsockname()[:2]  # type: ignore[union-attr]
+        return f"http://{host}:{port}"
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def _handle(self, reader, writer) -> None:
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    pass
+                target = request_line.split()[1].decode()
+                city = parse_qs(urlsplit(target).query).get("q", [""])[0]
+                self.requests += 1
+                body = json.dumps(
+                    {
+                        "name": city,
+                        "main": {"temp": float(zlib.crc32(city.encode()) % 40 - 10)},
+                    }
+                ).encode()
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                    + f"Content-Length: {len(body)}\r\n\r\n".encode()
+                    + body
+                )
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+
+class _SourceRepo:
+    def __init__(self, sources: list[Sources]):
+        self.sources = sources
+
+    async def list_active(self) -> list[Sources]:
+        return self.sources
+
+
+class _TriggerRepo:
+    def __init__(self, specs: list[tuple[int, TriggerSpec]]):
+        self.specs = specs
+
+    async def list_active_specs(self, source_ids):
+        return self.specs
+
+
+class _RulesRepo:
+    async def notification_ids_by_trigger(self, trigger_ids):
+        # у каждого триггера одно уведомление с тем же ID
+        return {trigger_id: [trigger_id] for trigger_id in trigger_ids}
+
+
+class _NotificationRepo:
+    async def list_targets(self, ids):
+        return [(i, "bench", {"to": f"user{i % 100}"}) for i in ids]
+
+
+class _NullNotification(BaseTypeNotificationClass):
+    async def send(self, payload: dict, config: dict):
+        return None
+
+    @classmethod
+    def describe(cls) -> dict:
+        return {}
+
+
+def _world(
+    sources_count: int, triggers_per_source: int, cities: int, seed: int = 7
+) -> tuple[list[Sources], list[tuple[int, TriggerSpec]]]:
+    rnd = random.Random(seed)
+    sources = [
+        Sources(
+            id=i,
+            user_id=i,
+            source_type_id=1,
+            name="bench",
+            config={"city": f"city{i % cities}"},
+            is_active=True,
+        )
+        for i in range(1, sources_count + 1)
+    ]
+    specs = []
+    trigger_id = 0
+    for source in sources:
+        for _ in range(triggers_per_source):
+            trigger_id += 1
+            config = {"temp": rnd.randint(-30, 40), "op": rnd.choice(["<", ">"])}
+            specs.append((source.id, TriggerSpec(trigger_id, "temp_trigger", config)))
+    return sources, specs
+
+
+async def run_pipeline(
+    sources_count: int, triggers_per_source: int, cities: int
+) -> list[BenchResult]:
+    """
+    Задержка источник -> триггер -> уведомление за один тик: опрос
+    фейкового OpenWeather по HTTP, проверка триггеров движком, раздача
+    по каналам и доставка пачек.
+    """
+    server = FakeOpenWeather()
+    await server.start()
+    http = SharedHttpClient()
+    sources, specs = _world(sources_count, triggers_per_source, cities)
+    registry = {"bench": _NullNotification()}
+    notification_repo = _NotificationRepo()
+    extra = {
+        "sources": sources_count,
+        "triggers": len(specs),
+        "cities": cities,
+    }
+
+    async def tick(cache: ResponseCache) -> None:
+        batches: list[list] = []
+        service = SourcePollingService(
+            _SourceRepo(sources),  # type: ignore[arg-type]
+            _TriggerRepo(specs),  # type: ignore[arg-type]
+            weather_factory=lambda api_key: OpenWeatherService(
+                api_key, client=http, cache=cache, base_url=server.base_url
+            ),
+            engines={},
+        )
+        service._api_key = lambda source: "bench"  # type: ignore[method-assign]
+        fired = await service.poll_once()
+        dispatcher = NotificationDispatcher(
+            _RulesRepo(),  # type: ignore[arg-type]
+            notification_repo,  # type: ignore[arg-type]
+            send_task=lambda name, args: batches.append(args[0]),
+            registry=registry,  # type: ignore[arg-type]
+        )
+        await dispatcher.dispatch(fired)
+        for batch in batches:
+            await deliver_batch(notification_repo, batch, registry)  # type: ignore[arg-type]
+
+    warm_cache = ResponseCache("bench")
+    try:
+        return [
+            await abench(
+                "pipeline.tick_cold",
+                lambda: tick(ResponseCache("bench")),
+                repeat=10,
+                extra=extra,
+            ),
+            await abench(
+                "pipeline.tick_cached",
+                lambda: tick(warm_cache),
+                repeat=10,
+                extra=extra,
+            ),
+        ]
+    finally:
+        await http.close()
+        await server.stop()
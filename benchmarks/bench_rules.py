@@ -0,0 +1,120 @@
+import os
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from benchmarks.runner import BenchResult, abench
+from src.modules.rules.repository.rules_repo import RulesRepo
+from src.shared.db import Notifications, Rules, Sources, Triggers, TriggersTypes
+
+BENCH_DATABASE_URL_ENV = "BENCH_DATABASE_URL"
+# Отдельная схема: бенчмарк не трогает рабочие таблицы базы
+SCHEMA = "bench_rules"
+
+SEED = [
+    """
+    INSERT INTO triggers_types (id, name, description, config)
+    VALUES (1, 'temp_trigger', 'bench', '{}')
+    """,
+    """
+    INSERT INTO notifications (user_id, notification_type_id, name, config, is_active)
+    SELECT u, 1, 'bench', '{}'::jsonb, true
+    FROM generate_series(1, :users) AS u, generate_series(1, :notifications) AS n
+    """,
+    """
+    INSERT INTO sources (user_id, source_type_id, name, config, is_active)
+    SELECT u, 1, 'bench', jsonb_build_object('city', 'city' || (u % 50)), true
+    FROM generate_series(1, :users) AS u, generate_series(1, :sources) AS s
+    """,
+    """
+    INSERT INTO triggers (user_id, source_id, trigger_type_id, name, config, is_active)
+    SELECT s.user_id, s.id, 1, 'bench',
+           jsonb_build_object('temp', (t % 40) - 10, 'op', '>'), true
+    FROM sources AS s, generate_series(1, :triggers) AS t
+    """,
+]
+
+
+async def run_rules(
+    users: int, sources: int, triggers: int, notifications: int = 2
+) -> list[BenchResult]:
+    """
+    Извлечение и материализация правил `RulesRepo` на засеянном Postgres.
+
+    Запросы правил используют array_agg и ON CONFLICT, поэтому нужен
+    настоящий Postgres: DSN берётся из BENCH_DATABASE_URL
+    (postgresql+asyncpg://...). Без него замер пропускается.
+    """
+    url = os.getenv(BENCH_DATABASE_URL_ENV)
+    if not url:
+        print(f"[rules] skipped: {BENCH_DATABASE_URL_ENV} is not set")
+        return []
+
+    engine = create_async_engine(
+        url, connect_args={"server_settings": {"search_path": SCHEMA}}
+    )
+    tables = [
+        t.__table__ for t in (TriggersTypes, Notifications, Sources, Triggers, Rules)
+    ]
+    params = {
+        "users": users,
+        "sources": sources,
+        "triggers": triggers,
+        "notifications": notifications,
+    }
+    try:
+        async with engine.begin() as conn:
+            await conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+            await conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+            await conn.run_sync(
+                lambda sync: Rules.metadata.create_all(sync, tables=tables)
+            )
+            for stmt in SEED:
+                await conn.execute(text(stmt), params)
+            await conn.execute(text("ANALYZE"))
+
+        session_factory = async_sessionmaker(engine, expire_on_commit=False)
+        rules_count = users * sources * triggers
+        extra = {**params, "rules": rules_count}
+
+        async def parce():
+            async with session_factory() as session:
+                await RulesRepo(session).parce_rules()
+
+        async def stream():
+            async with session_factory() as session:
+                async for _ in RulesRepo(session).stream_rules():
+                    pass
+
+        async def materialize_full():
+            async with session_factory() as session:
+                await RulesRepo(session).materialize()
+
+        async def rebuild_streaming():
+            async with session_factory() as session:
+                await RulesRepo(session).rebuild_streaming()
+
+        async def materialize_one_trigger():
+            async with session_factory() as session:
+                await RulesRepo(session).materialize(trigger_ids=[1])
+
+        return [
+            await abench("rules.parce_rules", parce, repeat=5, extra=extra),
+            await abench("rules.stream_rules", stream, repeat=5, extra=extra),
+            await abench(
+                "rules.materialize_full", materialize_full, repeat=5, extra=extra
+            ),
+            await abench(
+                "rules.rebuild_streaming", rebuild_streaming, repeat=5, extra=extra
+            ),
+            await abench(
+                "rules.materialize_trigger",
+                materialize_one_trigger,
+                repeat=20,
+                extra=extra,
+            ),
+        ]
+    finally:
+        async with engine.begin() as conn:
+            await conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        await engine.dispose()
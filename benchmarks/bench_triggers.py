@@ -0,0 +1,105 @@
+import random
+
+from benchmarks.runner import BenchResult, bench
+from src.modules.notifications.types.notifications_types_registry import (
+    NOTIFY_REGISTRY,
+)
+from src.modules.trigger.services.evaluation_engine import (
+    TriggerEvaluationEngine,
+    TriggerSpec,
+)
+from src.modules.trigger.types.trigger_registry import TRIGGER_REGISTRY
+from src.modules.trigger.types.trigger_types.triggers_temperatures import (
+    TemperatureTrigger,
+)
+
+
+def _configs(count: int, seed: int = 42) -> list[dict]:
+    rnd = random.Random(seed)
+    return [
+        {"temp": rnd.randint(-30, 40), "op": rnd.choice(["<", ">", "="])}
+        for _ in range(count)
+    ]
+
+
+def run_triggers(trigger_counts: tuple[int, ...]) -> list[BenchResult]:
+    """
+    Пропускная способность `TemperatureTrigger`: вызов на каждый триггер
+    (как в исходной схеме) против проверки индексом движка.
+    """
+    trigger = TemperatureTrigger()
+    payload = {"temp": 12.5}
+    results = []
+
+    config = {"temp": 10, "op": ">"}
+    compiled = trigger.compile(config)
+    results.append(
+        bench("temp_trigger.call_dict", lambda: trigger(payload, config), number=5000)
+    )
+    results.append(
+        bench(
+            "temp_trigger.call_compiled",
+            lambda: trigger(payload, compiled),
+            number=5000,
+        )
+    )
+
+    for count in trigger_counts:
+        configs = _configs(count)
+        extra = {"triggers": count}
+
+        def per_trigger(configs=configs):
+            return [i for i, c in enumerate(configs) if trigger(payload, c)]
+
+        results.append(
+            bench(
+                f"temp_trigger.loop[{count}]",
+                per_trigger,
+                number=1,
+                repeat=10,
+                extra=extra,
+            )
+        )
+
+        engine = TriggerEvaluationEngine()
+        engine.load(TriggerSpec(i, "temp_trigger", c) for i, c in enumerate(configs))
+        results.append(
+            bench(
+                f"engine.evaluate[{count}]",
+                lambda engine=engine: engine.evaluate(payload),
+                number=100,
+                extra=extra,
+            )
+        )
+
+        specs = [TriggerSpec(i, "temp_trigger", c) for i, c in enumerate(configs)]
+
+        def cold_load(specs=specs):
+            TriggerEvaluationEngine().load(specs)
+
+        results.append(
+            bench(
+                f"engine.load_cold[{count}]",
+                cold_load,
+                number=1,
+                repeat=5,
+                extra=extra,
+            )
+        )
+    return results
+
+
+def run_registry() -> list[BenchResult]:
+    """Поиск типа в реестрах триггеров и уведомлений."""
+    return [
+        bench(
+            "registry.trigger_lookup",
+            lambda: TRIGGER_REGISTRY["temp_trigger"],
+            number=100000,
+        ),
+        bench(
+            "registry.notify_lookup",
+            lambda: NOTIFY_REGISTRY.get("console"),
+            number=100000,
+        ),
+    ]
@@ -0,0 +1,138 @@
+import json
+import platform
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+
+@dataclass
+class BenchResult:
+    """Результат одного замера: время одной операции в микросекундах."""
+
+    name: str
+    runs: int
+    mean_us: float
+    p50_us: float
+    p95_us: float
+    ops_per_sec: float
+    extra: dict[str, Any] = field(default_factory=dict)
+
+
+def _summarize(
+    name: str, samples: list[float], number: int, extra: dict | None
+) -> BenchResult:
+    per_op = sorted(s / number * 1e6 for s in samples)
+    mean = statistics.fmean(per_op)
+    return BenchResult(
+        name=name,
+        runs=len(per_op) * number,
+        mean_us=round(mean, 3),
+        p50_us=round(per_op[len(per_op) // 2], 3),
+        p95_us=round(per_op[min(len(per_op) - 1, int(len(per_op) * 0.95))], 3),
+        ops_per_sec=round(1e6 / mean, 1) if mean else 0.0,
+        extra=extra or {},
+    )
+
+
+def bench(
+    name: str,
+    fn: Callable[[], Any],
+    number: int = 1000,
+    repeat: int = 20,
+    extra: dict | None = None,
+) -> BenchResult:
+    """
+    Замерить синхронную функцию.
+
+    Args:
+        name (str): Имя замера (ключ в JSON).
+        fn (Callable): Измеряемая операция.
+        number (int): Вызовов в одном прогоне.
+        repeat (int): Количество прогонов (перцентили считаются по ним).
+        extra (dict | None): Параметры замера для отчёта.
+
+    Returns:
+        BenchResult: Статистика на одну операцию.
+    """
+    fn()  # прогрев
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        samples.append(time.perf_counter() - start)
+    return _summarize(name, samples, number, extra)
+
+
+async def abench(
+    name: str,
+    fn: Callable[[], Awaitable[Any]],
+    number: int = 1,
+    repeat: int = 20,
+    extra: dict | None = None,
+) -> BenchResult:
+    """Замерить корутину (см. `bench`)."""
+    await fn()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            await fn()
+        samples.append(time.perf_counter() - start)
+    return _summarize(name, samples, number, extra)
+
+
+def report(results: list[BenchResult]) -> str:
+    """Текстовая таблица результатов."""
+    width = max((len(r.name) for r in results), default=10)
+    lines = [f"{'name':<{width}}  {'mean, us':>12}  {'p95, us':>12}  {'ops/s':>12}"]
+    for r in results:
+        lines.append(
+            f"{r.name:<{width}}  {r.mean_us:>12.3f}  {r.p95_us:>12.3f}  "
+            f"{r.ops_per_sec:>12.1f}"
+        )
+    return "\n".join(lines)
+
+
+def save(results: list[BenchResult], path: Path) -> None:
+    """Сохранить результаты в JSON вместе с описанием окружения."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = {
+        "created_at": datetime.now(UTC).isoformat(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": {r.name: asdict(r) for r in results},
+    }
+    path.write_text(json.dumps(data, ensure_ascii=False, indent=2))
+
+
+def compare(
+    results: list[BenchResult], baseline_path: Path, threshold: float
+) -> list[str]:
+    """
+    Сравнить с сохранённым прогоном.
+
+    Args:
+        results (list[BenchResult]): Текущие результаты.
+        baseline_path (Path): JSON предыдущего прогона (`save`).
+        threshold (float): Допустимый рост mean (0.2 — на 20%).
+
+    Returns:
+        list[str]: Описания регрессий; пустой список — регрессий нет.
+    """
+    baseline = json.loads(baseline_path.read_text())["results"]
+    regressions = []
+    for r in results:
+        old = baseline.get(r.name)
+        if not old or not old["mean_us"]:
+            continue
+        delta = r.mean_us / old["mean_us"] - 1
+        line = f"{r.name}: {old['mean_us']:.3f} -> {r.mean_us:.3f} us ({delta:+.1%})"
+        print(line)
+        if delta > threshold:
+            regressions.append(line)
+    return regressions
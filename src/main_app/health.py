@@ -0,0 +1,180 @@
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+from sqlalchemy import text
+
+from src.shared.celery_module.celery_worker import celery_app
+from src.shared.configs.get_settings import get_settings
+from src.shared.db.engine import async_engine
+from src.shared.services.redis_pool import shared_redis_pool
+
+settings = get_settings()
+errors_logger = logging.getLogger("errors_log")
+
+# после стольких пропущенных обновлений результат считается устаревшим
+STALE_AFTER_INTERVALS = 3
+
+health_router = APIRouter(tags=["Service"])
+
+
+async def check_database() -> None:
+    """Взять соединение из пула основной базы и выполнить SELECT 1."""
+    async with async_engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+
+
+async def check_redis() -> None:
+    """PING через общий пул Redis."""
+    await shared_redis_pool.client.ping()
+
+
+async def check_broker() -> None:
+    """Подключиться к брокеру Celery (без отправки задач)."""
+    timeout = settings.health_check_timeout_seconds
+
+    def connect() -> None:
+        with celery_app.connection_for_write(connect_timeout=timeout) as conn:
+            conn.ensure_connection(max_retries=0)
+
+    # kombu синхронный — подключение в отдельном потоке
+    await asyncio.to_thread(connect)
+
+
+class HealthMonitor:
+    """
+    Фоновая проверка зависимостей для readiness-проб.
+
+    Проверки БД, Redis и брокера выполняются раз в `interval` секунд в
+    фоновой задаче, а пробы только читают последний результат, поэтому
+    частые запросы балансировщика не нагружают зависимости. Результат
+    старше `STALE_AFTER_INTERVALS` интервалов считается неготовностью:
+    зависшая фоновая задача не должна выглядеть как здоровый сервис.
+    """
+
+    def __init__(
+        self,
+        checks: dict[str, Callable[[], Awaitable[None]]] | None = None,
+        interval: float = settings.health_check_interval_seconds,
+        timeout: float = settings.health_check_timeout_seconds,
+    ):
+        """
+        Args:
+            checks (dict | None): Имя зависимости -> корутина-функция,
+                бросающая исключение при недоступности. По умолчанию БД,
+                Redis и брокер.
+            interval (float): Период проверок (в секундах).
+            timeout (float): Таймаут одной проверки (в секундах).
+        """
+        self.checks = (
+            checks
+            if checks is not None
+            else {
+                "database": check_database,
+                "redis": check_redis,
+                "broker": check_broker,
+            }
+        )
+        self.interval = interval
+        self.timeout = timeout
+        self.results: dict[str, str] = dict.fromkeys(self.checks, "unknown")
+        self.checked_at: float | None = None
+        self._task: asyncio.Task | None = None
+
+    async def _run(self, name: str, check: Callable[[], Awaitable[None]]) -> str:
+        try:
+            await asyncio.wait_for(check(), self.timeout)
+            return "ok"
+        except Exception as exc:  # noqa: BLE001
+            errors_logger.warning(f"Health check {name} failed: {exc!r}")
+            return "unavailable"
+
+    async def refresh(self) -> None:
+        """Выполнить все проверки параллельно и сохранить результат."""
+        outcomes = await asyncio.gather(
+            *(self._run(name, check) for name, check in self.checks.items())
+        )
+        self.results = dict(zip(self.checks, outcomes, strict=True))
+        self.checked_at = time.monotonic()
+
+    @property
+    def ready(self) -> bool:
+        if self.checked_at is None:
+            return False
+        age = time.monotonic() - self.checked_at
+        if age > self.interval * STALE_AFTER_INTERVALS:
+            return False
+        return all(status == "ok" for status in self.results.values())
+
+    def snapshot(self) -> dict:
+        """
+        Последний результат проверок.
+
+        Returns:
+            dict: status (ok/unavailable), статусы зависимостей и возраст
+                результата в секундах.
+        """
+        age = None
+        if self.checked_at is not None:
+            age = round(time.monotonic() - self.checked_at, 3)
+        return {
+            "status": "ok" if self.ready else "unavailable",
+            **self.results,
+            "checked_seconds_ago": age,
+        }
+
+    async def _loop(self) -> None:
+        while True:
+            await self.refresh()
+            await asyncio.sleep(self.interval)
+
+    def start(self) -> None:
+        """Запустить фоновые проверки (в lifespan приложения)."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        """Остановить фоновые проверки."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+health_monitor = HealthMonitor()
+
+
+@health_router.get(
+    "/livez",
+    summary="Liveness-проба",
+    description="Процесс жив и обслуживает event loop. Зависимости не проверяются.",
+)
+async def liveness() -> dict[str, str]:
+    return {"status": "ok"}
+
+
+@health_router.get(
+    "/readyz",
+    summary="Readiness-проба",
+    description="Последний результат фоновой проверки БД, Redis и брокера. "
+    "503, если какая-то зависимость недоступна или результат устарел.",
+)
+async def readiness() -> JSONResponse:
+    return JSONResponse(
+        health_monitor.snapshot(), status_code=200 if health_monitor.ready else 503
+    )
+
+
+@health_router.get(
+    "/health_check",
+    summary="Проверка работоспособности приложения и базы данных",
+    description="Совместимый адрес для старых проб; то же, что /readyz.",
+)
+async def health_check() -> JSONResponse:
+    return await readiness()
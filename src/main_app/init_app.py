@@ -1,9 +1,12 @@
 from contextlib import asynccontextmanager
 
-from fastapi import Depends, FastAPI
+from fastapi import FastAPI
 from fastapi.exceptions import HTTPException, RequestValidationError
 
+from src.main_app.health import health_monitor, health_router
+from src.main_app.metrics import MetricsMiddleware, metrics_router
 from src.modules.auth.api.v1.auth_router import v1_auth
+from src.modules.auth.api.v1.services.password_hasher import password_hasher
 from src.modules.auth.exceptions_handle.stream_exceptions_handlers import (
     generic_exception_handler,
     http_exception_handler,
@@ -11,49 +14,46 @@ from src.modules.auth.exceptions_handle.stream_exceptions_handlers import (
 )
 from src.modules.notifications.api.v1.router import v1_notification_router
 from src.modules.source.api.v1.router import v1_api_source
+from src.modules.source.services.open_weather_service import weather_cache
 from src.modules.trigger.api.v1.trigger_router import v1_trigger_router
-from src.shared.celery_module.celery_worker import celery_app
-from src.shared.configs.log_conf import setup_logger
+from src.shared.configs.log_conf import setup_logger, shutdown_logger
+from src.shared.db.engine import dispose_engines
+from src.shared.services.http_client import shared_http_client
+from src.shared.services.redis_pool import shared_redis_pool
+from src.shared.services.redis_service import RedisService
+from src.shared.services.static_catalog import warm_catalogs
+from src.shared.services.token_verifier import token_verifier
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     setup_logger()
     print("Логирование инициализировано")
+    warm_catalogs()
+    weather_cache.bind_redis(RedisService(shared_redis_pool.client))
+    token_verifier.start()
+    health_monitor.start()
     yield
+    await health_monitor.stop()
+    await token_verifier.stop()
+    await shared_http_client.close()
+    weather_cache.bind_redis(None)
+    await shared_redis_pool.close()
+    password_hasher.shutdown()
+    await dispose_engines()
     print("Приложение останавливается")
+    shutdown_logger()
 
 
 def get_app() -> FastAPI:
     app_init = FastAPI(version="1.0.0", docs_url="/swagger", lifespan=lifespan)
 
-    from sqlalchemy import text
-    from sqlalchemy.exc import SQLAlchemyError
-    from sqlalchemy.ext.asyncio import AsyncSession
-
-    from src.shared.db.session import get_async_session
-
-    @app_init.get(
-        "/health_check",
-        summary="Проверка работоспособности приложения и базы данных",
-        description="Возвращает статус работы сервера и подключения к базе данных.",
-        tags=["Service"],
-    )
-    async def health_check(
-        session: AsyncSession = Depends(get_async_session),
-    ) -> dict[str, str]:
-        try:
-            celery_app.send_task("sync_articles")
-            await session.execute(text("SELECT 1"))
-            return {"status": "ok", "database": "connected"}
-        except SQLAlchemyError as e:
-            return {"status": "error", "database": f"unavailable: {str(e)}"}
-        except Exception as e:
-            return {"status": "error", "database": f"unavailable: {str(e)}"}
-
     app_init.add_exception_handler(RequestValidationError, validation_exception_handler)  # type: ignore
     app_init.add_exception_handler(HTTPException, http_exception_handler)  # type: ignore
     app_init.add_exception_handler(Exception, generic_exception_handler)
+    app_init.add_middleware(MetricsMiddleware)
+    app_init.include_router(health_router)
+    app_init.include_router(metrics_router)
     app_init.include_router(v1_auth)
     app_init.include_router(v1_api_source)
     app_init.include_router(v1_notification_router)
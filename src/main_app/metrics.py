@@ -0,0 +1,146 @@
+import time
+
+import redis.asyncio as redis
+from fastapi import APIRouter, Response
+from kombu.transport.redis import Channel
+
+from src.modules.auth.api.v1.services.password_hasher import password_hasher
+from src.shared.configs import celery_conf
+from src.shared.configs.get_settings import get_settings
+from src.shared.db.engine import async_engine, async_read_engine
+from src.shared.services.metrics import http_request_duration, metrics
+from src.shared.services.redis_pool import shared_redis_pool
+
+settings = get_settings()
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+CELERY_QUEUES = tuple(queue.name for queue in celery_conf.task_queues)
+
+metrics_router = APIRouter(tags=["Service"])
+
+
+class MetricsMiddleware:
+    """
+    ASGI-middleware, замеряющий время обработки запросов.
+
+    Метка `route` — шаблон пути (`/trigger/{trigger_id}`), а не сам путь,
+    чтобы число рядов не росло с числом ID. Запросы мимо роутов попадают
+    в `route="unmatched"`.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        started = time.perf_counter()
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get("route")
+            http_request_duration.observe(
+                time.perf_counter() - started,
+                method=scope["method"],
+                route=getattr(route, "path", "unmatched"),
+                status=str(status),
+            )
+
+
+@metrics.collector
+async def collect_pools():
+    """Загрузка пулов БД, Redis и хеширования паролей."""
+    engines = {"primary": async_engine}
+    if async_read_engine is not async_engine:
+        engines["replica"] = async_read_engine
+    db = [(engine.sync_engine.pool, label) for label, engine in engines.items()]
+    redis_stats = shared_redis_pool.stats()
+    hasher = password_hasher.stats()
+    return [
+        (
+            "db_pool_checked_out",
+            "gauge",
+            "Соединения БД, выданные из пула",
+            [({"engine": label}, pool.checkedout()) for pool, label in db],
+        ),
+        (
+            "db_pool_overflow",
+            "gauge",
+            "Соединения БД сверх pool_size",
+            [({"engine": label}, max(pool.overflow(), 0)) for pool, label in db],
+        ),
+        (
+            "redis_pool_connections",
+            "gauge",
+            "Соединения пула Redis",
+            [
+                ({"state": "in_use"}, redis_stats["in_use"]),
+                ({"state": "idle"}, redis_stats["idle"]),
+            ],
+        ),
+        (
+            "password_hasher_queued",
+            "gauge",
+            "Вызовы bcrypt, ждущие свободный поток",
+            [({}, hasher["queued"])],
+        ),
+        (
+            "password_hasher_rejected_total",
+            "counter",
+            "Отказы хеширования из-за переполненной очереди",
+            [({}, hasher["rejected"])],
+        ),
+    ]
+
+
+@metrics.collector
+async def collect_celery_queues():
+    """Длины очередей Celery в брокере Redis (с учётом очередей приоритетов)."""
+    if not settings.celery_broker_url.startswith(("redis://", "rediss://")):
+        return []
+    keys = {
+        queue: [
+            f"{queue}{Channel.sep}{step}" if step else queue
+            for step in Channel.priority_steps
+        ]
+        for queue in CELERY_QUEUES
+    }
+    async with redis.Redis.from_url(settings.celery_broker_url) as client:
+        pipe = client.pipeline(transaction=False)
+        for queue_keys in keys.values():
+            for key in queue_keys:
+                pipe.llen(key)
+        lengths = iter(await pipe.execute())
+    return [
+        (
+            "celery_queue_length",
+            "gauge",
+            "Задачи, ждущие в очереди брокера",
+            [
+                ({"queue": queue}, sum(next(lengths) for _ in queue_keys))
+                for queue, queue_keys in keys.items()
+            ],
+        )
+    ]
+
+
+@metrics_router.get(
+    "/metrics",
+    summary="Метрики в формате Prometheus",
+    description="Задержки запросов, пулов и внешних API, счётчики триггеров, "
+    "длины очередей Celery.",
+    response_class=Response,
+)
+async def get_metrics() -> Response:
+    body = await metrics.render(shared_redis_pool.client)
+    return Response(content=body, media_type=CONTENT_TYPE)
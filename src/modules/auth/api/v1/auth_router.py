@@ -1,23 +1,35 @@
 import logging
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, status
 
 from src.modules.auth.api.v1.deps.get_auth_service import get_auth_service
 from src.modules.auth.api.v1.schemas import (
     AuthInSchema,
     LoginResponseSchema,
+    RefreshInSchema,
+    TokenPairSchema,
     UserCreateSchema,
     UserOutSchema,
 )
 from src.modules.auth.api.v1.services.auth_service import AuthService
+from src.modules.auth.api.v1.services.password_hasher import PasswordHasherBusyError
 from src.shared.decorators import log_action
 from src.shared.deps.auth_dependencies import authenticate_user
+from src.shared.services.token_verifier import token_verifier
 
 v1_auth = APIRouter(prefix="/auth", tags=["Authentication, authorisation"])
 
 auth_logger = logging.getLogger("auth_log")
 
 
+def _busy(exc: PasswordHasherBusyError) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail=str(exc),
+        headers={"Retry-After": "1"},
+    )
+
+
 @v1_auth.get("/me", summary="Получить данные текущего пользователя")
 async def get_current_user(payload: dict = Depends(authenticate_user)):
     """Вернуть информацию о текущем пользователе из JWT payload."""
@@ -27,13 +39,20 @@ async def get_current_user(payload: dict = Depends(authenticate_user)):
     }
 
 
+@v1_auth.post("/logout", summary="Отозвать текущий access токен")
+async def logout(payload: dict = Depends(authenticate_user)):
+    """Отозвать токен из заголовка Authorization до истечения его срока."""
+    await token_verifier.revoke(payload)
+    return {"status": "ok"}
+
+
 @v1_auth.post(
     "/login",
     response_model=LoginResponseSchema,
     summary="Вход пользователя",
     description="Авторизация по имени пользователя и паролю. Возвращает JWT токен и информацию о пользователе.",
 )
-@log_action("User {username} successfully logged in", auth_logger)
+@log_action("User {username} successfully logged in", auth_logger, duration=True)
 async def login(
     token_data: AuthInSchema, service: AuthService = Depends(get_auth_service)
 ):
@@ -54,6 +73,41 @@ async def login(
         username = token_data.username
         login_response = await service.login(username, token_data.password)
         return login_response
+    except PasswordHasherBusyError as e:
+        raise _busy(e) from e
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"{e}") from e
+
+
+@v1_auth.post(
+    "/refresh",
+    response_model=TokenPairSchema,
+    summary="Обновление токенов",
+    description="Обменивает refresh токен на новую пару токенов. "
+    "Предъявленный refresh токен становится недействительным.",
+)
+async def refresh(
+    data: RefreshInSchema, service: AuthService = Depends(get_auth_service)
+):
+    """
+    Выполнить ротацию refresh токена.
+
+    Args:
+        data (RefreshInSchema): Текущий refresh токен.
+        service (AuthService): Сервис авторизации.
+
+    Returns:
+        TokenPairSchema: Новые access/refresh токены.
+
+    Raises:
+        HTTPException: 401, если токен недействителен или отозван.
+    """
+    try:
+        return await service.refresh(data.refresh_token)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED, detail=f"{e}"
+        ) from e
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"{e}") from e
 
@@ -86,5 +140,7 @@ async def register(
         user = await service.register_user(data)
 
         return user
+    except PasswordHasherBusyError as e:
+        raise _busy(e) from e
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"{e}") from e
@@ -32,6 +32,18 @@ class UserOutSchema(BaseModel):
 class JWTCreateSchema(BaseModel):
     user_id: int
     token: str
+    family_id: str | None = None
+
+
+class RefreshInSchema(BaseModel):
+    refresh_token: str
+
+
+class TokenPairSchema(BaseModel):
+    access_token: str
+    refresh_token: str
+    token_type: str = "bearer"
+    expires_at: datetime
 
 
 class LoginResponseSchema(BaseModel):
@@ -1,12 +1,19 @@
+import asyncio
 import logging
 
+from jose import JWTError
+
 from src.modules.auth.api.v1.schemas import (
     JWTCreateSchema,
     LoginResponseSchema,
+    TokenPairSchema,
     UserCreateSchema,
     UserOutSchema,
 )
-from src.modules.auth.configs.crypt_conf import pwd_context
+from src.modules.auth.api.v1.services.password_hasher import (
+    PasswordHasher,
+    password_hasher,
+)
 from src.modules.auth.repositories.jwt_repo import JWTRepo
 from src.modules.auth.repositories.user_repo import UserRepository
 from src.shared.configs.get_settings import get_settings
@@ -14,6 +21,7 @@ from src.shared.configs.settings import Settings
 from src.shared.services.jwt_service import (
     create_access_token,
     create_refresh_token,
+    decode_token,
 )
 from src.shared.services.redis_service import RedisService
 
@@ -32,6 +40,7 @@ class AuthService:
         jwt_repo: JWTRepo | None = None,
         redis_service: RedisService | None = None,
         settings: Settings | None = None,
+        hasher: PasswordHasher | None = None,
     ):
         """
         Инициализация сервиса.
@@ -42,11 +51,14 @@ class AuthService:
             redis_service (RedisService | None): Клиент Redis для хранения access токенов.
             settings (Settings | None): Настройки приложения. Если не
                 переданы, подставляются глобальные.
+            hasher (PasswordHasher | None): Пул хеширования паролей.
+                По умолчанию общий для процесса.
         """
         self.user_repo = user_repo
         self.jwt_repo = jwt_repo
         self.redis_client = redis_service
         self.settings = settings or get_settings()
+        self.hasher = hasher or password_hasher
 
     async def login(self, username: str, password: str):
         """
@@ -62,37 +74,48 @@ class AuthService:
         Raises:
             ValueError: Если логин или пароль неверные.
             RuntimeError: Если зависимость не инициализирована.
+            PasswordHasherBusyError: Если очередь хеширования заполнена.
         """
         if self.user_repo is None:
             errors_logger.error("UserRepository is not initialized")
             raise RuntimeError("UserRepository is not initialized")
+        if self.redis_client is None:
+            errors_logger.error("RedisService is not initialized")
+            raise RuntimeError("RedisService is not initialized")
+        if self.jwt_repo is None:
+            errors_logger.error("JWTRepo is not initialized")
+            raise RuntimeError("JWTRepo is not initialized")
+
+        # хеш пароля не кэшируется: смена пароля действует сразу во всех процессах
         user = await self.user_repo.get_by_fields(username=username)
 
-        if not user or not pwd_context.verify(password, user.hashed_password):
+        verified, new_hash = False, None
+        if user:
+            verified, new_hash = await self.hasher.verify_and_update(
+                password, user.hashed_password
+            )
+        if not verified:
             auth_logger.info(f"User {username} unsuccessfully logged in")
             errors_logger.error(f"Invalid username or password {username}")
             raise ValueError("Invalid username or password")
 
+        if new_hash is not None:
+            # параметры pwd_context поменялись — перехешируем, пока пароль известен
+            try:
+                await self.user_repo.update_password(user.id, new_hash)
+            except Exception as exc:  # noqa: BLE001
+                errors_logger.error(f"Password rehash for {username} failed: {exc}")
+
         user_id = str(user.id)
         jwt_data = {"is_superuser": user.is_superuser}
 
         access = create_access_token(user_id, **jwt_data)
         refresh = create_refresh_token(user_id, **jwt_data)
 
-        if self.redis_client is None:
-            errors_logger.error("RedisService is not initialized")
-            raise RuntimeError("RedisService is not initialized")
-
-        await self.redis_client.set(
-            user_id, access, self.settings.access_expire_seconds
-        )
-
-        if self.jwt_repo is None:
-            errors_logger.error("JWTRepo is not initialized")
-            raise RuntimeError("JWTRepo is not initialized")
-
-        jwt = await self.jwt_repo.create(
-            JWTCreateSchema(user_id=int(user_id), token=refresh)
+        # Redis и Postgres независимы — пишем параллельно, по одному round trip
+        _, jwt = await asyncio.gather(
+            self.redis_client.set(user_id, access, self.settings.access_expire_seconds),
+            self.jwt_repo.create(JWTCreateSchema(user_id=int(user_id), token=refresh)),
         )
 
         return LoginResponseSchema(
@@ -108,6 +131,66 @@ class AuthService:
             ),
         )
 
+    async def refresh(self, refresh_token: str) -> TokenPairSchema:
+        """
+        Обменять refresh токен на новую пару токенов (ротация).
+
+        Предъявленный токен отзывается, новый продолжает ту же цепочку.
+        Повторное предъявление уже отозванного токена означает утечку:
+        отзывается вся цепочка.
+
+        Args:
+            refresh_token (str): Refresh токен.
+
+        Returns:
+            TokenPairSchema: Новые access/refresh токены.
+
+        Raises:
+            ValueError: Если токен недействителен, отозван или уже использован.
+            RuntimeError: Если зависимость не инициализирована.
+        """
+        if self.jwt_repo is None:
+            errors_logger.error("JWTRepo is not initialized")
+            raise RuntimeError("JWTRepo is not initialized")
+
+        try:
+            payload = decode_token(refresh_token)
+        except JWTError as exc:
+            raise ValueError("Invalid refresh token") from exc
+
+        current = await self.jwt_repo.get_by_token(refresh_token)
+        if current is None:
+            raise ValueError("Invalid refresh token")
+        if current.revoked:
+            errors_logger.error(
+                f"Refresh token reuse for user {current.user_id}, "
+                f"family {current.family_id} revoked"
+            )
+            await self.jwt_repo.revoke_family(current.family_id)
+            raise ValueError("Refresh token has been revoked")
+
+        user_id = str(current.user_id)
+        jwt_data = {"is_superuser": payload.get("is_superuser", False)}
+        access = create_access_token(user_id, **jwt_data)
+        refresh = create_refresh_token(user_id, **jwt_data)
+
+        if self.redis_client is None:
+            jwt = await self.jwt_repo.rotate(current, refresh)
+        else:
+            jwt, _ = await asyncio.gather(
+                self.jwt_repo.rotate(current, refresh),
+                self.redis_client.set(
+                    user_id, access, self.settings.access_expire_seconds
+                ),
+            )
+
+        return TokenPairSchema(
+            access_token=access,
+            refresh_token=refresh,
+            token_type="bearer",
+            expires_at=jwt.expires_at,
+        )
+
     async def register_user(self, data: UserCreateSchema):
         """
         Регистрация нового пользователя.
@@ -121,6 +204,7 @@ class AuthService:
         Raises:
             ValueError: Если пользователь с таким email или username уже существует.
             RuntimeError: Если репозиторий пользователей не инициализирован.
+            PasswordHasherBusyError: Если очередь хеширования заполнена.
         """
         if self.user_repo is None:
             errors_logger.error("UserRepository is not initialized")
@@ -135,7 +219,7 @@ class AuthService:
             )
             raise ValueError("User with this email or username already exists")
 
-        hashed_password = pwd_context.hash(data.password)
+        hashed_password = await self.hasher.hash(data.password)
         return await self.user_repo.create(
             data.model_dump(exclude="password"),  # type: ignore
             hashed_password,
@@ -0,0 +1,117 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from passlib.context import CryptContext
+
+from src.modules.auth.configs.crypt_conf import pwd_context
+from src.shared.configs.get_settings import get_settings
+
+settings = get_settings()
+
+
+class PasswordHasherBusyError(RuntimeError):
+    """Очередь хеширования заполнена — запрос нужно повторить позже."""
+
+
+class PasswordHasher:
+    """
+    Хеширование и проверка паролей вне event loop.
+
+    bcrypt занимает 100–300 мс CPU на вызов и отпускает GIL, поэтому
+    вызовы выполняются в отдельном пуле потоков ограниченного размера.
+    Если в работе и в очереди уже `workers + max_queue` вызовов, новые
+    отклоняются `PasswordHasherBusyError` (API отвечает 503), а не копятся
+    до таймаутов клиентов.
+    """
+
+    def __init__(
+        self,
+        context: CryptContext = pwd_context,
+        workers: int = settings.password_hash_workers,
+        max_queue: int = settings.password_hash_max_queue,
+    ):
+        """
+        Args:
+            context (CryptContext): Контекст Passlib.
+            workers (int): Размер пула потоков.
+            max_queue (int): Сколько вызовов может ждать свободный поток.
+        """
+        self.context = context
+        self.workers = workers
+        self.max_queue = max_queue
+        self._executor: ThreadPoolExecutor | None = None
+        self._pending = 0
+        self.rejected = 0
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="password-hasher"
+            )
+        return self._executor
+
+    async def _run(self, fn, *args):
+        if self._pending >= self.workers + self.max_queue:
+            self.rejected += 1
+            raise PasswordHasherBusyError("Password hashing queue is full")
+        self._pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, fn, *args)
+        finally:
+            self._pending -= 1
+
+    async def hash(self, password: str) -> str:
+        """
+        Захешировать пароль.
+
+        Raises:
+            PasswordHasherBusyError: Если очередь хеширования заполнена.
+        """
+        return await self._run(self.context.hash, password)
+
+    async def verify_and_update(
+        self, password: str, hashed_password: str
+    ) -> tuple[bool, str | None]:
+        """
+        Проверить пароль и, если параметры контекста поменялись
+        (схема, число раундов), вернуть новый хеш.
+
+        Args:
+            password (str): Пароль в открытом виде.
+            hashed_password (str): Сохранённый хеш.
+
+        Returns:
+            tuple[bool, str | None]: Совпал ли пароль и новый хеш (или None).
+
+        Raises:
+            PasswordHasherBusyError: Если очередь хеширования заполнена.
+        """
+        return await self._run(
+            self.context.verify_and_update, password, hashed_password
+        )
+
+    def stats(self) -> dict[str, int]:
+        """
+        Текущая загрузка пула.
+
+        Returns:
+            dict[str, int]: workers, in_flight, queued и rejected (всего отказов).
+        """
+        in_flight = min(self._pending, self.workers)
+        return {
+            "workers": self.workers,
+            "in_flight": in_flight,
+            "queued": self._pending - in_flight,
+            "rejected": self.rejected,
+        }
+
+    def shutdown(self) -> None:
+        """Остановить пул потоков."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+password_hasher = PasswordHasher()
@@ -1,6 +1,8 @@
 import httpx
 from fastapi import HTTPException
 
+from src.shared.services.http_client import shared_http_client
+
 
 async def send_request(
     method: str,
@@ -9,7 +11,7 @@ async def send_request(
     json=None,
     params=None,
     headers=None,
-    timeout=5.0,
+    timeout: float | None = None,
     **kwargs,
 ):
     """
@@ -21,7 +23,8 @@ async def send_request(
         json: Тело запроса в формате JSON.
         params: Query-параметры.
         headers: Пользовательские заголовки.
-        timeout (float): Таймаут ожидания ответа.
+        timeout (float | None): Таймаут ожидания ответа. По умолчанию —
+            таймаут общего клиента.
         **kwargs: Дополнительные параметры клиента `httpx`.
 
     Returns:
@@ -30,16 +33,17 @@ async def send_request(
     Raises:
         HTTPException: При сетевых проблемах или ошибочном статусе.
     """
+    if timeout is not None:
+        kwargs["timeout"] = timeout
     try:
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.request(
-                method=method,
-                url=url,
-                json=json,
-                params=params,
-                headers=headers,
-                **kwargs,
-            )
+        response = await shared_http_client.request(
+            method,
+            url,
+            json=json,
+            params=params,
+            headers=headers,
+            **kwargs,
+        )
 
         if response.status_code >= 400:
             raise HTTPException(status_code=response.status_code, detail=response.text)
@@ -3,6 +3,12 @@ from passlib.context import CryptContext
 from src.shared.configs.get_settings import get_settings
 
 settings = get_settings()
+# Смена PWD_BCRYPT_ROUNDS перехеширует пароли при следующем входе
+_bcrypt_options = (
+    {"bcrypt__rounds": settings.pwd_bcrypt_rounds} if settings.pwd_bcrypt_rounds else {}
+)
 pwd_context = CryptContext(
-    schemes=[settings.pwd_context_schemes], deprecated=settings.pwd_context_deprecated
+    schemes=[settings.pwd_context_schemes],
+    deprecated=settings.pwd_context_deprecated,
+    **_bcrypt_options,
 )
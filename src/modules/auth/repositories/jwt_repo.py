@@ -1,14 +1,22 @@
-from datetime import datetime, timedelta, timezone
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
 
+from sqlalchemy import and_, delete, insert, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.modules.auth.api.v1.schemas import JWTCreateSchema
 from src.shared.configs.get_settings import get_settings
 from src.shared.db.models.auth import RefreshToken
+from src.shared.services.jwt_service import token_digest
 
 settings = get_settings()
 
 
+def _utcnow() -> datetime:
+    # колонки refresh_tokens — naive UTC
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
 class JWTRepo:
     """
     Репозиторий для работы с refresh токенами в базе данных.
@@ -25,27 +33,156 @@ class JWTRepo:
 
     async def create(self, jwt_data: JWTCreateSchema):
         """
-        Создать и сохранить refresh токен.
+        Создать и сохранить refresh токен (в базе хранится только его хэш).
+
+        Строка вставляется через `INSERT ... RETURNING`: один запрос
+        вместо INSERT + SELECT при `session.refresh`.
 
         Args:
-            jwt_data (JWTCreateSchema): Данные токена.
+            jwt_data (JWTCreateSchema): Данные токена. Без `family_id`
+                начинается новая цепочка ротаций.
 
         Returns:
             RefreshToken: Созданный токен.
         """
-        expires_at = (
-            datetime.now(timezone.utc) + timedelta(days=settings.refresh_expire_days)
-        ).replace(tzinfo=None)
+        result = await self.session.execute(
+            insert(RefreshToken)
+            .values(**self._token_values(jwt_data))
+            .returning(RefreshToken)
+        )
+        jwt = result.scalar_one()
+        await self.session.commit()
 
-        jwt = RefreshToken(
-            user_id=jwt_data.user_id,
-            token=jwt_data.token,
-            expires_at=expires_at,
-            revoked=False,
+        return jwt
+
+    @staticmethod
+    def _token_values(jwt_data: JWTCreateSchema) -> dict:
+        now = _utcnow()
+        return {
+            "user_id": jwt_data.user_id,
+            "token_hash": token_digest(jwt_data.token),
+            "family_id": jwt_data.family_id or uuid4().hex,
+            "created_at": now,
+            "expires_at": now + timedelta(days=settings.refresh_expire_days),
+            "revoked": False,
+        }
+
+    async def get_by_token(self, token: str) -> RefreshToken | None:
+        """
+        Найти refresh токен по уникальному индексу хэша.
+
+        Args:
+            token (str): Refresh токен.
+
+        Returns:
+            RefreshToken | None: Запись токена или None.
+        """
+        result = await self.session.execute(
+            select(RefreshToken).where(RefreshToken.token_hash == token_digest(token))
         )
+        return result.scalar_one_or_none()
 
-        self.session.add(jwt)
-        await self.session.commit()
-        await self.session.refresh(jwt)
+    async def rotate(self, current: RefreshToken, new_token: str) -> RefreshToken:
+        """
+        Заменить токен новым в той же цепочке.
+
+        Старый токен отзывается условным UPDATE, поэтому из двух
+        параллельных обновлений с одним токеном проходит только одно.
+
+        Args:
+            current (RefreshToken): Предъявленный токен.
+            new_token (str): Новый refresh токен.
+
+        Returns:
+            RefreshToken: Новая запись.
 
+        Raises:
+            ValueError: Если токен уже был отозван.
+        """
+        result = await self.session.execute(
+            update(RefreshToken)
+            .where(RefreshToken.id == current.id, RefreshToken.revoked.is_(False))
+            .values(revoked=True, revoked_at=_utcnow())
+        )
+        if result.rowcount != 1:
+            await self.session.rollback()
+            raise ValueError("Refresh token already used")
+
+        result = await self.session.execute(
+            insert(RefreshToken)
+            .values(
+                **self._token_values(
+                    JWTCreateSchema(
+                        user_id=current.user_id,
+                        token=new_token,
+                        family_id=current.family_id,
+                    )
+                )
+            )
+            .returning(RefreshToken)
+        )
+        jwt = result.scalar_one()
+        await self.session.commit()
         return jwt
+
+    async def revoke_family(self, family_id: str) -> None:
+        """
+        Отозвать все токены цепочки.
+
+        Args:
+            family_id (str): Идентификатор цепочки.
+        """
+        await self.session.execute(
+            update(RefreshToken)
+            .where(RefreshToken.family_id == family_id, RefreshToken.revoked.is_(False))
+            .values(revoked=True, revoked_at=_utcnow())
+        )
+        await self.session.commit()
+
+    async def delete_expired(
+        self,
+        batch_size: int = settings.refresh_sweep_batch_size,
+        revoked_retention: timedelta = timedelta(
+            hours=settings.refresh_revoked_retention_hours
+        ),
+    ) -> int:
+        """
+        Удалить истёкшие токены и давно отозванные порциями.
+
+        Каждая порция удаляется в своей транзакции, строки, заблокированные
+        параллельной ротацией, пропускаются (SKIP LOCKED). Отозванные токены
+        живут `revoked_retention` с момента отзыва (а не выпуска), чтобы
+        повторное использование ротированного токена ещё распознавалось.
+
+        Args:
+            batch_size (int): Строк в одной порции.
+            revoked_retention (timedelta): Сколько хранить отозванные токены.
+
+        Returns:
+            int: Количество удалённых строк.
+        """
+        total = 0
+        while True:
+            now = _utcnow()
+            ids = (
+                select(RefreshToken.id)
+                .where(
+                    or_(
+                        RefreshToken.expires_at < now,
+                        and_(
+                            RefreshToken.revoked.is_(True),
+                            RefreshToken.revoked_at < now - revoked_retention,
+                        ),
+                    )
+                )
+                .limit(batch_size)
+                .with_for_update(skip_locked=True)
+                .scalar_subquery()
+            )
+            result = await self.session.execute(
+                delete(RefreshToken).where(RefreshToken.id.in_(ids))
+            )
+            await self.session.commit()
+            total += result.rowcount
+            if result.rowcount < batch_size:
+                return total
@@ -1,4 +1,4 @@
-from sqlalchemy import and_, exists, or_, select
+from sqlalchemy import and_, exists, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.shared.db.models.auth import User
@@ -67,6 +67,21 @@ class UserRepository:
         result = await self.session.execute(stmt)
         return result.scalar()
 
+    async def update_password(self, user_id: int, hashed_password: str) -> None:
+        """
+        Заменить хэш пароля пользователя.
+
+        Args:
+            user_id (int): ID пользователя.
+            hashed_password (str): Новый хэш пароля.
+        """
+        await self.session.execute(
+            update(User)
+            .where(User.id == user_id)
+            .values(hashed_password=hashed_password)
+        )
+        await self.session.commit()
+
     # async def update_user_by_id(self, user_id: int, data: dict) -> Optional[User]:
     #     await self.session.execute(
     #         update(User).where(User.id == user_id).values(**data)
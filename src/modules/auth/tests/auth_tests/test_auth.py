@@ -1,13 +1,17 @@
+import asyncio
 from datetime import datetime
 from types import SimpleNamespace
 from unittest.mock import AsyncMock
 
 import pytest
+from passlib.context import CryptContext
 
 from src.modules.auth.api.v1.schemas import LoginResponseSchema, UserCreateSchema
 from src.modules.auth.api.v1.services.auth_service import AuthService
+from src.modules.auth.api.v1.services.password_hasher import PasswordHasher
 from src.modules.auth.configs.crypt_conf import pwd_context
 from src.shared.configs.get_settings import get_settings
+from src.shared.services.jwt_service import create_refresh_token, decode_token
 
 settings = get_settings()
 
@@ -61,6 +65,70 @@ async def test_login_success(
     mock_redis_service.set.assert_awaited()
 
 
+@pytest.mark.anyio
+async def test_login_rehashes_password_when_context_changes(
+    mock_user_repo, mock_jwt_repo, mock_redis_service
+):
+    old_context = CryptContext(schemes=["bcrypt"], bcrypt__rounds=4)
+    new_context = CryptContext(schemes=["bcrypt"], bcrypt__rounds=5)
+    user = SimpleNamespace(
+        id=3,
+        username="demo",
+        email="demo@example.com",
+        hashed_password=old_context.hash("correct"),
+        is_superuser=False,
+    )
+    mock_user_repo.get_by_fields.return_value = user
+    mock_jwt_repo.create.return_value = SimpleNamespace(expires_at=datetime.utcnow())
+    service = AuthService(
+        user_repo=mock_user_repo,
+        jwt_repo=mock_jwt_repo,
+        redis_service=mock_redis_service,
+        hasher=PasswordHasher(context=new_context, workers=1),
+    )
+
+    await service.login("demo", "correct")
+
+    user_id, new_hash = mock_user_repo.update_password.await_args.args
+    assert user_id == 3
+    assert new_hash.startswith("$2b$05$")
+    assert new_context.verify("correct", new_hash)
+
+
+@pytest.mark.anyio
+async def test_login_reads_user_each_time_and_writes_concurrently(
+    auth_service, mock_user_repo, mock_jwt_repo, mock_redis_service
+):
+    user = SimpleNamespace(
+        id=9,
+        username="cached",
+        email="cached@example.com",
+        hashed_password=pwd_context.hash("correct"),
+        is_superuser=False,
+    )
+    mock_user_repo.get_by_fields.return_value = user
+    mock_jwt_repo.create.return_value = SimpleNamespace(expires_at=datetime.utcnow())
+    started = []
+
+    async def slow_write(*args, **kwargs):
+        started.append(len(started))
+        await asyncio.sleep(0.01)
+        # к этому моменту вторая запись уже начата
+        assert len(started) == 2
+        return SimpleNamespace(expires_at=datetime.utcnow())
+
+    mock_redis_service.set = AsyncMock(side_effect=slow_write)
+    mock_jwt_repo.create = AsyncMock(side_effect=slow_write)
+
+    await auth_service.login("cached", "correct")
+    started.clear()
+    await auth_service.login("cached", "correct")
+
+    # хеш пароля не кэшируется между входами
+    assert mock_user_repo.get_by_fields.await_count == 2
+    assert mock_jwt_repo.create.await_count == 2
+
+
 @pytest.mark.anyio
 async def test_login_wrong_password(auth_service, mock_user_repo):
     user = SimpleNamespace(
@@ -126,9 +194,51 @@ async def test_login_requires_jwt_repo(
     with pytest.raises(RuntimeError, match="JWTRepo is not initialized"):
         await service.login("testuser", "correctpassword")
 
+    # зависимости проверяются до любых записей
+    mock_redis_service.set.assert_not_awaited()
+
+
+@pytest.mark.anyio
+async def test_refresh_rotates_token(auth_service, mock_jwt_repo, mock_redis_service):
+    token = create_refresh_token("7", is_superuser=True)
+    current = SimpleNamespace(id=1, user_id=7, family_id="fam", revoked=False)
+    mock_jwt_repo.get_by_token.return_value = current
+    mock_jwt_repo.rotate.return_value = SimpleNamespace(expires_at=datetime.utcnow())
+
+    result = await auth_service.refresh(token)
+
+    mock_jwt_repo.get_by_token.assert_awaited_once_with(token)
+    rotated_from, new_refresh = mock_jwt_repo.rotate.await_args.args
+    assert rotated_from is current
+    assert new_refresh == result.refresh_token != token
+    assert decode_token(result.access_token)["is_superuser"] is True
     mock_redis_service.set.assert_awaited_once()
 
 
+@pytest.mark.anyio
+async def test_refresh_reuse_revokes_family(auth_service, mock_jwt_repo):
+    token = create_refresh_token("7")
+    mock_jwt_repo.get_by_token.return_value = SimpleNamespace(
+        id=1, user_id=7, family_id="fam", revoked=True
+    )
+
+    with pytest.raises(ValueError, match="revoked"):
+        await auth_service.refresh(token)
+
+    mock_jwt_repo.revoke_family.assert_awaited_once_with("fam")
+    mock_jwt_repo.rotate.assert_not_awaited()
+
+
+@pytest.mark.anyio
+async def test_refresh_unknown_or_invalid_token(auth_service, mock_jwt_repo):
+    mock_jwt_repo.get_by_token.return_value = None
+
+    with pytest.raises(ValueError, match="Invalid refresh token"):
+        await auth_service.refresh(create_refresh_token("7"))
+    with pytest.raises(ValueError, match="Invalid refresh token"):
+        await auth_service.refresh("not.a.jwt")
+
+
 @pytest.mark.anyio
 async def test_register_user_success(auth_service, mock_user_repo):
     mock_user_repo.exists_by_fields.return_value = False
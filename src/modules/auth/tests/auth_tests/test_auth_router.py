@@ -1,7 +1,15 @@
+from unittest.mock import AsyncMock
+
 import pytest
 from fastapi import status
 
-from src.modules.auth.api.v1.schemas import LoginResponseSchema, UserOutSchema
+from src.modules.auth.api.v1.schemas import (
+    LoginResponseSchema,
+    TokenPairSchema,
+    UserOutSchema,
+)
+from src.modules.auth.api.v1.services.password_hasher import PasswordHasherBusyError
+from src.shared.services.jwt_service import create_access_token
 
 
 def test_login_endpoint_success(auth_api_client):
@@ -39,6 +47,40 @@ def test_login_endpoint_failure(auth_api_client):
     assert response.json()["detail"] == "boom"
 
 
+def test_login_endpoint_returns_503_when_hasher_saturated(auth_api_client):
+    client, service = auth_api_client
+    service.login.side_effect = PasswordHasherBusyError("busy")
+
+    response = client.post("/auth/login", json={"username": "demo", "password": "x"})
+
+    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert response.headers["Retry-After"] == "1"
+
+
+def test_refresh_endpoint_success(auth_api_client):
+    client, service = auth_api_client
+    service.refresh.return_value = TokenPairSchema(
+        access_token="access",
+        refresh_token="refresh-2",
+        expires_at="2030-01-01T00:00:00",
+    )
+
+    response = client.post("/auth/refresh", json={"refresh_token": "refresh-1"})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["refresh_token"] == "refresh-2"
+    service.refresh.assert_awaited_once_with("refresh-1")
+
+
+def test_refresh_endpoint_rejects_invalid_token(auth_api_client):
+    client, service = auth_api_client
+    service.refresh.side_effect = ValueError("Refresh token has been revoked")
+
+    response = client.post("/auth/refresh", json={"refresh_token": "stale"})
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
 def test_register_endpoint_success(auth_api_client):
     client, service = auth_api_client
     service.register_user.return_value = UserOutSchema(
@@ -90,3 +132,19 @@ def test_register_endpoint_validation_error(auth_api_client, payload):
     response = client.post("/auth/register", json=payload)
 
     assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+def test_logout_revokes_current_token(auth_api_client, monkeypatch):
+    client, _ = auth_api_client
+    revoke = AsyncMock()
+    monkeypatch.setattr(
+        "src.modules.auth.api.v1.auth_router.token_verifier.revoke", revoke
+    )
+    token = create_access_token("7")
+
+    response = client.post("/auth/logout", headers={"Authorization": f"Bearer {token}"})
+
+    assert response.status_code == status.HTTP_200_OK
+    payload = revoke.await_args.args[0]
+    assert payload["sub"] == "7"
+    assert payload["jti"]
@@ -1,16 +1,24 @@
+import os
 from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from jose import JWTError, jwt
+from sqlalchemy import select, text, update
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 
 from src.modules.auth.api.v1.schemas import JWTCreateSchema
 from src.modules.auth.repositories.jwt_repo import JWTRepo
 from src.shared.configs.get_settings import get_settings
+from src.shared.db.models.auth import RefreshToken, User
 from src.shared.services.jwt_service import (
     create_access_token,
     create_refresh_token,
     create_token,
     decode_token,
+    token_digest,
 )
 
 settings = get_settings()
@@ -18,17 +26,170 @@ settings = get_settings()
 
 @pytest.mark.anyio
 async def test_jwt_repo_create_persists_token(async_mock_session):
+    row = object()
+    async_mock_session.execute.return_value = MagicMock(
+        scalar_one=MagicMock(return_value=row)
+    )
     repo = JWTRepo(session=async_mock_session)
     schema = JWTCreateSchema(user_id=1, token="mock_token")
 
     result = await repo.create(schema)
 
-    async_mock_session.add.assert_called_once_with(result)
+    assert result is row
     async_mock_session.commit.assert_awaited_once()
-    async_mock_session.refresh.assert_awaited_once_with(result)
-    assert result.user_id == 1
-    assert result.token == "mock_token"
-    assert result.expires_at.tzinfo is None
+    async_mock_session.refresh.assert_not_awaited()
+    stmt = async_mock_session.execute.await_args.args[0]
+    params = stmt.compile().params
+    assert "RETURNING" in str(stmt)
+    assert params["user_id"] == 1
+    assert params["token_hash"] == token_digest("mock_token")
+    assert len(params["family_id"]) == 32
+    assert params["expires_at"].tzinfo is None
+
+
+@pytest.mark.anyio
+async def test_jwt_repo_rotate_keeps_family(async_mock_session):
+    row = object()
+    async_mock_session.execute.side_effect = [
+        MagicMock(rowcount=1),
+        MagicMock(scalar_one=MagicMock(return_value=row)),
+    ]
+    repo = JWTRepo(session=async_mock_session)
+    current = SimpleNamespace(id=5, user_id=1, family_id="f" * 32)
+
+    result = await repo.rotate(current, "next_token")
+
+    assert result is row
+    async_mock_session.commit.assert_awaited_once()
+    params = async_mock_session.execute.await_args.args[0].compile().params
+    assert params["family_id"] == "f" * 32
+    assert params["token_hash"] == token_digest("next_token")
+
+
+@pytest.mark.anyio
+async def test_jwt_repo_rotate_rejects_already_rotated(async_mock_session):
+    async_mock_session.execute.return_value = MagicMock(rowcount=0)
+    async_mock_session.rollback = AsyncMock()
+    repo = JWTRepo(session=async_mock_session)
+    current = SimpleNamespace(id=5, user_id=1, family_id="f" * 32)
+
+    with pytest.raises(ValueError, match="already used"):
+        await repo.rotate(current, "next_token")
+
+    assert async_mock_session.execute.await_count == 1
+    async_mock_session.rollback.assert_awaited_once()
+
+
+@pytest.mark.anyio
+async def test_jwt_repo_delete_expired_runs_in_batches(async_mock_session):
+    async_mock_session.execute.side_effect = [
+        MagicMock(rowcount=2),
+        MagicMock(rowcount=2),
+        MagicMock(rowcount=1),
+    ]
+    repo = JWTRepo(session=async_mock_session)
+
+    deleted = await repo.delete_expired(batch_size=2)
+
+    assert deleted == 5
+    assert async_mock_session.execute.await_count == 3
+    assert async_mock_session.commit.await_count == 3
+
+
+@pytest.mark.anyio
+async def test_jwt_repo_revocations_record_revoked_at(async_mock_session):
+    async_mock_session.execute.side_effect = [
+        MagicMock(rowcount=1),
+        MagicMock(scalar_one=MagicMock(return_value=object())),
+        MagicMock(rowcount=0),
+    ]
+    repo = JWTRepo(session=async_mock_session)
+    await repo.rotate(SimpleNamespace(id=5, user_id=1, family_id="f" * 32), "t")
+    await repo.revoke_family("f" * 32)
+
+    calls = async_mock_session.execute.await_args_list
+    for call in (calls[0], calls[2]):
+        params = call.args[0].compile().params
+        assert params["revoked"] is True
+        assert isinstance(params["revoked_at"], datetime)
+
+
+@pytest.mark.anyio
+async def test_jwt_repo_delete_expired_keeps_revoked_by_revocation_time(
+    async_mock_session,
+):
+    async_mock_session.execute.return_value = MagicMock(rowcount=0)
+
+    await JWTRepo(session=async_mock_session).delete_expired()
+
+    stmt = async_mock_session.execute.await_args.args[0]
+    sql = str(
+        stmt.compile(
+            dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+        )
+    )
+    assert "refresh_tokens.revoked_at <" in sql
+    assert "created_at" not in sql
+
+
+@pytest.mark.skipif(
+    not os.getenv("TEST_DATABASE_URL"), reason="TEST_DATABASE_URL is not set"
+)
+@pytest.mark.anyio
+async def test_sweep_keeps_old_token_revoked_just_now():
+    schema = "test_refresh_sweep"
+    engine = create_async_engine(
+        os.environ["TEST_DATABASE_URL"],
+        connect_args={"server_settings": {"search_path": schema}},
+    )
+    tables = [User.__table__, RefreshToken.__table__]
+    try:
+        async with engine.begin() as conn:
+            await conn.execute(text(f"DROP SCHEMA IF EXISTS {schema} CASCADE"))
+            await conn.execute(text(f"CREATE SCHEMA {schema}"))
+            await conn.run_sync(
+                lambda sync: User.metadata.create_all(sync, tables=tables)
+            )
+            await conn.execute(
+                text(
+                    "INSERT INTO users (id, username, email, hashed_password, "
+                    "is_active, is_superuser, created_at) "
+                    "VALUES (1, 'u', 'u@example.com', 'x', true, false, now())"
+                )
+            )
+
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            repo = JWTRepo(session)
+            stolen = await repo.create(JWTCreateSchema(user_id=1, token="stolen"))
+            old_revoked = await repo.create(JWTCreateSchema(user_id=1, token="old"))
+            long_ago = datetime.utcnow() - timedelta(days=3)
+            # выпущен давно (но ещё не истёк) и ротирован только что
+            await session.execute(
+                update(RefreshToken)
+                .where(RefreshToken.id == stolen.id)
+                .values(created_at=long_ago)
+            )
+            # отозван давно — срок хранения вышел
+            await session.execute(
+                update(RefreshToken)
+                .where(RefreshToken.id == old_revoked.id)
+                .values(created_at=long_ago, revoked=True, revoked_at=long_ago)
+            )
+            await session.commit()
+            await repo.rotate(stolen, "fresh")
+
+            deleted = await repo.delete_expired(revoked_retention=timedelta(hours=1))
+            left = set(
+                await session.scalars(select(RefreshToken.id).order_by(RefreshToken.id))
+            )
+
+        assert deleted == 1
+        assert stolen.id in left
+        assert old_revoked.id not in left
+    finally:
+        async with engine.begin() as conn:
+            await conn.execute(text(f"DROP SCHEMA IF EXISTS {schema} CASCADE"))
+        await engine.dispose()
 
 
 def test_create_token_contains_exp_and_sub(monkeypatch):
@@ -0,0 +1,61 @@
+import asyncio
+import threading
+
+import pytest
+from passlib.context import CryptContext
+
+from src.modules.auth.api.v1.services.password_hasher import (
+    PasswordHasher,
+    PasswordHasherBusyError,
+)
+
+
+class BlockingContext:
+    """Контекст, «хеширующий» до сигнала, чтобы занять пул."""
+
+    def __init__(self):
+        self.release = threading.Event()
+
+    def hash(self, password):
+        self.release.wait(5)
+        return f"hashed:{password}"
+
+
+@pytest.mark.anyio
+async def test_hash_runs_in_executor_and_verifies():
+    hasher = PasswordHasher(
+        context=CryptContext(schemes=["bcrypt"], bcrypt__rounds=4), workers=2
+    )
+    try:
+        hashed = await hasher.hash("secret")
+
+        assert await hasher.verify_and_update("secret", hashed) == (True, None)
+        assert (await hasher.verify_and_update("wrong", hashed))[0] is False
+    finally:
+        hasher.shutdown()
+
+
+@pytest.mark.anyio
+async def test_saturated_pool_rejects_with_busy_error():
+    context = BlockingContext()
+    hasher = PasswordHasher(context=context, workers=1, max_queue=1)  # type: ignore[arg-type]
+    try:
+        running = [asyncio.create_task(hasher.hash(str(i))) for i in range(2)]
+        await asyncio.sleep(0.05)
+
+        assert hasher.stats() == {
+            "workers": 1,
+            "in_flight": 1,
+            "queued": 1,
+            "rejected": 0,
+        }
+        with pytest.raises(PasswordHasherBusyError):
+            await hasher.hash("overflow")
+        assert hasher.stats()["rejected"] == 1
+
+        context.release.set()
+        assert await asyncio.gather(*running) == ["hashed:0", "hashed:1"]
+        assert hasher.stats()["in_flight"] == 0
+    finally:
+        context.release.set()
+        hasher.shutdown()
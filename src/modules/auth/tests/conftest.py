@@ -101,6 +101,7 @@ def mock_user_repo():
     repo.list = AsyncMock()
     repo.update = AsyncMock()
     repo.delete = AsyncMock()
+    repo.update_password = AsyncMock()
     return repo
 
 
@@ -108,6 +109,10 @@ def mock_user_repo():
 def mock_jwt_repo():
     repo = MagicMock(spec=JWTRepo)
     repo.create = AsyncMock()
+    repo.get_by_token = AsyncMock()
+    repo.rotate = AsyncMock()
+    repo.revoke_family = AsyncMock()
+    repo.delete_expired = AsyncMock()
     return repo
 
 
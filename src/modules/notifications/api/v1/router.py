@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 
 from src.modules.notifications.api.v1.get_service import (
     get_notification_service,
@@ -15,6 +15,8 @@ from src.modules.notifications.types.notifications_types_registry import (
     NOTIFY_REGISTRY,
 )
 from src.shared.deps.auth_dependencies import get_user_id
+from src.shared.deps.pagination import PageParams, get_page_params, page_response
+from src.shared.services.static_catalog import StaticCatalog
 
 v1_notification_router = APIRouter(
     prefix="/notification",
@@ -22,6 +24,12 @@ v1_notification_router = APIRouter(
     # dependencies=[Depends(authenticate_user)]
 )
 
+notify_types_catalog = StaticCatalog(
+    lambda: [
+        {"name": name, **notify.describe()} for name, notify in NOTIFY_REGISTRY.items()
+    ]
+)
+
 
 @v1_notification_router.get(
     "/list_types",
@@ -29,10 +37,8 @@ v1_notification_router = APIRouter(
     summary="Список доступных типов уведомлений",
     description="Возвращает список всех зарегистрированных типов уведомлений и схемы параметров для каждого.",
 )
-async def list_notify_types():
-    return [
-        {"name": name, **notify.describe()} for name, notify in NOTIFY_REGISTRY.items()
-    ]
+async def list_notify_types(request: Request):
+    return notify_types_catalog.response(request)
 
 
 @v1_notification_router.post(
@@ -70,13 +76,20 @@ async def get_notification(
     "/",
     response_model=list[NotificationOut],
     summary="Получение notification",
-    description="Возвращает notification по ID. Возвращает ошибку 404, если не найден.",
+    description="Возвращает страницу notification пользователя в порядке ID. "
+    "Курсор следующей страницы — в заголовке `X-Next-Cursor`; "
+    "`fields` ограничивает набор возвращаемых полей.",
 )
 async def list_notification(
+    response: Response,
+    page: PageParams = Depends(get_page_params(NotificationOut)),
     service: CRUDNotificationService = Depends(get_notification_service),
     user_id: int = Depends(get_user_id),
 ):
-    return await service.list(user_id=user_id)
+    items, next_cursor = await service.list_page(
+        user_id, page.cursor, page.limit, page.fields
+    )
+    return page_response(response, items, next_cursor, page)
 
 
 @v1_notification_router.put(
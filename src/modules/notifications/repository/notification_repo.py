@@ -1,9 +1,38 @@
+from collections.abc import Iterable
+
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.shared.base_repo import BaseRepository
-from src.shared.db.models.notifications import Notifications
+from src.shared.db.models.notifications import Notifications, NotificationsTypes
 
 
 class NotificationRepo(BaseRepository[Notifications]):
     def __init__(self, session: AsyncSession):
         super().__init__(session, Notifications)
+
+    async def list_targets(
+        self, notification_ids: Iterable[int]
+    ) -> list[tuple[int, str, dict]]:
+        """
+        Получить активные уведомления с именем типа для доставки.
+
+        Args:
+            notification_ids (Iterable[int]): ID уведомлений.
+
+        Returns:
+            list[tuple[int, str, dict]]: (id, имя типа, config).
+        """
+        ids = list(notification_ids)
+        if not ids:
+            return []
+        stmt = (
+            select(Notifications.id, NotificationsTypes.name, Notifications.config)
+            .join(
+                NotificationsTypes,
+                NotificationsTypes.id == Notifications.notification_type_id,
+            )
+            .where(Notifications.is_active, Notifications.id.in_(ids))
+        )
+        result = await self.session.execute(stmt)
+        return [tuple(row) for row in result.all()]  # type: ignore[misc]
@@ -0,0 +1,170 @@
+import logging
+from collections import defaultdict
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from src.modules.notifications.repository.notification_repo import NotificationRepo
+from src.modules.notifications.types.base_type_notify_class import (
+    BaseTypeNotificationClass,
+)
+from src.modules.notifications.types.notifications_types_registry import (
+    NOTIFY_REGISTRY,
+)
+from src.modules.rules.repository.rules_repo import RulesRepo
+from src.shared.configs.get_settings import get_settings
+
+notify_logger = logging.getLogger("app_log")
+errors_logger = logging.getLogger("errors_log")
+
+# Канал -> задача Celery. Маршрутизация по очередям задана в celery_conf.task_routes
+CHANNEL_TASKS = {
+    "email": "src.shared.celery_module.tasks.notify_email",
+    "tg": "src.shared.celery_module.tasks.notify_tg",
+    "sms": "src.shared.celery_module.tasks.notify_sms",
+    "default": "src.shared.celery_module.tasks.notify_default",
+}
+
+
+def _celery_send_task(name: str, args: list) -> None:
+    from src.shared.celery_module.celery_worker import celery_app
+
+    celery_app.send_task(name, args=args)
+
+
+class NotificationDispatcher:
+    """
+    Раздача сработавших триггеров по каналам уведомлений.
+
+    Все срабатывания тика превращаются в пары (notification_id, payload),
+    группируются по каналу и получателю и отправляются пачками: одна задача
+    notify_<channel> на `batch_size` пар, а не задача на каждое уведомление.
+    """
+
+    def __init__(
+        self,
+        rules_repo: RulesRepo,
+        notification_repo: NotificationRepo,
+        send_task: Callable[[str, list], Any] = _celery_send_task,
+        registry: dict[str, BaseTypeNotificationClass] | None = None,
+        batch_size: int | None = None,
+    ):
+        """
+        Args:
+            rules_repo (RulesRepo): Репозиторий правил (trigger -> уведомления).
+            notification_repo (NotificationRepo): Репозиторий уведомлений.
+            send_task (Callable): Постановка задачи Celery (имя, args).
+            registry (dict | None): Реестр типов уведомлений.
+            batch_size (int | None): Максимум пар в одной задаче.
+        """
+        self.rules_repo = rules_repo
+        self.notification_repo = notification_repo
+        self.send_task = send_task
+        self.registry = NOTIFY_REGISTRY if registry is None else registry
+        self.batch_size = batch_size or get_settings().notify_batch_size
+
+    async def dispatch(self, fired: Iterable[Any]) -> int:
+        """
+        Поставить доставку уведомлений для сработавших триггеров.
+
+        Args:
+            fired (Iterable[FiredTrigger]): Объекты с trigger_id и payload.
+
+        Returns:
+            int: Количество поставленных задач.
+        """
+        fired = list(fired)
+        by_trigger = await self.rules_repo.notification_ids_by_trigger(
+            {f.trigger_id for f in fired}
+        )
+        pairs = [
+            (notification_id, f.payload)
+            for f in fired
+            for notification_id in by_trigger.get(f.trigger_id, [])
+        ]
+        if not pairs:
+            return 0
+
+        targets = await self.notification_repo.list_targets({nid for nid, _ in pairs})
+        route: dict[int, tuple[str, str]] = {}
+        for notification_id, type_name, config in targets:
+            notify = self.registry.get(type_name)
+            if notify is None:
+                errors_logger.error(f"Unknown notification type {type_name}")
+                continue
+            route[notification_id] = (notify.channel, notify.recipient(config))
+
+        by_channel: dict[str, dict[str, list]] = defaultdict(lambda: defaultdict(list))
+        for notification_id, payload in pairs:
+            if notification_id in route:
+                channel, recipient = route[notification_id]
+                by_channel[channel][recipient].append([notification_id, payload])
+
+        sent = 0
+        for channel, by_recipient in by_channel.items():
+            task_name = CHANNEL_TASKS.get(channel, CHANNEL_TASKS["default"])
+            for batch in self._batches(by_recipient.values()):
+                self.send_task(task_name, [batch])
+                sent += 1
+        notify_logger.info(f"Dispatched {len(pairs)} notifications in {sent} tasks")
+        return sent
+
+    def _batches(self, groups: Iterable[list]) -> Iterable[list]:
+        """Нарезать пачки, не разрывая получателя, если он помещается целиком."""
+        batch: list = []
+        for group in groups:
+            if batch and len(batch) + len(group) > self.batch_size:
+                yield batch
+                batch = []
+            batch.extend(group)
+            while len(batch) >= self.batch_size:
+                yield batch[: self.batch_size]
+                batch = batch[self.batch_size :]
+        if batch:
+            yield batch
+
+
+async def deliver_batch(
+    notification_repo: NotificationRepo,
+    items: list[list],
+    registry: dict[str, BaseTypeNotificationClass] | None = None,
+) -> int:
+    """
+    Доставить пачку (notification_id, payload), объединив события
+    одного получателя в одно сообщение.
+
+    Args:
+        notification_repo (NotificationRepo): Репозиторий уведомлений.
+        items (list[list]): Пары [notification_id, payload].
+        registry (dict | None): Реестр типов уведомлений.
+
+    Returns:
+        int: Количество отправленных сообщений.
+    """
+    registry = NOTIFY_REGISTRY if registry is None else registry
+    targets = {
+        notification_id: (type_name, config)
+        for notification_id, type_name, config in await notification_repo.list_targets(
+            {notification_id for notification_id, _ in items}
+        )
+    }
+
+    digests: dict[tuple[str, str], tuple[dict, list[dict]]] = {}
+    for notification_id, payload in items:
+        target = targets.get(notification_id)
+        if target is None or target[0] not in registry:
+            continue
+        type_name, config = target
+        key = (type_name, registry[type_name].recipient(config))
+        digests.setdefault(key, (config, []))[1].append(payload)
+
+    by_type: dict[str, list[tuple[list[dict], dict]]] = defaultdict(list)
+    for (type_name, _), (config, payloads) in digests.items():
+        by_type[type_name].append((payloads, config))
+
+    sent = 0
+    for type_name, type_digests in by_type.items():
+        try:
+            sent += await registry[type_name].send_digests(type_digests)
+        except Exception as exc:  # noqa: BLE001
+            errors_logger.error(f"Notify {type_name} batch failed: {exc}")
+    return sent
@@ -1,8 +1,26 @@
 from src.modules.notifications.repository.notification_repo import (
     NotificationRepo,
 )
+from src.modules.rules.repository.rules_repo import RulesRepo
 from src.shared.services.base_crud_service import BaseCRUDService
 
 
 class CRUDNotificationService(BaseCRUDService[NotificationRepo]):
-    pass
+    async def delete(self, obj_id: int, user_id=None):
+        """
+        Удалить уведомление владельца.
+
+        Raises:
+            ValueError: Если владелец не указан: без него нельзя пересчитать
+                только его правила. Полная пересборка правил делается явно
+                через `RulesRepo.rebuild_streaming`.
+        """
+        if user_id is None:
+            raise ValueError("user_id is required to delete a notification")
+        return await super().delete(obj_id, user_id)
+
+    async def on_change(self, obj_id: int, obj=None, user_id=None):
+        """Пересчитать правила владельца: в них входят все его уведомления."""
+        # user_id у уведомления обязателен, удаление без владельца отсекается выше
+        owner = obj.user_id if obj is not None else user_id
+        await RulesRepo(self.repo.session).materialize(user_ids=[owner])
@@ -0,0 +1,162 @@
+import asyncio
+from collections.abc import Sequence
+from email.message import EmailMessage
+
+import aiosmtplib
+
+# Ошибки, после которых соединение считается мёртвым
+_RECONNECT_ERRORS = (aiosmtplib.SMTPServerDisconnected, ConnectionError, TimeoutError)
+
+
+class SMTPPool:
+    """
+    Пул авторизованных SMTP-соединений.
+
+    Держит не более `size` соединений, переиспользует их между письмами
+    (STARTTLS и логин выполняются один раз на соединение). Простаивающее
+    соединение перед выдачей проверяется NOOP и пересоздаётся, если сервер
+    его закрыл. Письмо после обрыва не переотправляется: обрыв мог
+    случиться уже после принятого DATA, и письмо ушло бы дважды.
+    """
+
+    def __init__(
+        self,
+        hostname: str,
+        port: int,
+        username: str | None = None,
+        password: str | None = None,
+        size: int = 3,
+        start_tls: bool = True,
+        timeout: float = 30,
+    ):
+        """
+        Args:
+            hostname (str): SMTP-сервер.
+            port (int): Порт SMTP-сервера.
+            username (str | None): Логин.
+            password (str | None): Пароль.
+            size (int): Максимум одновременно открытых соединений.
+            start_tls (bool): Выполнять STARTTLS после подключения.
+            timeout (float): Таймаут операций SMTP.
+        """
+        self.hostname = hostname
+        self.port = port
+        self.username = username
+        self.password = password
+        self.size = size
+        self.start_tls = start_tls
+        self.timeout = timeout
+        self._idle: list[aiosmtplib.SMTP] = []
+        # Живёт столько же, сколько пул: письма, отправляемые во время
+        # close(), возвращают соединения в тот же семафор
+        self._semaphore = asyncio.Semaphore(size)
+
+    def _new_connection(self) -> aiosmtplib.SMTP:
+        return aiosmtplib.SMTP(
+            hostname=self.hostname,
+            port=self.port,
+            username=self.username,
+            password=self.password,
+            start_tls=self.start_tls,
+            timeout=self.timeout,
+        )
+
+    async def _acquire(self) -> aiosmtplib.SMTP:
+        await self._semaphore.acquire()
+        while self._idle:
+            smtp = self._idle.pop()
+            if smtp.is_connected:
+                try:
+                    await smtp.noop()
+                    return smtp
+                except _RECONNECT_ERRORS:
+                    pass
+            smtp.close()
+        smtp = self._new_connection()
+        try:
+            await smtp.connect()
+        except BaseException:
+            self._semaphore.release()
+            raise
+        return smtp
+
+    def _release(self, smtp: aiosmtplib.SMTP, healthy: bool) -> None:
+        if healthy and smtp.is_connected:
+            self._idle.append(smtp)
+        else:
+            smtp.close()
+        self._semaphore.release()
+
+    async def send(self, message: EmailMessage):
+        """
+        Отправить одно письмо через соединение из пула.
+
+        Raises:
+            aiosmtplib.SMTPException: Если письмо не удалось отправить.
+        """
+        smtp = await self._acquire()
+        healthy = False
+        try:
+            result = await smtp.send_message(message)
+            healthy = True
+            return result
+        finally:
+            self._release(smtp, healthy)
+
+    async def send_many(
+        self, messages: Sequence[EmailMessage]
+    ) -> list[Exception | None]:
+        """
+        Отправить пачку писем, распределив её по соединениям пула.
+
+        Args:
+            messages (Sequence[EmailMessage]): Письма.
+
+        Returns:
+            list[Exception | None]: Ошибка для каждого письма (None — успешно),
+                в порядке `messages`.
+        """
+        results: list[Exception | None] = [None] * len(messages)
+        queue: asyncio.Queue[int] = asyncio.Queue()
+        for i in range(len(messages)):
+            queue.put_nowait(i)
+
+        async def worker():
+            smtp = await self._acquire()
+            healthy = True
+            try:
+                while not queue.empty():
+                    i = queue.get_nowait()
+                    try:
+                        await smtp.send_message(messages[i])
+                    except Exception as exc:  # noqa: BLE001
+                        results[i] = exc
+                        if not smtp.is_connected:
+                            healthy = False
+                            break
+            finally:
+                self._release(smtp, healthy)
+
+        workers = min(self.size, len(messages))
+        # Упавший при подключении воркер не отменяет остальных
+        errors = await asyncio.gather(
+            *(worker() for _ in range(workers)), return_exceptions=True
+        )
+        if not queue.empty():
+            # Все соединения недоступны — оставшиеся письма помечаем ошибкой
+            error = next(
+                (e for e in errors if isinstance(e, Exception)),
+                aiosmtplib.SMTPServerDisconnected("SMTP connection lost"),
+            )
+            while not queue.empty():
+                results[queue.get_nowait()] = error
+        return results
+
+    async def close(self) -> None:
+        """Закрыть простаивающие соединения."""
+        while self._idle:
+            smtp = self._idle.pop()
+            try:
+                await smtp.quit()
+            except Exception:  # noqa: BLE001
+                smtp.close()
@@ -0,0 +1,100 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.modules.notifications.services.dispatch_service import (
+    CHANNEL_TASKS,
+    NotificationDispatcher,
+    deliver_batch,
+)
+from src.modules.notifications.types.console import ConsoleNotification
+from src.modules.notifications.types.email_notification import EmailNotification
+
+
+def _fired(trigger_id: int, temp: float):
+    return SimpleNamespace(trigger_id=trigger_id, source_id=1, payload={"temp": temp})
+
+
+@pytest.fixture
+def registry():
+    email = EmailNotification()
+    email.send_digests = AsyncMock(side_effect=lambda digests: len(digests))
+    console = ConsoleNotification()
+    console.send = AsyncMock()
+    return {"email": email, "console": console}
+
+
+@pytest.fixture
+def notification_repo():
+    repo = MagicMock()
+    repo.list_targets = AsyncMock(
+        return_value=[
+            (1, "email", {"email": "a@test.com"}),
+            (2, "email", {"email": "A@test.com "}),
+            (3, "console", {}),
+            (4, "unknown", {}),
+        ]
+    )
+    return repo
+
+
+@pytest.mark.anyio
+async def test_dispatch_groups_by_channel_into_few_tasks(registry, notification_repo):
+    rules_repo = MagicMock()
+    rules_repo.notification_ids_by_trigger = AsyncMock(
+        return_value={10: [1, 3], 11: [2, 4]}
+    )
+    send_task = MagicMock()
+    dispatcher = NotificationDispatcher(
+        rules_repo, notification_repo, send_task=send_task, registry=registry
+    )
+
+    sent = await dispatcher.dispatch([_fired(10, 30), _fired(11, 31), _fired(12, 1)])
+
+    assert sent == 2
+    calls = {c.args[0]: c.args[1][0] for c in send_task.call_args_list}
+    assert calls[CHANNEL_TASKS["email"]] == [[1, {"temp": 30}], [2, {"temp": 31}]]
+    assert calls[CHANNEL_TASKS["default"]] == [[3, {"temp": 30}]]
+
+
+@pytest.mark.anyio
+async def test_dispatch_keeps_recipient_in_one_batch(registry, notification_repo):
+    rules_repo = MagicMock()
+    rules_repo.notification_ids_by_trigger = AsyncMock(
+        return_value={i: [1 if i < 3 else 3] for i in range(5)}
+    )
+    send_task = MagicMock()
+    dispatcher = NotificationDispatcher(
+        rules_repo, notification_repo, send_task, registry, batch_size=3
+    )
+
+    await dispatcher.dispatch([_fired(i, i) for i in range(5)])
+
+    batches = [c.args[1][0] for c in send_task.call_args_list]
+    assert [[nid for nid, _ in batch] for batch in batches] == [[1, 1, 1], [3, 3]]
+
+
+@pytest.mark.anyio
+async def test_dispatch_without_rules_sends_nothing(registry, notification_repo):
+    rules_repo = MagicMock()
+    rules_repo.notification_ids_by_trigger = AsyncMock(return_value={})
+    send_task = MagicMock()
+    dispatcher = NotificationDispatcher(rules_repo, notification_repo, send_task)
+
+    assert await dispatcher.dispatch([_fired(1, 1)]) == 0
+    send_task.assert_not_called()
+    notification_repo.list_targets.assert_not_awaited()
+
+
+@pytest.mark.anyio
+async def test_deliver_batch_coalesces_per_recipient(registry, notification_repo):
+    items = [[1, {"temp": 1}], [2, {"temp": 2}], [1, {"temp": 3}], [3, {"temp": 4}]]
+
+    sent = await deliver_batch(notification_repo, items, registry)
+
+    assert sent == 2
+    registry["email"].send_digests.assert_awaited_once_with(
+        [([{"temp": 1}, {"temp": 2}, {"temp": 3}], {"email": "a@test.com"})]
+    )
+    registry["console"].send.assert_awaited_once_with({"temp": 4}, {})
@@ -0,0 +1,128 @@
+from email.message import EmailMessage
+
+import aiosmtplib
+import pytest
+
+from src.modules.notifications.services.smtp_pool import SMTPPool
+
+
+class FakeSMTP:
+    def __init__(self, created: list, fail_first: int = 0):
+        self.is_connected = False
+        self.connects = 0
+        self.sent: list[str] = []
+        self.fail_first = fail_first
+        self.closes = 0
+        # сервер закрыл простаивающее соединение; клиент узнает об этом на NOOP
+        self.dropped = False
+        created.append(self)
+
+    async def connect(self):
+        self.connects += 1
+        self.is_connected = True
+
+    def close(self):
+        self.closes += 1
+        self.is_connected = False
+
+    async def noop(self):
+        if self.dropped:
+            raise aiosmtplib.SMTPServerDisconnected("closed")
+        return 250, "OK"
+
+    async def quit(self):
+        self.is_connected = False
+
+    async def send_message(self, message):
+        if self.fail_first:
+            self.fail_first -= 1
+            self.is_connected = False
+            raise aiosmtplib.SMTPServerDisconnected("closed")
+        if message["To"] == "bad@test.com":
+            raise aiosmtplib.SMTPRecipientsRefused([])
+        self.sent.append(message["To"])
+        return {}, "OK"
+
+
+def _message(to: str) -> EmailMessage:
+    message = EmailMessage()
+    message["To"] = to
+    message.set_content("x")
+    return message
+
+
+def _pool(monkeypatch, size: int = 2, fail_first: int = 0):
+    created: list[FakeSMTP] = []
+    pool = SMTPPool("smtp.test", 587, size=size)
+    monkeypatch.setattr(pool, "_new_connection", lambda: FakeSMTP(created, fail_first))
+    return pool, created
+
+
+@pytest.mark.anyio
+async def test_send_reuses_connection(monkeypatch):
+    pool, created = _pool(monkeypatch)
+
+    await pool.send(_message("a@test.com"))
+    await pool.send(_message("b@test.com"))
+
+    assert len(created) == 1
+    assert created[0].connects == 1
+    assert created[0].sent == ["a@test.com", "b@test.com"]
+
+
+@pytest.mark.anyio
+async def test_dropped_idle_connection_is_closed_and_replaced(monkeypatch):
+    pool, created = _pool(monkeypatch)
+    await pool.send(_message("a@test.com"))
+    created[0].dropped = True
+
+    await pool.send(_message("b@test.com"))
+
+    assert len(created) == 2
+    assert created[0].closes == 1
+    assert created[0].sent == ["a@test.com"]
+    assert created[1].sent == ["b@test.com"]
+
+
+@pytest.mark.anyio
+async def test_disconnect_during_send_is_not_resent(monkeypatch):
+    pool, created = _pool(monkeypatch, fail_first=1)
+
+    with pytest.raises(aiosmtplib.SMTPServerDisconnected):
+        await pool.send(_message("a@test.com"))
+
+    # сервер мог принять DATA до обрыва — повтор дал бы дубль письма
+    assert created[0].connects == 1
+    assert created[0].sent == []
+
+
+@pytest.mark.anyio
+async def test_send_many_keeps_order_and_captures_errors(monkeypatch):
+    pool, created = _pool(monkeypatch, size=2)
+    recipients = ["a@test.com", "bad@test.com", "c@test.com", "d@test.com"]
+
+    results = await pool.send_many([_message(r) for r in recipients])
+
+    assert results[0] is None and results[2] is None and results[3] is None
+    assert isinstance(results[1], aiosmtplib.SMTPRecipientsRefused)
+    assert len(created) <= 2
+    assert sorted(r for smtp in created for r in smtp.sent) == [
+        "a@test.com",
+        "c@test.com",
+        "d@test.com",
+    ]
+
+    await pool.close()
+    assert not any(smtp.is_connected for smtp in created)
+
+
+@pytest.mark.anyio
+async def test_send_finishing_after_close_releases_its_connection(monkeypatch):
+    pool, created = _pool(monkeypatch, size=1)
+    smtp = await pool._acquire()
+
+    await pool.close()
+    pool._release(smtp, healthy=True)
+
+    await pool.send(_message("a@test.com"))
+    assert created[0].sent == ["a@test.com"]
@@ -1,7 +1,11 @@
+import json
 from abc import ABC, abstractmethod
 
 
 class BaseTypeNotificationClass(ABC):
+    # Канал доставки: определяет очередь Celery (notify_<channel>)
+    channel: str = "default"
+
     @abstractmethod
     async def send(self, payload: dict, config: dict): ...
 
@@ -9,6 +13,45 @@ class BaseTypeNotificationClass(ABC):
     @abstractmethod
     def describe(cls) -> dict: ...
 
+    def recipient(self, config: dict) -> str:
+        """Ключ получателя, по которому события объединяются в одно сообщение."""
+        return json.dumps(config, sort_keys=True, default=str)
+
+    @staticmethod
+    def digest_payload(payloads: list[dict]) -> dict:
+        """Свернуть несколько событий в один payload сообщения."""
+        return payloads[0] if len(payloads) == 1 else {"events": payloads}
+
+    async def send_digest(self, payloads: list[dict], config: dict):
+        """
+        Отправить одному получателю несколько событий одним сообщением.
+
+        Args:
+            payloads (list[dict]): Данные сработавших триггеров.
+            config (dict): Конфиг уведомления из БД.
+        """
+        return await self.send(self.digest_payload(payloads), config)
+
+    async def send_digests(self, digests: list[tuple[list[dict], dict]]) -> int:
+        """
+        Отправить пачку дайджестов разным получателям.
+
+        Типы с пулом соединений переопределяют метод для пакетной отправки.
+
+        Args:
+            digests (list[tuple[list[dict], dict]]): Пары (payloads, config).
+
+        Returns:
+            int: Количество отправленных сообщений.
+        """
+        for payloads, config in digests:
+            await self.send_digest(payloads, config)
+        return len(digests)
+
+    async def close(self):
+        """Освободить ресурсы типа (например, пул соединений)."""
+        return None
+
     def __str__(self) -> str:
         return f"{self.__class__.__name__}: {self.describe()}"
 
@@ -1,7 +1,6 @@
 from email.message import EmailMessage
 
-import aiosmtplib
-
+from src.modules.notifications.services.smtp_pool import SMTPPool
 from src.modules.notifications.types.base_type_notify_class import (
     BaseTypeNotificationClass,
 )
@@ -14,14 +13,40 @@ class EmailNotification(BaseTypeNotificationClass):
     """
     Сервис отправки email по SMTP.
     Конфигурация берётся из глобальных настроек приложения (settings).
+    Письма уходят через пул авторизованных SMTP-соединений.
     """
 
+    channel = "email"
+
     def __init__(self):
         self.smtp_host = settings.smtp_host
         self.smtp_port = settings.smtp_port
         self.smtp_user = settings.smtp_username
         self.smtp_pass = settings.smtp_password
         self.from_email = settings.from_email or self.smtp_user
+        self.pool = (
+            SMTPPool(
+                self.smtp_host,
+                self.smtp_port,
+                username=self.smtp_user,
+                password=self.smtp_pass,
+                size=settings.smtp_pool_size,
+                timeout=settings.smtp_timeout,
+            )
+            if self.smtp_host
+            else None
+        )
+
+    def _build_message(self, recipient: str, payload: dict, config: dict):
+        subject = "Оповещение от trigger flow"
+        body = f"{payload}, {config}"
+
+        message = EmailMessage()
+        message["From"] = self.from_email or ""
+        message["To"] = recipient
+        message["Subject"] = subject
+        message.set_content(body)
+        return message
 
     async def send(self, payload: dict, config: dict):
         """
@@ -32,7 +57,7 @@ class EmailNotification(BaseTypeNotificationClass):
                     "email": "user@example.com"
                 }
         """
-        if not self.smtp_host:
+        if self.pool is None:
             print("[!] SMTP host is not configured")
             return
 
@@ -41,28 +66,50 @@ class EmailNotification(BaseTypeNotificationClass):
             print("[!] Email is not specified in config")
             return
 
-        subject = "Оповещение от trigger flow"
-        body = f"{payload}, {config}"
-
-        message = EmailMessage()
-        message["From"] = self.from_email or ""
-        message["To"] = recipient
-        message["Subject"] = subject
-        message.set_content(body)
+        message = self._build_message(recipient, payload, config)
 
         try:
-            await aiosmtplib.send(
-                message,
-                hostname=self.smtp_host,
-                port=self.smtp_port,
-                username=self.smtp_user,
-                password=self.smtp_pass,
-                start_tls=True,
-            )
+            await self.pool.send(message)
             print(f"[+] Email was send: {recipient}")
         except Exception as exc:  # noqa: BLE001
             print(f"[!] Error sending email: {exc}")
 
+    async def send_digests(self, digests: list[tuple[list[dict], dict]]) -> int:
+        """Отправить пачку дайджестов через соединения пула (`SMTPPool.send_many`)."""
+        if self.pool is None:
+            print("[!] SMTP host is not configured")
+            return 0
+
+        recipients = []
+        messages = []
+        for payloads, config in digests:
+            recipient = config.get("email")
+            if not recipient:
+                print("[!] Email is not specified in config")
+                continue
+            recipients.append(recipient)
+            messages.append(
+                self._build_message(recipient, self.digest_payload(payloads), config)
+            )
+
+        sent = 0
+        for recipient, error in zip(
+            recipients, await self.pool.send_many(messages), strict=True
+        ):
+            if error is None:
+                sent += 1
+                print(f"[+] Email was send: {recipient}")
+            else:
+                print(f"[!] Error sending email: {error}")
+        return sent
+
+    async def close(self):
+        if self.pool is not None:
+            await self.pool.close()
+
+    def recipient(self, config: dict) -> str:
+        return (config.get("email") or "").strip().lower()
+
     def describe(self) -> dict:
         return {
             "description": "Отправляет email.",
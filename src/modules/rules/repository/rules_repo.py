@@ -1,11 +1,13 @@
 import asyncio
+from collections.abc import AsyncIterator, Iterable, Sequence
 
 from pydantic import BaseModel
-from sqlalchemy import and_, func, select
+from sqlalchemy import and_, func, literal, select, update
+from sqlalchemy.dialects.postgresql import aggregate_order_by, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.shared.base_repo import BaseRepository
-from src.shared.db import Notifications, Rules, Sources, Triggers, User
+from src.shared.db import Notifications, Rules, Sources, Triggers
 from src.shared.db.session import AsyncSessionLocal
 
 
@@ -17,65 +19,222 @@ class RulesCreateSchema(BaseModel):
     is_active: bool | None = True
 
 
+RULE_COLUMNS = [
+    "user_id",
+    "source_id",
+    "trigger_id",
+    "user_notification_ids",
+    "is_active",
+]
+
+# asyncpg ограничивает запрос 32767 параметрами: 5 колонок * 5000 строк — с запасом
+STREAM_CHUNK_SIZE = 5000
+
+
 class RulesRepo(BaseRepository[Rules]):
     def __init__(self, session: AsyncSession):
         super().__init__(session, Rules)
 
-    async def parce_rules(self) -> list[RulesCreateSchema]:
+    @staticmethod
+    def _on_conflict_update(stmt):
+        return stmt.on_conflict_do_update(
+            constraint="uq_rules_user_source_trigger",
+            set_={
+                "user_notification_ids": stmt.excluded.user_notification_ids,
+                "is_active": stmt.excluded.is_active,
+            },
+        )
+
+    @staticmethod
+    def _rules_select(*conditions):
         """
-        Collect field to rules
+        Активные правила: триггер + его источник + все активные
+        уведомления владельца.
 
         SELECT
-            u.id AS user_id,
-            s.id AS source_id,
+            t.user_id,
+            t.source_id,
             t.id AS trigger_id,
-            array_agg(n.id) AS notification_ids
-        FROM public.users AS u
-        LEFT JOIN public.sources AS s
-            ON s.user_id = u.id AND s.is_active IS TRUE
-        LEFT JOIN public.triggers AS t
-            ON t.user_id = u.id AND t.is_active IS TRUE
-        LEFT JOIN public.notifications AS n
-            ON n.user_id = u.id AND n.is_active IS TRUE
-        GROUP BY u.id, s.id, t.id
+            array_agg(n.id ORDER BY n.id) AS user_notification_ids
+        FROM public.triggers AS t
+        JOIN public.sources AS s
+            ON s.id = t.source_id AND s.user_id = t.user_id AND s.is_active
+        JOIN public.notifications AS n
+            ON n.user_id = t.user_id AND n.is_active
+        WHERE t.is_active
+        GROUP BY t.user_id, t.source_id, t.id
         ;
-
         """
-        stmt = (
+        return (
             select(
-                User.id.label("user_id"),
-                Sources.id.label("source_id"),
+                Triggers.user_id.label("user_id"),
+                Triggers.source_id.label("source_id"),
                 Triggers.id.label("trigger_id"),
-                func.array_agg(Notifications.id).label("user_notification_ids"),
-                # опционально статус правила:
-                # func.bool_and(Notifications.is_active).label("is_active")
+                func.array_agg(
+                    aggregate_order_by(Notifications.id, Notifications.id)
+                ).label("user_notification_ids"),
             )
             .join(
-                Sources, and_(User.id == Sources.user_id, Sources.is_active.is_(True))
-            )
-            .join(
-                Triggers,
-                and_(User.id == Triggers.user_id, Triggers.is_active.is_(True)),
+                Sources,
+                and_(
+                    Sources.id == Triggers.source_id,
+                    Sources.user_id == Triggers.user_id,
+                    Sources.is_active,
+                ),
             )
             .join(
                 Notifications,
                 and_(
-                    User.id == Notifications.user_id, Notifications.is_active.is_(True)
+                    Notifications.user_id == Triggers.user_id,
+                    Notifications.is_active,
                 ),
             )
-            .group_by(User.id, Sources.id, Triggers.id)
+            .where(Triggers.is_active, *conditions)
+            .group_by(Triggers.user_id, Triggers.source_id, Triggers.id)
         )
-        result = await self.session.execute(stmt)
+
+    async def parce_rules(self) -> list[RulesCreateSchema]:
+        """Собрать все активные правила (см. `_rules_select`)."""
+        result = await self.session.execute(self._rules_select())
         rows = result.mappings().all()
         return [RulesCreateSchema(**row) for row in rows]
 
+    async def notification_ids_by_trigger(
+        self, trigger_ids: Iterable[int]
+    ) -> dict[int, list[int]]:
+        """
+        Получить уведомления активных правил для сработавших триггеров.
+
+        ID уведомлений без повторов: если у триггера несколько активных
+        правил, одно срабатывание не доставляется несколько раз.
+
+        Args:
+            trigger_ids (Iterable[int]): ID триггеров.
+
+        Returns:
+            dict[int, list[int]]: trigger_id -> ID уведомлений.
+        """
+        ids = list(trigger_ids)
+        if not ids:
+            return {}
+        stmt = select(Rules.trigger_id, Rules.user_notification_ids).where(
+            Rules.is_active, Rules.trigger_id.in_(ids)
+        )
+        result = await self.session.execute(stmt)
+        by_trigger: dict[int, list[int]] = {}
+        for trigger_id, notification_ids in result.all():
+            by_trigger.setdefault(trigger_id, []).extend(notification_ids or [])
+        return {
+            trigger_id: list(dict.fromkeys(notification_ids))
+            for trigger_id, notification_ids in by_trigger.items()
+        }
+
+    async def materialize(
+        self,
+        *,
+        user_ids: Iterable[int] | None = None,
+        source_ids: Iterable[int] | None = None,
+        trigger_ids: Iterable[int] | None = None,
+    ) -> None:
+        """
+        Инкрементально пересчитать правила, затронутые изменением.
+
+        Правила в области изменения сначала деактивируются, затем актуальные
+        строки вставляются через `INSERT ... ON CONFLICT (user_id, source_id,
+        trigger_id) DO UPDATE`. Правила удалённых или выключенных триггеров,
+        источников и пользователей без активных уведомлений остаются
+        неактивными. Без аргументов пересчитываются все правила.
+
+        Коммит остаётся за вызывающим кодом, чтобы пересчёт попадал в одну
+        транзакцию с изменением, которое его вызвало.
+
+        Args:
+            user_ids (Iterable[int] | None): Пользователи, у которых поменялись
+                уведомления.
+            source_ids (Iterable[int] | None): Изменённые источники.
+            trigger_ids (Iterable[int] | None): Изменённые триггеры.
+        """
+        rule_scope = []
+        trigger_scope = []
+        for ids, rule_col, trigger_col in (
+            (user_ids, Rules.user_id, Triggers.user_id),
+            (source_ids, Rules.source_id, Triggers.source_id),
+            (trigger_ids, Rules.trigger_id, Triggers.id),
+        ):
+            if ids is not None:
+                ids = list(ids)
+                rule_scope.append(rule_col.in_(ids))
+                trigger_scope.append(trigger_col.in_(ids))
+
+        await self.session.execute(
+            update(Rules).where(Rules.is_active, *rule_scope).values(is_active=False)
+        )
+
+        rules = self._rules_select(*trigger_scope).add_columns(
+            literal(True).label("is_active")
+        )
+        stmt = self._on_conflict_update(insert(Rules).from_select(RULE_COLUMNS, rules))
+        await self.session.execute(stmt)
+
+    async def stream_rules(
+        self, chunk_size: int = STREAM_CHUNK_SIZE
+    ) -> AsyncIterator[list[dict]]:
+        """
+        Выдавать активные правила порциями через серверный курсор.
+
+        В отличие от `parce_rules`, в памяти одновременно находится не больше
+        `chunk_size` строк, независимо от размера тенанта.
+
+        Args:
+            chunk_size (int): Размер порции (yield_per).
+
+        Yields:
+            list[dict]: Строки правил с ключами `RULE_COLUMNS` без is_active.
+        """
+        stmt = self._rules_select().execution_options(yield_per=chunk_size)
+        result = await self.session.stream(stmt)
+        async for partition in result.mappings().partitions():
+            yield [dict(row) for row in partition]
+
+    async def upsert_many(self, rows: Sequence[dict]) -> None:
+        """
+        Записать порцию правил одним `INSERT ... ON CONFLICT DO UPDATE`.
+
+        Коммит остаётся за вызывающим кодом.
+        """
+        if not rows:
+            return
+        await self.session.execute(
+            self._on_conflict_update(insert(Rules).values(list(rows)))
+        )
+
+    async def rebuild_streaming(self, chunk_size: int = STREAM_CHUNK_SIZE) -> int:
+        """
+        Полная пересборка правил потоком: чтение серверным курсором и запись
+        порциями в той же транзакции, так что читатели видят либо старый,
+        либо новый набор правил.
+
+        Args:
+            chunk_size (int): Размер порции чтения и записи.
+
+        Returns:
+            int: Количество записанных активных правил.
+        """
+        total = 0
+        await self.session.execute(
+            update(Rules).where(Rules.is_active).values(is_active=False)
+        )
+        async for chunk in self.stream_rules(chunk_size):
+            await self.upsert_many([{**row, "is_active": True} for row in chunk])
+            total += len(chunk)
+        await self.session.commit()
+        return total
+
 
 async def main():
     async with AsyncSessionLocal() as session:
-        repo = RulesRepo(session)
-        result = await repo.parce_rules()
-        print(result)
-        await repo.create_many(result)
+        await RulesRepo(session).materialize()
+        await session.commit()
 
 
 if __name__ == "__main__":
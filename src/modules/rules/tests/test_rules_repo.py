@@ -0,0 +1,163 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.modules.notifications.services.notification_service import (
+    CRUDNotificationService,
+)
+from src.modules.rules.repository.rules_repo import RulesRepo
+from src.modules.trigger.services.trigger_service import TriggerService
+
+
+def _sql(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+@pytest.fixture
+def session():
+    session = AsyncMock()
+    session.execute = AsyncMock()
+    session.commit = AsyncMock()
+    return session
+
+
+@pytest.mark.anyio
+async def test_materialize_scoped_to_trigger(session):
+    await RulesRepo(session).materialize(trigger_ids=[5])
+
+    deactivate, upsert = (
+        _sql(call.args[0]) for call in session.execute.await_args_list
+    )
+    assert deactivate.startswith("UPDATE rules SET is_active")
+    assert "rules.trigger_id IN" in deactivate
+    assert upsert.startswith("INSERT INTO rules")
+    assert "triggers.id IN" in upsert
+    assert "ON CONFLICT ON CONSTRAINT uq_rules_user_source_trigger DO UPDATE" in upsert
+    assert "JOIN sources ON sources.id = triggers.source_id" in upsert
+    assert "array_agg(notifications.id ORDER BY notifications.id)" in upsert
+    # коммитит сервис вместе с изменением, вызвавшим пересчёт
+    session.commit.assert_not_awaited()
+
+
+@pytest.mark.anyio
+async def test_materialize_without_scope_rebuilds_everything(session):
+    await RulesRepo(session).materialize()
+
+    deactivate, upsert = (
+        _sql(call.args[0]) for call in session.execute.await_args_list
+    )
+    assert " IN " not in deactivate
+    assert " IN " not in upsert
+
+
+@pytest.mark.anyio
+async def test_crud_service_materializes_changed_trigger(monkeypatch):
+    materialize = AsyncMock()
+    monkeypatch.setattr(RulesRepo, "materialize", materialize)
+    repo = MagicMock()
+    repo.session.commit = AsyncMock()
+    repo.create = AsyncMock(return_value=SimpleNamespace(id=3, user_id=1))
+    repo.update = AsyncMock(return_value=None)
+    repo.delete = AsyncMock(return_value=True)
+    service = TriggerService(repo, MagicMock())
+
+    await service.create({"user_id": 1}, 1)
+    await service.update(4, {}, 1)
+    await service.delete(5, 1)
+
+    assert [c.kwargs for c in materialize.await_args_list] == [
+        {"trigger_ids": [3]},
+        {"trigger_ids": [5]},
+    ]
+    assert repo.session.commit.await_count == 3
+
+
+@pytest.mark.anyio
+async def test_crud_service_does_not_commit_when_materialize_fails(monkeypatch):
+    monkeypatch.setattr(
+        RulesRepo, "materialize", AsyncMock(side_effect=RuntimeError("db"))
+    )
+    repo = MagicMock()
+    repo.session.commit = AsyncMock()
+    repo.update = AsyncMock(return_value=SimpleNamespace(id=4, user_id=1))
+    service = TriggerService(repo, MagicMock())
+
+    with pytest.raises(RuntimeError):
+        await service.update(4, {"is_active": False}, 1)
+    repo.session.commit.assert_not_awaited()
+
+
+@pytest.mark.anyio
+async def test_notification_change_without_owner_is_not_a_full_rebuild(monkeypatch):
+    materialize = AsyncMock()
+    monkeypatch.setattr(RulesRepo, "materialize", materialize)
+    repo = MagicMock()
+    repo.session.commit = AsyncMock()
+    repo.delete = AsyncMock(return_value=True)
+    service = CRUDNotificationService(repo)
+
+    with pytest.raises(ValueError):
+        await service.delete(5)
+    # отказ до записи: ничего не удалено и не закоммичено
+    repo.delete.assert_not_awaited()
+    materialize.assert_not_awaited()
+    repo.session.commit.assert_not_awaited()
+
+    await service.delete(5, 7)
+    materialize.assert_awaited_once_with(user_ids=[7])
+
+
+@pytest.mark.anyio
+async def test_notification_ids_by_trigger_dedupes_across_active_rules(session):
+    # два активных правила одного триггера (старое — с чужим source_id)
+    session.execute = AsyncMock(
+        return_value=MagicMock(
+            all=MagicMock(return_value=[(5, [1, 2]), (5, [2, 3]), (6, None)])
+        )
+    )
+
+    by_trigger = await RulesRepo(session).notification_ids_by_trigger([5, 6])
+
+    assert by_trigger == {5: [1, 2, 3], 6: []}
+
+
+class _FakeStreamResult:
+    def __init__(self, partitions):
+        self._partitions = partitions
+
+    def mappings(self):
+        return self
+
+    async def partitions(self):
+        for partition in self._partitions:
+            yield partition
+
+
+@pytest.mark.anyio
+async def test_rebuild_streaming_upserts_each_chunk(session):
+    rows = [
+        {"user_id": 1, "source_id": 2, "trigger_id": i, "user_notification_ids": [7]}
+        for i in range(5)
+    ]
+    session.stream = AsyncMock(return_value=_FakeStreamResult([rows[:3], rows[3:]]))
+
+    total = await RulesRepo(session).rebuild_streaming(chunk_size=3)
+
+    assert total == 5
+    stream_stmt = session.stream.await_args.args[0]
+    assert stream_stmt.get_execution_options()["yield_per"] == 3
+    deactivate, first, second = (c.args[0] for c in session.execute.await_args_list)
+    assert _sql(deactivate).startswith("UPDATE rules SET is_active")
+    assert "ON CONFLICT ON CONSTRAINT uq_rules_user_source_trigger" in _sql(first)
+    assert len(first.compile().params) == 3 * 5
+    assert len(second.compile().params) == 2 * 5
+    session.commit.assert_awaited_once()
+
+
+@pytest.mark.anyio
+async def test_upsert_many_skips_empty_chunk(session):
+    await RulesRepo(session).upsert_many([])
+
+    session.execute.assert_not_awaited()
@@ -1,6 +1,6 @@
 import logging
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 
 from src.modules.source.api.v1.get_service import get_data_source_service
 from src.modules.source.api.v1.schemas import (
@@ -16,6 +16,8 @@ from src.modules.source.types.data_source_registry import (
 )
 from src.shared.decorators import log_action
 from src.shared.deps.auth_dependencies import get_user_id
+from src.shared.deps.pagination import PageParams, get_page_params, page_response
+from src.shared.services.static_catalog import StaticCatalog
 
 source_logger = logging.getLogger("source_log")
 
@@ -25,6 +27,13 @@ v1_api_source = APIRouter(
     # dependencies=[Depends(authenticate_user)]
 )
 
+source_types_catalog = StaticCatalog(
+    lambda: [
+        {"id": int(source_id), "name": config["name"], "config": config.get("data", {})}
+        for source_id, config in DATA_SOURCE_REGISTRY.items()
+    ]
+)
+
 
 @v1_api_source.get(
     "/list_types",
@@ -33,11 +42,8 @@ v1_api_source = APIRouter(
     description="Возвращает список всех зарегистрированных АПИ.",
 )
 @log_action("message", logger=source_logger)
-async def list_source_types():
-    return [
-        {"id": int(source_id), "name": config["name"], "config": config.get("data", {})}
-        for source_id, config in DATA_SOURCE_REGISTRY.items()
-    ]
+async def list_source_types(request: Request):
+    return source_types_catalog.response(request)
 
 
 @v1_api_source.post(
@@ -73,10 +79,14 @@ async def get_api_source(
     "/",
     response_model=list[SourceOut],
     summary="Список источников данных",
-    description="Возвращает список всех источников данных. "
-    "Можно указать параметр `user_id` для фильтрации по пользователю.",
+    description="Возвращает страницу источников данных в порядке ID. "
+    "Можно указать параметр `user_id` для фильтрации по пользователю. "
+    "Курсор следующей страницы — в заголовке `X-Next-Cursor`; "
+    "`fields` ограничивает набор возвращаемых полей.",
 )
 async def list_api_sources(
+    response: Response,
+    page: PageParams = Depends(get_page_params(SourceOut)),
     service: CRUDDataSourceService = Depends(get_data_source_service),
     user_id_query: int | None = Query(
         None, description="ID пользователя для фильтрации"
@@ -84,7 +94,10 @@ async def list_api_sources(
     user_id_token: int = Depends(get_user_id),
 ):
     user_id = user_id_query or user_id_token
-    return await service.list(user_id)
+    items, next_cursor = await service.list_page(
+        user_id, page.cursor, page.limit, page.fields
+    )
+    return page_response(response, items, next_cursor, page)
 
 
 @v1_api_source.put(
@@ -98,8 +111,9 @@ async def update_api_source(
     source_id: int,
     data: SourceUpdate,
     service: CRUDDataSourceService = Depends(get_data_source_service),
+    user_id: int = Depends(get_user_id),
 ):
-    updated = await service.update(source_id, data)
+    updated = await service.update(source_id, data, user_id)
     if not updated:
         raise HTTPException(status_code=404, detail="Not found")
     return updated
@@ -112,9 +126,11 @@ async def update_api_source(
     "Возвращает статус успешного удаления.",
 )
 async def delete_api_source(
-    source_id: int, service: CRUDDataSourceService = Depends(get_data_source_service)
+    source_id: int,
+    service: CRUDDataSourceService = Depends(get_data_source_service),
+    user_id: int = Depends(get_user_id),
 ):
-    deleted = await service.delete(source_id)
+    deleted = await service.delete(source_id, user_id)
     if not deleted:
         raise HTTPException(status_code=404, detail="Not found")
     return {"status": "deleted"}
@@ -9,9 +9,8 @@ class DataSourceRepo(BaseRepository[Sources]):
     def __init__(self, session: AsyncSession):
         super().__init__(session, Sources)
 
-    async def list(self, user_id: int | None = None):
-        stmt = select(Sources)
-        if user_id:
-            stmt = stmt.where(Sources.user_id == user_id)
+    async def list_active(self):
+        """Получить все активные источники всех пользователей."""
+        stmt = select(Sources).where(Sources.is_active).order_by(Sources.id)
         result = await self.session.execute(stmt)
         return result.scalars().all()
@@ -1,3 +1,4 @@
+from src.modules.rules.repository.rules_repo import RulesRepo
 from src.modules.source.repository.data_source_repo import DataSourceRepo
 from src.shared.services.base_crud_service import BaseCRUDService
 from src.shared.services.fernet_service import FernetService
@@ -13,3 +14,6 @@ class CRUDDataSourceService(BaseCRUDService[DataSourceRepo]):
             data["config"]["source_key"]
         )
         return await super().create(data, user_id)
+
+    async def on_change(self, obj_id: int, obj=None, user_id=None):
+        await RulesRepo(self.repo.session).materialize(source_ids=[obj_id])
@@ -1,9 +1,31 @@
+import time
 from typing import Any
+from urllib.parse import urlsplit
 
 import httpx
 
+from src.shared.configs.get_settings import get_settings
+from src.shared.services.cache_service import ResponseCache
+from src.shared.services.http_client import SharedHttpClient, shared_http_client
+from src.shared.services.metrics import (
+    upstream_request_duration,
+    upstream_request_errors,
+)
+
+settings = get_settings()
+
 BASE_URL = "https://api.openweathermap.org"
 
+shared_http_client.limit_host(
+    urlsplit(BASE_URL).hostname,  # type: ignore[arg-type]
+    concurrency=settings.openweather_max_concurrency,
+    rate_per_minute=settings.openweather_rate_per_minute,
+    shared=True,
+)
+
+# Ответы не зависят от API-ключа, поэтому кэш общий для всех экземпляров
+weather_cache = ResponseCache("openweather", maxsize=settings.weather_cache_maxsize)
+
 
 class OpenWeatherService:
     """
@@ -11,13 +33,60 @@ class OpenWeatherService:
     Поддерживает: текущую погоду, 5-дневный прогноз, One Call 3.0 и геокодинг.
     """
 
-    def __init__(self, api_key: str):
+    def __init__(
+        self,
+        api_key: str,
+        client: SharedHttpClient | None = None,
+        cache: ResponseCache | None = None,
+        base_url: str = BASE_URL,
+    ):
         """
         Args:
             api_key (str): Ваш API-ключ от OpenWeatherMap.
+            client (SharedHttpClient | None): HTTP-клиент. По умолчанию общий
+                пул процесса с лимитами квоты OpenWeather.
+            cache (ResponseCache | None): Кэш ответов. По умолчанию общий
+                `weather_cache`.
+            base_url (str): Адрес API (для стендов и бенчмарков).
         """
         self.api_key = api_key
-        self.client = httpx.AsyncClient(timeout=10.0)
+        self.client = client or shared_http_client
+        self.cache = cache or weather_cache
+        self.base_url = base_url
+
+    async def _get(self, endpoint: str, path: str, params: dict) -> Any:
+        """
+        GET к API с замером задержки и подсчётом ошибок.
+
+        Args:
+            endpoint (str): Метка запроса в метриках.
+            path (str): Путь относительно `base_url`.
+            params (dict): Query-параметры.
+
+        Returns:
+            Any: Разобранный JSON ответа.
+        """
+        started = time.perf_counter()
+        try:
+            resp = await self.client.get(f"{self.base_url}{path}", params=params)
+            resp.raise_for_status()
+            return resp.json()
+        except httpx.HTTPStatusError as exc:
+            upstream_request_errors.inc(
+                upstream="openweather",
+                endpoint=endpoint,
+                reason=str(exc.response.status_code),
+            )
+            raise
+        except Exception as exc:
+            upstream_request_errors.inc(
+                upstream="openweather", endpoint=endpoint, reason=type(exc).__name__
+            )
+            raise
+        finally:
+            upstream_request_duration.observe(
+                time.perf_counter() - started, upstream="openweather", endpoint=endpoint
+            )
 
     async def get_current_weather(
         self,
@@ -49,9 +118,14 @@ class OpenWeatherService:
         else:
             raise ValueError("Нужно указать city или lat+lon или zip_code")
 
-        resp = await self.client.get(f"{BASE_URL}/data/2.5/weather", params=params)
-        resp.raise_for_status()
-        return resp.json()
+        async def fetch():
+            return await self._get("weather", "/data/2.5/weather", params)
+
+        # base_url в ключе: стенды и бенчмарки не делят записи с боевым API
+        key = f"weather:{self.base_url}:{city}:{lat}:{lon}:{units}:{lang}"
+        return await self.cache.get_or_fetch(
+            key, settings.weather_cache_ttl_seconds, fetch
+        )
 
     async def geocoding_reverse(
         self,
@@ -61,14 +135,24 @@ class OpenWeatherService:
     ) -> list[dict[str, Any]]:
         """
         Обратное геокодирование — по координатам возвращает названия городов.
+        Результат практически не меняется, поэтому кэшируется надолго.
         """
-        resp = await self.client.get(
-            f"{BASE_URL}/geo/1.0/reverse",
-            params={"lat": lat, "lon": lon, "limit": limit, "appid": self.api_key},
+
+        async def fetch():
+            return await self._get(
+                "geo_reverse",
+                "/geo/1.0/reverse",
+                {"lat": lat, "lon": lon, "limit": limit, "appid": self.api_key},
+            )
+
+        return await self.cache.get_or_fetch(
+            f"geo:{self.base_url}:{lat}:{lon}:{limit}",
+            settings.geocoding_cache_ttl_seconds,
+            fetch,
         )
-        resp.raise_for_status()
-        return resp.json()
 
     async def close(self):
-        """Закрыть HTTP-клиент."""
-        await self.client.aclose()
+        """
+        Оставлено для совместимости: общий пул закрывается в lifespan
+        приложения, а не каждым экземпляром сервиса.
+        """
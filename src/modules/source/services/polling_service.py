@@ -0,0 +1,281 @@
+import asyncio
+import logging
+from collections import defaultdict
+from collections.abc import Callable, Iterable
+from typing import Any, NamedTuple
+
+import httpx
+
+from src.modules.source.repository.data_source_repo import DataSourceRepo
+from src.modules.source.services.open_weather_service import OpenWeatherService
+from src.modules.trigger.repository.trigger_repo import TriggerRepo
+from src.modules.trigger.services.evaluation_engine import TriggerEvaluationEngine
+from src.shared.configs.get_settings import get_settings
+from src.shared.db import Sources
+from src.shared.services.fernet_service import FernetService
+
+source_logger = logging.getLogger("source_log")
+errors_logger = logging.getLogger("errors_log")
+
+# Ключ OpenWeather в DATA_SOURCE_REGISTRY
+OPENWEATHER_SOURCE_TYPE_ID = 1
+
+# Ответы провайдера, относящиеся к конкретному API-ключу (неверный,
+# отозванный, превышена квота): с ключом другого источника запрос может пройти
+KEY_ERROR_STATUSES = frozenset({401, 403, 429})
+
+
+class LocationKey(NamedTuple):
+    """Ключ дедупликации: один запрос к провайдеру на каждую локацию."""
+
+    source_type_id: int
+    city: str | None
+    lat: float | None
+    lon: float | None
+    units: str
+
+
+class FiredTrigger(NamedTuple):
+    trigger_id: int
+    source_id: int
+    payload: dict
+
+
+def location_key(source: Sources) -> LocationKey | None:
+    """
+    Построить ключ локации по конфигу источника.
+
+    Returns:
+        LocationKey | None: None, если в конфиге нет ни city, ни lat+lon.
+
+    Raises:
+        TypeError: Если конфиг или city неверного типа.
+        ValueError: Если lat/lon не приводятся к числу.
+    """
+    config = source.config or {}
+    if not isinstance(config, dict):
+        raise TypeError(f"config must be an object, got {type(config).__name__}")
+    units = config.get("units", "metric")
+    if not isinstance(units, str):
+        raise TypeError(f"units must be a string, got {type(units).__name__}")
+    city = config.get("city")
+    if city:
+        if not isinstance(city, str):
+            raise TypeError(f"city must be a string, got {type(city).__name__}")
+        return LocationKey(
+            source.source_type_id, city.strip().lower(), None, None, units
+        )
+    lat, lon = config.get("lat"), config.get("lon")
+    if lat is not None and lon is not None:
+        # ~1 км: соседние координаты одного города дают один запрос
+        return LocationKey(
+            source.source_type_id,
+            None,
+            round(float(lat), 2),
+            round(float(lon), 2),
+            units,
+        )
+    return None
+
+
+def group_sources(sources: Iterable[Sources]) -> dict[LocationKey, list[Sources]]:
+    """
+    Сгруппировать источники по локации.
+
+    Источник с некорректным конфигом пропускается (с записью в errors_log),
+    чтобы он не сорвал тик опроса для остальных.
+    """
+    groups: dict[LocationKey, list[Sources]] = defaultdict(list)
+    for source in sources:
+        try:
+            key = location_key(source)
+        except (TypeError, ValueError) as exc:
+            errors_logger.warning(f"Source {source.id} has invalid config: {exc}")
+            continue
+        if key is None:
+            errors_logger.warning(f"Source {source.id} has no location in config")
+            continue
+        groups[key].append(source)
+    return groups
+
+
+def trigger_payload(weather: dict[str, Any]) -> dict[str, Any]:
+    """Поднять `main` (temp, humidity, ...) на верхний уровень для триггеров."""
+    return {**weather, **weather.get("main", {})}
+
+
+def _log_invalid_trigger(spec, exc: Exception) -> None:
+    errors_logger.error(f"Trigger {spec.trigger_id} skipped: {exc}")
+
+
+# Движки живут в процессе воркера между тиками, чтобы не компилировать
+# неизменившиеся конфиги триггеров заново.
+_ENGINES: dict[LocationKey, TriggerEvaluationEngine] = {}
+
+
+class SourcePollingService:
+    """
+    Опрос источников с дедупликацией по локации.
+
+    За один тик каждая уникальная (тип источника, city/lat-lon, units)
+    запрашивается у провайдера ровно один раз, а ответ раздаётся всем
+    триггерам всех источников этой локации.
+    """
+
+    def __init__(
+        self,
+        source_repo: DataSourceRepo,
+        trigger_repo: TriggerRepo,
+        weather_factory: Callable[[str], OpenWeatherService] = OpenWeatherService,
+        engines: dict[LocationKey, TriggerEvaluationEngine] | None = None,
+    ):
+        """
+        Args:
+            source_repo (DataSourceRepo): Репозиторий источников.
+            trigger_repo (TriggerRepo): Репозиторий триггеров.
+            weather_factory (Callable): Фабрика клиента OpenWeather по API-ключу.
+            engines (dict | None): Кэш движков по локациям.
+
+        Параллелизм и квота запросов к провайдеру ограничиваются лимитами
+        хоста в общем HTTP-клиенте.
+        """
+        self.source_repo = source_repo
+        self.trigger_repo = trigger_repo
+        self.weather_factory = weather_factory
+        self.engines = _ENGINES if engines is None else engines
+        self.settings = get_settings()
+        self._fernet: FernetService | None = None
+
+    async def poll_once(self) -> list[FiredTrigger]:
+        """
+        Выполнить один тик опроса.
+
+        Returns:
+            list[FiredTrigger]: Сработавшие триггеры с payload источника.
+        """
+        sources = [
+            s
+            for s in await self.source_repo.list_active()
+            if s.source_type_id == OPENWEATHER_SOURCE_TYPE_ID
+        ]
+        groups = group_sources(sources)
+
+        specs_by_source = defaultdict(list)
+        for source_id, spec in await self.trigger_repo.list_active_specs(
+            s.id for s in sources
+        ):
+            specs_by_source[source_id].append(spec)
+
+        for stale in set(self.engines) - set(groups):
+            del self.engines[stale]
+
+        clients: dict[str, OpenWeatherService] = {}
+        try:
+            results = await asyncio.gather(
+                *(
+                    self._poll_location(key, group, specs_by_source, clients)
+                    for key, group in groups.items()
+                )
+            )
+        finally:
+            for client in clients.values():
+                await client.close()
+
+        fired = [item for chunk in results for item in chunk]
+        source_logger.info(
+            f"Polled {len(groups)} locations for {len(sources)} sources, "
+            f"fired {len(fired)} triggers"
+        )
+        return fired
+
+    async def _poll_location(
+        self,
+        key: LocationKey,
+        group: list[Sources],
+        specs_by_source: dict[int, list],
+        clients: dict[str, OpenWeatherService],
+    ) -> list[FiredTrigger]:
+        trigger_sources = {
+            spec.trigger_id: source.id
+            for source in group
+            for spec in specs_by_source.get(source.id, [])
+        }
+        if not trigger_sources:
+            return []
+
+        engine = self.engines.setdefault(key, TriggerEvaluationEngine())
+        try:
+            engine.load(
+                (
+                    spec
+                    for source in group
+                    for spec in specs_by_source.get(source.id, [])
+                ),
+                on_error=_log_invalid_trigger,
+            )
+            weather = await self._fetch_weather(key, group, clients)
+            payload = trigger_payload(weather)
+            fired_ids = engine.evaluate(payload)
+        except Exception as exc:  # noqa: BLE001
+            errors_logger.error(f"Polling location {key} failed: {exc}")
+            return []
+
+        return [
+            FiredTrigger(trigger_id, trigger_sources[trigger_id], payload)
+            for trigger_id in fired_ids
+        ]
+
+    async def _fetch_weather(
+        self,
+        key: LocationKey,
+        group: list[Sources],
+        clients: dict[str, OpenWeatherService],
+    ) -> dict[str, Any]:
+        """
+        Запросить погоду локации, перебирая ключи источников группы.
+
+        С общим ключом из настроек делается одна попытка. Без него ключ
+        каждого источника пробуется по очереди, пока ошибка относится к
+        самому ключу (не расшифровался, 401/403/429): чужой отозванный ключ
+        не должен оставлять без данных остальных пользователей локации.
+        Прочие ошибки (сеть, 5xx) пробрасываются сразу.
+
+        Raises:
+            Exception: Ошибка последней попытки.
+        """
+        candidates = group[:1] if self.settings.api_key_openweathermap else group
+        tried: set[str] = set()
+        last_exc: Exception | None = None
+        for source in candidates:
+            try:
+                api_key = self._api_key(source)
+            except Exception as exc:  # noqa: BLE001
+                errors_logger.warning(f"Source {source.id} API key unusable: {exc}")
+                last_exc = exc
+                continue
+            if api_key in tried:
+                continue
+            tried.add(api_key)
+            client = clients.get(api_key)
+            if client is None:
+                client = clients[api_key] = self.weather_factory(api_key)
+            try:
+                return await client.get_current_weather(
+                    city=key.city, lat=key.lat, lon=key.lon, units=key.units
+                )
+            except httpx.HTTPStatusError as exc:
+                if exc.response.status_code not in KEY_ERROR_STATUSES:
+                    raise
+                errors_logger.warning(
+                    f"Source {source.id} API key rejected for {key}: {exc}"
+                )
+                last_exc = exc
+        raise last_exc or LookupError(f"No API key for {key}")
+
+    def _api_key(self, source: Sources) -> str:
+        """Общий ключ из настроек, иначе расшифрованный ключ источника."""
+        if self.settings.api_key_openweathermap:
+            return self.settings.api_key_openweathermap
+        if self._fernet is None:
+            self._fernet = FernetService()
+        return self._fernet.decrypt_str(source.config["source_key"])
@@ -0,0 +1,181 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+
+from src.modules.source.services.polling_service import (
+    LocationKey,
+    SourcePollingService,
+    group_sources,
+)
+from src.modules.trigger.services.evaluation_engine import TriggerSpec
+
+
+def _source(source_id: int, **config):
+    return SimpleNamespace(
+        id=source_id, source_type_id=1, config={"source_key": "enc", **config}
+    )
+
+
+def _spec(trigger_id: int, temp: float, op: str) -> TriggerSpec:
+    return TriggerSpec(trigger_id, "temp_trigger", {"temp": temp, "op": op})
+
+
+class FakeWeather:
+    def __init__(self, temps: dict[str, float]):
+        self.temps = temps
+        self.calls: list[dict] = []
+        self.close = AsyncMock()
+
+    async def get_current_weather(self, **kwargs):
+        self.calls.append(kwargs)
+        return {"main": {"temp": self.temps[kwargs["city"]]}}
+
+
+@pytest.fixture
+def polling(monkeypatch):
+    monkeypatch.setattr(
+        "src.modules.source.services.polling_service.get_settings",
+        lambda: SimpleNamespace(api_key_openweathermap="global-key"),
+    )
+    source_repo = MagicMock()
+    trigger_repo = MagicMock()
+    weather = FakeWeather({"london": 20, "paris": 10})
+    service = SourcePollingService(
+        source_repo, trigger_repo, weather_factory=lambda key: weather, engines={}
+    )
+    return service, source_repo, trigger_repo, weather
+
+
+def test_group_sources_deduplicates_locations():
+    groups = group_sources(
+        [
+            _source(1, city="London"),
+            _source(2, city=" london "),
+            _source(3, city="London", units="imperial"),
+            _source(4, lat=51.5074, lon=-0.1278),
+            _source(5, lat=51.5071, lon=-0.1281),
+            _source(6),
+        ]
+    )
+
+    assert {k: [s.id for s in v] for k, v in groups.items()} == {
+        LocationKey(1, "london", None, None, "metric"): [1, 2],
+        LocationKey(1, "london", None, None, "imperial"): [3],
+        LocationKey(1, None, 51.51, -0.13, "metric"): [4, 5],
+    }
+
+
+def test_group_sources_skips_malformed_configs():
+    groups = group_sources(
+        [
+            _source(1, lat="abc", lon=1),
+            _source(2, city=5),
+            _source(3, city="London", units={"x": 1}),
+            _source(4, city="London"),
+        ]
+    )
+
+    assert {k: [s.id for s in v] for k, v in groups.items()} == {
+        LocationKey(1, "london", None, None, "metric"): [4],
+    }
+
+
+@pytest.mark.anyio
+async def test_poll_once_falls_back_to_next_source_key(monkeypatch):
+    monkeypatch.setattr(
+        "src.modules.source.services.polling_service.get_settings",
+        lambda: SimpleNamespace(api_key_openweathermap=None),
+    )
+    request = httpx.Request("GET", "https://api.openweathermap.org")
+    clients = {}
+
+    def factory(api_key):
+        client = clients[api_key] = FakeWeather({"london": 20})
+        if api_key == "revoked":
+            client.get_current_weather = AsyncMock(
+                side_effect=httpx.HTTPStatusError(
+                    "401", request=request, response=httpx.Response(401)
+                )
+            )
+        return client
+
+    source_repo, trigger_repo = MagicMock(), MagicMock()
+    source_repo.list_active = AsyncMock(
+        return_value=[
+            _source(1, city="London"),
+            _source(2, city="London"),
+            _source(3, city="London"),
+        ]
+    )
+    trigger_repo.list_active_specs = AsyncMock(
+        return_value=[(1, _spec(10, 15, ">")), (3, _spec(30, 15, ">"))]
+    )
+    service = SourcePollingService(
+        source_repo, trigger_repo, weather_factory=factory, engines={}
+    )
+    keys = {1: "revoked", 3: "valid"}
+
+    def api_key(source):
+        if source.id not in keys:
+            raise ValueError("cannot decrypt")
+        return keys[source.id]
+
+    service._api_key = api_key  # type: ignore[method-assign]
+
+    fired = await service.poll_once()
+
+    assert sorted(f.trigger_id for f in fired) == [10, 30]
+    assert set(clients) == {"revoked", "valid"}
+    assert len(clients["valid"].calls) == 1
+
+
+@pytest.mark.anyio
+async def test_poll_once_fetches_each_location_once(polling):
+    service, source_repo, trigger_repo, weather = polling
+    source_repo.list_active = AsyncMock(
+        return_value=[
+            _source(1, city="London"),
+            _source(2, city="London"),
+            _source(3, city="Paris"),
+        ]
+    )
+    trigger_repo.list_active_specs = AsyncMock(
+        return_value=[
+            (1, _spec(10, 15, ">")),
+            (2, _spec(20, 25, ">")),
+            (2, _spec(21, 25, "<")),
+            (3, _spec(30, 5, ">")),
+        ]
+    )
+
+    fired = await service.poll_once()
+
+    assert sorted(call["city"] for call in weather.calls) == ["london", "paris"]
+    assert sorted((f.trigger_id, f.source_id) for f in fired) == [
+        (10, 1),
+        (21, 2),
+        (30, 3),
+    ]
+    assert fired[0].payload["temp"] in (20, 10)
+    weather.close.assert_awaited_once()
+
+
+@pytest.mark.anyio
+async def test_poll_once_skips_invalid_trigger_and_failed_location(polling):
+    service, source_repo, trigger_repo, weather = polling
+    source_repo.list_active = AsyncMock(
+        return_value=[_source(1, city="London"), _source(2, city="Berlin")]
+    )
+    trigger_repo.list_active_specs = AsyncMock(
+        return_value=[
+            (1, _spec(10, 15, ">")),
+            (1, TriggerSpec(11, "temp_trigger", {"temp": 1, "op": "!"})),
+            (2, _spec(20, 15, ">")),
+        ]
+    )
+
+    fired = await service.poll_once()
+
+    assert [f.trigger_id for f in fired] == [10]
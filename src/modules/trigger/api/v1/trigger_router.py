@@ -1,7 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 
 from src.modules.trigger.api.v1.get_service import get_trigger_service
 from src.modules.trigger.api.v1.trigger_schemas import (
+    BulkTriggerCreate,
+    BulkTriggerCreateOut,
+    BulkTriggerDelete,
+    BulkTriggerDeleteOut,
+    BulkTriggerUpdate,
+    BulkTriggerUpdateOut,
     TriggerCreate,
     TriggerOut,
     TriggerUpdate,
@@ -9,6 +15,8 @@ from src.modules.trigger.api.v1.trigger_schemas import (
 from src.modules.trigger.services.trigger_service import TriggerService
 from src.modules.trigger.types.trigger_registry import TRIGGER_REGISTRY
 from src.shared.deps.auth_dependencies import get_user_id
+from src.shared.deps.pagination import PageParams, get_page_params, page_response
+from src.shared.services.static_catalog import StaticCatalog
 
 v1_trigger_router = APIRouter(
     prefix="/trigger",
@@ -16,6 +24,13 @@ v1_trigger_router = APIRouter(
     # dependencies=[Depends(authenticate_user)]
 )
 
+trigger_types_catalog = StaticCatalog(
+    lambda: [
+        {"name": name, "trigger_params": trigger.describe()}
+        for name, trigger in TRIGGER_REGISTRY.items()
+    ]
+)
+
 
 @v1_trigger_router.get(
     "/list_types",
@@ -23,22 +38,63 @@ v1_trigger_router = APIRouter(
     summary="Список доступных типов триггеров",
     description="Возвращает список всех зарегистрированных типов триггеров и схемы параметров для каждого.",
 )
-async def list_trigger_types():
-    return [
-        {"name": name, "trigger_params": trigger.describe()}
-        for name, trigger in TRIGGER_REGISTRY.items()
-    ]
+async def list_trigger_types(request: Request):
+    return trigger_types_catalog.response(request)
+
+
+@v1_trigger_router.post(
+    "/bulk-create",
+    response_model=BulkTriggerCreateOut,
+    summary="Создание триггеров с уведомлениями",
+    description="Создает множество триггеров и уведомлений для них в одном запросе "
+    "и одной транзакции. Типы и параметры триггеров проверяются до записи; "
+    "при любой ошибке ничего не создаётся (422).",
+)
+async def bulk_create_trigger(
+    data: BulkTriggerCreate,
+    service: TriggerService = Depends(get_trigger_service),
+    user_id: int = Depends(get_user_id),
+):
+    try:
+        return await service.bulk_create(data, user_id)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=f"{e}"
+        ) from e
+
+
+@v1_trigger_router.post(
+    "/bulk-update",
+    response_model=BulkTriggerUpdateOut,
+    summary="Массовое обновление триггеров",
+    description="Применяет одни и те же значения к триггерам из списка ID. "
+    "Чужие и несуществующие ID пропускаются.",
+)
+async def bulk_update_trigger(
+    data: BulkTriggerUpdate,
+    service: TriggerService = Depends(get_trigger_service),
+    user_id: int = Depends(get_user_id),
+):
+    try:
+        return {"updated": await service.bulk_update(data, user_id)}
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=f"{e}"
+        ) from e
 
 
-# @v1_trigger_router.post(
-#     "/bulk-create",
-#     summary="Создание триггеров с уведомлениями",
-#     description="Создает множество триггеров и уведомлений для них в одном запросе.",
-# )
-# async def bulk_create_trigger(
-#     data: BulkTriggerCreate, service: TriggerService = Depends(get_trigger_service)
-# ):
-#     return await service.bulk_create(data)
+@v1_trigger_router.post(
+    "/bulk-delete",
+    response_model=BulkTriggerDeleteOut,
+    summary="Массовое удаление триггеров",
+    description="Удаляет триггеры из списка ID. Чужие и несуществующие ID пропускаются.",
+)
+async def bulk_delete_trigger(
+    data: BulkTriggerDelete,
+    service: TriggerService = Depends(get_trigger_service),
+    user_id: int = Depends(get_user_id),
+):
+    return {"deleted": await service.bulk_delete(data, user_id)}
 
 
 @v1_trigger_router.post(
@@ -76,13 +132,20 @@ async def get_trigger(
     "/",
     response_model=list[TriggerOut],
     summary="Получение триггеров",
-    description="Возвращает триггера по ID. Возвращает ошибку 404, если не найден.",
+    description="Возвращает страницу триггеров пользователя в порядке ID. "
+    "Курсор следующей страницы — в заголовке `X-Next-Cursor`; "
+    "`fields` ограничивает набор возвращаемых полей.",
 )
 async def list_triggers(
+    response: Response,
+    page: PageParams = Depends(get_page_params(TriggerOut)),
     service: TriggerService = Depends(get_trigger_service),
     user_id: int = Depends(get_user_id),
 ):
-    return await service.list(user_id)
+    items, next_cursor = await service.list_page(
+        user_id, page.cursor, page.limit, page.fields
+    )
+    return page_response(response, items, next_cursor, page)
 
 
 @v1_trigger_router.put(
@@ -1,6 +1,10 @@
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
+
+from src.shared.configs.get_settings import get_settings
+
+settings = get_settings()
 
 
 class TriggerBase(BaseModel):
@@ -49,3 +53,68 @@ class TriggerTypeUpdate(BaseModel):
 class TriggerTypeOut(TriggerTypeBase):
     id: int
     model_config = {"from_attributes": True}
+
+
+class BulkTriggerItem(BaseModel):
+    source_id: int | None = None
+    trigger_type_id: int
+    name: str | None = None
+    config: dict[str, Any] = Field(default_factory=dict)
+    is_active: bool = True
+
+
+class BulkNotificationItem(BaseModel):
+    notification_type_id: int
+    name: str | None = None
+    description: str | None = None
+    config: dict[str, Any] = Field(default_factory=dict)
+    is_active: bool = True
+
+
+class BulkTriggerCreate(BaseModel):
+    # источник по умолчанию для триггеров, у которых source_id не указан
+    source_id: int | None = None
+    triggers: list[BulkTriggerItem] = Field(
+        min_length=1, max_length=settings.trigger_bulk_max_items
+    )
+    notifications: list[BulkNotificationItem] = Field(
+        default_factory=list, max_length=settings.trigger_bulk_max_items
+    )
+
+
+class BulkTriggerValues(BaseModel):
+    source_id: int | None = None
+    trigger_type_id: int | None = None
+    name: str | None = None
+    config: dict[str, Any] | None = None
+    is_active: bool | None = None
+
+    @field_validator("source_id", "trigger_type_id", "config", "is_active")
+    @classmethod
+    def _not_null(cls, value):
+        # поле можно не передавать, но явный null в NOT NULL колонку — 422, а не 500
+        if value is None:
+            raise ValueError("must not be null")
+        return value
+
+
+class BulkTriggerUpdate(BaseModel):
+    ids: list[int] = Field(min_length=1, max_length=settings.trigger_bulk_max_items)
+    values: BulkTriggerValues
+
+
+class BulkTriggerDelete(BaseModel):
+    ids: list[int] = Field(min_length=1, max_length=settings.trigger_bulk_max_items)
+
+
+class BulkTriggerCreateOut(BaseModel):
+    trigger_ids: list[int]
+    notification_ids: list[int]
+
+
+class BulkTriggerUpdateOut(BaseModel):
+    updated: list[int]
+
+
+class BulkTriggerDeleteOut(BaseModel):
+    deleted: list[int]
@@ -1,9 +1,82 @@
+from collections.abc import Iterable
+
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.modules.trigger.services.evaluation_engine import TriggerSpec
 from src.shared.base_repo import BaseRepository
-from src.shared.db import Triggers
+from src.shared.db import Triggers, TriggersTypes
 
 
 class TriggerRepo(BaseRepository[Triggers]):
     def __init__(self, session: AsyncSession):
         super().__init__(session, Triggers)
+
+    async def list_active_specs(
+        self, source_ids: Iterable[int]
+    ) -> list[tuple[int, TriggerSpec]]:
+        """
+        Получить активные триггеры указанных источников в виде `TriggerSpec`.
+
+        Args:
+            source_ids (Iterable[int]): ID источников.
+
+        Returns:
+            list[tuple[int, TriggerSpec]]: Пары (source_id, TriggerSpec).
+        """
+        ids = list(source_ids)
+        if not ids:
+            return []
+        stmt = (
+            select(
+                Triggers.id,
+                Triggers.source_id,
+                TriggersTypes.name,
+                Triggers.config,
+            )
+            .join(TriggersTypes, TriggersTypes.id == Triggers.trigger_type_id)
+            .where(Triggers.is_active, Triggers.source_id.in_(ids))
+        )
+        result = await self.session.execute(stmt)
+        return [
+            (source_id, TriggerSpec(trigger_id, type_name, config))
+            for trigger_id, source_id, type_name, config in result.all()
+        ]
+
+    async def type_names(self, type_ids: Iterable[int]) -> dict[int, str]:
+        """
+        Получить имена типов триггеров по их ID.
+
+        Args:
+            type_ids (Iterable[int]): ID типов.
+
+        Returns:
+            dict[int, str]: trigger_type_id -> имя типа (ключ в `TRIGGER_REGISTRY`).
+        """
+        ids = list(set(type_ids))
+        if not ids:
+            return {}
+        stmt = select(TriggersTypes.id, TriggersTypes.name).where(
+            TriggersTypes.id.in_(ids)
+        )
+        result = await self.session.execute(stmt)
+        return dict(result.all())  # type: ignore[arg-type]
+
+    async def list_type_configs(
+        self, ids: Iterable[int], user_id: int
+    ) -> list[tuple[int, int, dict]]:
+        """
+        Получить тип и параметры триггеров пользователя.
+
+        Args:
+            ids (Iterable[int]): ID триггеров.
+            user_id (int): Владелец.
+
+        Returns:
+            list[tuple[int, int, dict]]: (id, trigger_type_id, config).
+        """
+        stmt = select(Triggers.id, Triggers.trigger_type_id, Triggers.config).where(
+            Triggers.user_id == user_id, Triggers.id.in_(list(ids))
+        )
+        result = await self.session.execute(stmt)
+        return [tuple(row) for row in result.all()]  # type: ignore[misc]
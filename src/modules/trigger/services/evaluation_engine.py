@@ -0,0 +1,159 @@
+import hashlib
+import json
+from collections.abc import Callable, Iterable
+from typing import Any, NamedTuple
+
+from src.modules.trigger.types.base_type_trigger_class import BaseTypeTriggerClass
+from src.modules.trigger.types.trigger_registry import TRIGGER_REGISTRY
+from src.shared.services.metrics import trigger_evaluations, triggers_fired
+
+
+class TriggerSpec(NamedTuple):
+    """Минимальное описание активного триггера для движка."""
+
+    trigger_id: int
+    type_name: str
+    config: dict
+
+
+class _CompiledEntry(NamedTuple):
+    config_hash: str
+    type_name: str
+    compiled: Any
+
+
+def config_hash(config: dict) -> str:
+    """Стабильный хэш конфига триггера (не зависит от порядка ключей)."""
+    raw = json.dumps(config, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha1(raw.encode()).hexdigest()
+
+
+class TriggerEvaluationEngine:
+    """
+    Движок пакетной проверки триггеров.
+
+    Каждый `Triggers.config` валидируется один раз и кэшируется по
+    (trigger_id, хэш конфига). Триггеры одного типа собираются в индекс
+    (`BaseTypeTriggerClass.build_index`), и весь индекс проверяется против
+    payload источника за один проход.
+    """
+
+    def __init__(self, registry: dict[str, BaseTypeTriggerClass] | None = None):
+        """
+        Args:
+            registry (dict | None): Реестр типов триггеров. По умолчанию
+                `TRIGGER_REGISTRY`.
+        """
+        self.registry = registry if registry is not None else TRIGGER_REGISTRY
+        self._compiled: dict[int, _CompiledEntry] = {}
+        self._indexes: dict[str, Any] = {}
+        # число триггеров в индексе каждого типа (для метрик)
+        self._sizes: dict[str, int] = {}
+        self._dirty: set[str] = set()
+
+    def __len__(self) -> int:
+        return len(self._compiled)
+
+    def load(
+        self,
+        specs: Iterable[TriggerSpec],
+        on_error: Callable[[TriggerSpec, Exception], None] | None = None,
+    ) -> None:
+        """
+        Синхронизировать движок с актуальным набором активных триггеров.
+
+        Неизменившиеся триггеры не перекомпилируются; отсутствующие в
+        `specs` удаляются. Индексы перестраиваются только для типов,
+        в которых что-то поменялось.
+
+        Args:
+            specs (Iterable[TriggerSpec]): Все активные триггеры.
+            on_error (Callable | None): Если передан, невалидный триггер
+                пропускается, а ошибка отдаётся в этот обработчик.
+
+        Raises:
+            KeyError: Если тип триггера отсутствует в реестре.
+            pydantic.ValidationError: Если конфиг триггера некорректен.
+        """
+        seen: set[int] = set()
+        for spec in specs:
+            try:
+                self.upsert(spec)
+            except Exception as exc:
+                if on_error is None:
+                    raise
+                on_error(spec, exc)
+                continue
+            seen.add(spec.trigger_id)
+
+        for trigger_id in set(self._compiled) - seen:
+            self.remove(trigger_id)
+
+    def upsert(self, spec: TriggerSpec) -> None:
+        """Добавить или обновить один триггер."""
+        digest = config_hash(spec.config)
+        entry = self._compiled.get(spec.trigger_id)
+        if (
+            entry is not None
+            and entry.config_hash == digest
+            and entry.type_name == spec.type_name
+        ):
+            return
+
+        trigger = self.registry[spec.type_name]
+        self._compiled[spec.trigger_id] = _CompiledEntry(
+            digest, spec.type_name, trigger.compile(spec.config)
+        )
+        self._dirty.add(spec.type_name)
+        if entry is not None:
+            self._dirty.add(entry.type_name)
+
+    def remove(self, trigger_id: int) -> None:
+        """Удалить триггер из движка, если он был загружен."""
+        entry = self._compiled.pop(trigger_id, None)
+        if entry is not None:
+            self._dirty.add(entry.type_name)
+
+    def evaluate(
+        self, payload: dict, type_names: Iterable[str] | None = None
+    ) -> list[int]:
+        """
+        Проверить все загруженные триггеры против одного payload.
+
+        Args:
+            payload (dict): Данные от источника.
+            type_names (Iterable[str] | None): Ограничить проверку этими
+                типами триггеров.
+
+        Returns:
+            list[int]: ID сработавших триггеров.
+        """
+        self._rebuild_dirty()
+        names = self._indexes.keys() if type_names is None else type_names
+        fired: list[int] = []
+        for name in names:
+            index = self._indexes.get(name)
+            if index is not None:
+                matched = self.registry[name].evaluate_index(payload, index)
+                fired.extend(matched)
+                trigger_evaluations.inc(self._sizes[name], trigger_type=name)
+                if matched:
+                    triggers_fired.inc(len(matched), trigger_type=name)
+        return fired
+
+    def _rebuild_dirty(self) -> None:
+        if not self._dirty:
+            return
+        groups: dict[str, list[tuple[int, Any]]] = {name: [] for name in self._dirty}
+        for trigger_id, entry in self._compiled.items():
+            if entry.type_name in groups:
+                groups[entry.type_name].append((trigger_id, entry.compiled))
+
+        for name, compiled in groups.items():
+            if compiled:
+                self._indexes[name] = self.registry[name].build_index(compiled)
+                self._sizes[name] = len(compiled)
+            else:
+                self._indexes.pop(name, None)
+                self._sizes.pop(name, None)
+        self._dirty.clear()
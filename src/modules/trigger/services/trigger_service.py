@@ -1,50 +1,160 @@
+from collections.abc import Iterable
+
 from src.modules.notifications.repository.notification_repo import NotificationRepo
+from src.modules.rules.repository.rules_repo import RulesRepo
+from src.modules.trigger.api.v1.trigger_schemas import (
+    BulkTriggerCreate,
+    BulkTriggerDelete,
+    BulkTriggerUpdate,
+)
 from src.modules.trigger.repository.trigger_repo import TriggerRepo
+from src.modules.trigger.types.trigger_registry import TRIGGER_REGISTRY
 from src.shared.services.base_crud_service import BaseCRUDService
 
+# изменения этих полей меняют состав правил
+RULE_FIELDS = {"source_id", "is_active"}
+# сколько ошибок валидации показывать в ответе
+MAX_REPORTED_ERRORS = 20
+
 
 class TriggerService(BaseCRUDService[TriggerRepo]):
     def __init__(self, repo: TriggerRepo, notification_repo: NotificationRepo):
         super().__init__(repo)
         self.notification_repo = notification_repo
 
-    # async def bulk_create(self, data: BulkTriggerCreate):
-    #     async with self.repo.session.begin():
-    #         triggers = self._build_triggers(data)
-    #         self.repo.session.add_all(triggers)
-    #         await self.repo.session.flush()
-    #
-    #         notifications = self._build_notifications(triggers, data)
-    #         await self.notification_repo.add_all(notifications)
-    #
-    #     return {
-    #         "created_triggers": len(triggers),
-    #         "created_notifications": len(notifications),
-    #     }
-    #
-    # @staticmethod
-    # def _build_triggers(data: BulkTriggerCreate) -> list[Triggers]:
-    #     return [
-    #         Triggers(
-    #             **t.model_dump(exclude={"notifications"}),
-    #             user_id=data.user_id,
-    #             data_source_id=data.data_source_id,
-    #         )
-    #         for t in data.triggers
-    #     ]
-    #
-    # @staticmethod
-    # def _build_notifications(
-    #     triggers: list[Triggers], data: BulkTriggerCreate
-    # ) -> list[Notifications]:
-    #     notifications: list[Notifications] = []
-    #
-    #     for trigger, trigger_data in zip(triggers, data.triggers, strict=False):
-    #         for notif in trigger_data.notifications:
-    #             notif_data = notif.model_dump()
-    #             notifications.append(
-    #                 Notifications(
-    #                     user_trigger_id=trigger.id, user_id=data.user_id, **notif_data
-    #                 )
-    #             )
-    #     return notifications
+    async def on_change(self, obj_id: int, obj=None, user_id=None):
+        await RulesRepo(self.repo.session).materialize(trigger_ids=[obj_id])
+
+    async def bulk_create(self, data: BulkTriggerCreate, user_id: int) -> dict:
+        """
+        Создать триггеры и уведомления пользователя в одной транзакции.
+
+        Триггеры и уведомления вставляются многострочными
+        `INSERT ... RETURNING`, правила пересчитываются один раз на весь
+        запрос, коммит — один в конце.
+
+        Args:
+            data (BulkTriggerCreate): Триггеры и уведомления.
+            user_id (int): Владелец.
+
+        Returns:
+            dict: ID созданных триггеров и уведомлений.
+
+        Raises:
+            ValueError: Если у триггера нет источника, тип неизвестен
+                или параметры не подходят типу.
+        """
+        rows = []
+        errors = []
+        for i, item in enumerate(data.triggers):
+            row = {**item.model_dump(), "user_id": user_id}
+            row["source_id"] = item.source_id or data.source_id
+            if row["source_id"] is None:
+                errors.append(f"triggers[{i}]: source_id is required")
+            rows.append(row)
+        errors += await self._config_errors(
+            (f"triggers[{i}]", row["trigger_type_id"], row["config"])
+            for i, row in enumerate(rows)
+        )
+        self._raise_for(errors)
+
+        triggers = await self.repo.insert_many(rows)
+        notifications = await self.notification_repo.insert_many(
+            [{**n.model_dump(), "user_id": user_id} for n in data.notifications]
+        )
+        # новые уведомления попадают во все правила пользователя
+        if notifications:
+            scope = {"user_ids": [user_id]}
+        else:
+            scope = {"trigger_ids": [trigger.id for trigger in triggers]}
+        await RulesRepo(self.repo.session).materialize(**scope)
+        await self.repo.session.commit()
+        return {
+            "trigger_ids": [trigger.id for trigger in triggers],
+            "notification_ids": [notification.id for notification in notifications],
+        }
+
+    async def bulk_update(self, data: BulkTriggerUpdate, user_id: int) -> list[int]:
+        """
+        Применить одни и те же значения к триггерам пользователя из списка ID.
+
+        Args:
+            data (BulkTriggerUpdate): ID триггеров и новые значения.
+            user_id (int): Владелец.
+
+        Returns:
+            list[int]: ID обновлённых триггеров.
+
+        Raises:
+            ValueError: Если новый тип или параметры не проходят проверку.
+        """
+        values = data.values.model_dump(exclude_unset=True)
+        if not values:
+            return []
+        if {"trigger_type_id", "config"} & values.keys():
+            current = await self.repo.list_type_configs(data.ids, user_id)
+            self._raise_for(
+                await self._config_errors(
+                    (
+                        f"trigger {trigger_id}",
+                        values.get("trigger_type_id", type_id),
+                        values.get("config", config),
+                    )
+                    for trigger_id, type_id, config in current
+                )
+            )
+
+        updated = await self.repo.update_many(data.ids, values, user_id)
+        if updated and RULE_FIELDS & values.keys():
+            await RulesRepo(self.repo.session).materialize(trigger_ids=updated)
+        await self.repo.session.commit()
+        return updated
+
+    async def bulk_delete(self, data: BulkTriggerDelete, user_id: int) -> list[int]:
+        """
+        Удалить триггеры пользователя из списка ID.
+
+        Args:
+            data (BulkTriggerDelete): ID триггеров.
+            user_id (int): Владелец.
+
+        Returns:
+            list[int]: ID удалённых триггеров.
+        """
+        deleted = await self.repo.delete_many(data.ids, user_id)
+        if deleted:
+            await RulesRepo(self.repo.session).materialize(trigger_ids=deleted)
+        await self.repo.session.commit()
+        return deleted
+
+    async def _config_errors(self, items: Iterable[tuple[str, int, dict]]) -> list[str]:
+        """
+        Проверить тип и параметры триггеров по `TRIGGER_REGISTRY`.
+
+        Args:
+            items (Iterable[tuple[str, int, dict]]): (метка для ошибки,
+                trigger_type_id, config).
+
+        Returns:
+            list[str]: Сообщения об ошибках.
+        """
+        items = list(items)
+        names = await self.repo.type_names(type_id for _, type_id, _ in items)
+        errors = []
+        for label, type_id, config in items:
+            trigger = TRIGGER_REGISTRY.get(names.get(type_id, ""))
+            if trigger is None:
+                errors.append(f"{label}: unknown trigger type {type_id}")
+                continue
+            try:
+                trigger.compile(config)
+            except (TypeError, ValueError) as exc:
+                errors.append(f"{label}: invalid config: {exc}")
+        return errors
+
+    @staticmethod
+    def _raise_for(errors: list[str]) -> None:
+        if errors:
+            shown = "; ".join(errors[:MAX_REPORTED_ERRORS])
+            more = len(errors) - MAX_REPORTED_ERRORS
+            raise ValueError(shown + (f"; ... and {more} more" if more > 0 else ""))
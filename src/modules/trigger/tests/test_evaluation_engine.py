@@ -0,0 +1,81 @@
+import random
+
+import pytest
+from pydantic import ValidationError
+
+from src.modules.trigger.services.evaluation_engine import (
+    TriggerEvaluationEngine,
+    TriggerSpec,
+)
+from src.modules.trigger.types.trigger_types.triggers_temperatures import (
+    TemperatureTrigger,
+)
+
+
+def _spec(trigger_id: int, temp: float, op: str) -> TriggerSpec:
+    return TriggerSpec(trigger_id, "temp_trigger", {"temp": temp, "op": op})
+
+
+def test_engine_matches_per_trigger_call():
+    rnd = random.Random(42)
+    specs = [
+        _spec(i, rnd.randint(-20, 40), rnd.choice(["<", ">", "="])) for i in range(500)
+    ]
+    engine = TriggerEvaluationEngine()
+    engine.load(specs)
+    trigger = TemperatureTrigger()
+
+    for temperature in (-25, -20, 0, 12.5, 30, 40, 41):
+        payload = {"temp": temperature}
+        expected = {s.trigger_id for s in specs if trigger(payload, s.config)}
+        assert set(engine.evaluate(payload)) == expected
+
+
+def test_engine_boundaries_are_strict():
+    engine = TriggerEvaluationEngine()
+    engine.load([_spec(1, 30, ">"), _spec(2, 30, "<"), _spec(3, 30, "=")])
+
+    assert engine.evaluate({"temp": 30}) == [3]
+    assert engine.evaluate({"temp": 30.1}) == [1]
+    assert engine.evaluate({"temp": 29.9}) == [2]
+
+
+def test_engine_compiles_only_changed_configs(monkeypatch):
+    engine = TriggerEvaluationEngine()
+    trigger = engine.registry["temp_trigger"]
+    calls = []
+    original = trigger.compile
+
+    def counting_compile(params):
+        calls.append(params)
+        return original(params)
+
+    monkeypatch.setattr(trigger, "compile", counting_compile)
+
+    engine.load([_spec(1, 10, ">"), _spec(2, 20, "<")])
+    engine.load([_spec(1, 10, ">"), _spec(2, 25, "<")])
+
+    assert len(calls) == 3
+    assert engine.evaluate({"temp": 22}) == [2, 1]
+
+
+def test_engine_load_drops_missing_triggers():
+    engine = TriggerEvaluationEngine()
+    engine.load([_spec(1, 10, ">"), _spec(2, 10, ">")])
+    engine.load([_spec(2, 10, ">")])
+
+    assert len(engine) == 1
+    assert engine.evaluate({"temp": 11}) == [2]
+
+    engine.load([])
+    assert engine.evaluate({"temp": 11}) == []
+
+
+def test_engine_invalid_config_and_payload():
+    engine = TriggerEvaluationEngine()
+    with pytest.raises(ValidationError):
+        engine.load([TriggerSpec(1, "temp_trigger", {"temp": 1, "op": "!"})])
+
+    engine.load([_spec(1, 10, ">")])
+    with pytest.raises(ValueError, match="Error payload from service"):
+        engine.evaluate({"humidity": 50})
@@ -0,0 +1,161 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from pydantic import ValidationError
+
+from src.modules.rules.repository.rules_repo import RulesRepo
+from src.modules.trigger.api.v1.trigger_schemas import (
+    BulkTriggerCreate,
+    BulkTriggerDelete,
+    BulkTriggerUpdate,
+    BulkTriggerValues,
+)
+from src.modules.trigger.services.trigger_service import TriggerService
+
+
+@pytest.fixture
+def materialize(monkeypatch):
+    materialize = AsyncMock()
+    monkeypatch.setattr(RulesRepo, "materialize", materialize)
+    return materialize
+
+
+@pytest.fixture
+def repo():
+    repo = MagicMock()
+    repo.session.commit = AsyncMock()
+    repo.type_names = AsyncMock(return_value={1: "temp_trigger", 2: "unknown"})
+    repo.insert_many = AsyncMock(
+        side_effect=lambda rows: [SimpleNamespace(id=i + 10) for i in range(len(rows))]
+    )
+    repo.update_many = AsyncMock(return_value=[10])
+    repo.delete_many = AsyncMock(return_value=[10, 11])
+    return repo
+
+
+@pytest.fixture
+def notification_repo():
+    notification_repo = MagicMock()
+    notification_repo.insert_many = AsyncMock(
+        side_effect=lambda rows: [SimpleNamespace(id=i + 50) for i in range(len(rows))]
+    )
+    return notification_repo
+
+
+def _trigger(**overrides):
+    return {"trigger_type_id": 1, "config": {"temp": 5, "op": "<"}, **overrides}
+
+
+@pytest.mark.anyio
+async def test_bulk_create_inserts_everything_once(
+    repo, notification_repo, materialize
+):
+    data = BulkTriggerCreate(
+        source_id=3,
+        triggers=[_trigger(), _trigger(source_id=4)],
+        notifications=[{"notification_type_id": 1, "config": {"to": "a@b.c"}}],
+    )
+
+    result = await TriggerService(repo, notification_repo).bulk_create(data, 7)
+
+    assert result == {"trigger_ids": [10, 11], "notification_ids": [50]}
+    rows = repo.insert_many.await_args.args[0]
+    assert [(row["source_id"], row["user_id"]) for row in rows] == [(3, 7), (4, 7)]
+    notification_rows = notification_repo.insert_many.await_args.args[0]
+    assert notification_rows[0]["user_id"] == 7
+    # новые уведомления касаются всех правил пользователя
+    materialize.assert_awaited_once_with(user_ids=[7])
+    repo.session.commit.assert_awaited_once()
+
+
+@pytest.mark.anyio
+async def test_bulk_create_without_notifications_scopes_rules_to_triggers(
+    repo, notification_repo, materialize
+):
+    data = BulkTriggerCreate(source_id=3, triggers=[_trigger()])
+
+    await TriggerService(repo, notification_repo).bulk_create(data, 7)
+
+    materialize.assert_awaited_once_with(trigger_ids=[10])
+
+
+@pytest.mark.anyio
+async def test_bulk_create_validates_against_registry(
+    repo, notification_repo, materialize
+):
+    data = BulkTriggerCreate(
+        triggers=[
+            _trigger(source_id=1),
+            _trigger(source_id=1, trigger_type_id=2),
+            _trigger(source_id=1, config={"temp": "hot"}),
+            _trigger(),
+        ]
+    )
+
+    with pytest.raises(ValueError) as exc:
+        await TriggerService(repo, notification_repo).bulk_create(data, 7)
+
+    message = str(exc.value)
+    assert "triggers[0]" not in message
+    assert "triggers[1]: unknown trigger type 2" in message
+    assert "triggers[2]: invalid config" in message
+    assert "triggers[3]: source_id is required" in message
+    repo.insert_many.assert_not_awaited()
+    materialize.assert_not_awaited()
+    repo.session.commit.assert_not_awaited()
+
+
+@pytest.mark.anyio
+async def test_bulk_update_checks_new_config_of_each_trigger(
+    repo, notification_repo, materialize
+):
+    repo.list_type_configs = AsyncMock(return_value=[(10, 1, {"temp": 1, "op": "<"})])
+    data = BulkTriggerUpdate(ids=[10], values={"trigger_type_id": 2})
+
+    with pytest.raises(ValueError, match="trigger 10: unknown trigger type 2"):
+        await TriggerService(repo, notification_repo).bulk_update(data, 7)
+    repo.update_many.assert_not_awaited()
+
+
+@pytest.mark.anyio
+async def test_bulk_update_rematerializes_only_for_rule_fields(
+    repo, notification_repo, materialize
+):
+    service = TriggerService(repo, notification_repo)
+
+    assert await service.bulk_update(
+        BulkTriggerUpdate(ids=[10, 12], values={"name": "x"}), 7
+    ) == [10]
+    repo.update_many.assert_awaited_once_with([10, 12], {"name": "x"}, 7)
+    materialize.assert_not_awaited()
+    repo.session.commit.assert_awaited_once()
+
+    await service.bulk_update(
+        BulkTriggerUpdate(ids=[10], values={"is_active": False}), 7
+    )
+    materialize.assert_awaited_once_with(trigger_ids=[10])
+    assert repo.session.commit.await_count == 2
+
+
+@pytest.mark.anyio
+async def test_bulk_delete(repo, notification_repo, materialize):
+    deleted = await TriggerService(repo, notification_repo).bulk_delete(
+        BulkTriggerDelete(ids=[10, 11, 99]), 7
+    )
+
+    assert deleted == [10, 11]
+    repo.delete_many.assert_awaited_once_with([10, 11, 99], 7)
+    materialize.assert_awaited_once_with(trigger_ids=[10, 11])
+    repo.session.commit.assert_awaited_once()
+
+
+@pytest.mark.parametrize(
+    "field", ["source_id", "trigger_type_id", "config", "is_active"]
+)
+def test_bulk_values_reject_explicit_null_for_not_null_columns(field):
+    with pytest.raises(ValidationError, match="must not be null"):
+        BulkTriggerValues.model_validate({field: None})
+
+    values = BulkTriggerValues.model_validate({"name": None})
+    assert values.model_dump(exclude_unset=True) == {"name": None}
@@ -1,4 +1,6 @@
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from typing import Any
 
 
 class BaseTypeTriggerClass(ABC):
@@ -9,6 +11,42 @@ class BaseTypeTriggerClass(ABC):
     @abstractmethod
     def describe(cls) -> dict: ...
 
+    def compile(self, params: dict) -> Any:
+        """
+        Один раз подготовить параметры триггера для пакетной проверки.
+
+        Args:
+            params (dict): `Triggers.config` из БД.
+
+        Returns:
+            Any: Скомпилированные параметры, которые понимает `build_index`.
+        """
+        return params
+
+    def build_index(self, compiled: Sequence[tuple[int, Any]]) -> Any:
+        """
+        Построить индекс по группе скомпилированных триггеров одного типа.
+
+        Args:
+            compiled (Sequence[tuple[int, Any]]): Пары (trigger_id, compile()).
+
+        Returns:
+            Any: Структура, которую принимает `evaluate_index`.
+        """
+        return list(compiled)
+
+    def evaluate_index(self, payload: dict, index: Any) -> list[int]:
+        """
+        Проверить весь индекс против одного payload.
+
+        Реализация по умолчанию вызывает триггер поштучно; типы, для которых
+        возможна групповая проверка, переопределяют этот метод.
+
+        Returns:
+            list[int]: ID сработавших триггеров.
+        """
+        return [trigger_id for trigger_id, params in index if self(payload, params)]
+
     def __str__(self) -> str:
         return f"{self.__class__.__name__}: {self.describe()}"
 
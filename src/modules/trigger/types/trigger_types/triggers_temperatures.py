@@ -1,4 +1,8 @@
 import operator
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from collections.abc import Sequence
+from dataclasses import dataclass, field
 from enum import Enum
 
 from pydantic import BaseModel
@@ -26,15 +30,66 @@ class TempParams(BaseModel):
     op: Operator
 
 
+@dataclass
+class TempIndex:
+    """
+    Индекс температурных триггеров, сгруппированных по оператору.
+
+    Пороги для `<` и `>` хранятся отсортированными вместе с ID триггеров,
+    поэтому вся группа проверяется одним бинарным поиском.
+    """
+
+    lt_thresholds: list[float] = field(default_factory=list)
+    lt_ids: list[int] = field(default_factory=list)
+    gt_thresholds: list[float] = field(default_factory=list)
+    gt_ids: list[int] = field(default_factory=list)
+    eq: dict[float, list[int]] = field(default_factory=dict)
+
+
+def _get_temperature(payload: dict):
+    temperature = payload.get("temp")
+    if temperature is None:
+        raise ValueError("Error payload from service")
+    return temperature
+
+
 class TemperatureTrigger(BaseTypeTriggerClass):
-    def __call__(self, payload: dict, params: dict) -> bool:
-        p = TempParams(**params)
-        temperature = payload.get("temp")
-        if temperature is None:
-            raise ValueError("Error payload from service")
+    def __call__(self, payload: dict, params: dict | TempParams) -> bool:
+        p = params if isinstance(params, TempParams) else TempParams(**params)
+        temperature = _get_temperature(payload)
 
         return OPERATOR_FUNC[p.op](temperature, p.temp)
 
+    def compile(self, params: dict) -> TempParams:
+        return TempParams(**params)
+
+    def build_index(self, compiled: Sequence[tuple[int, TempParams]]) -> TempIndex:
+        groups: dict[Operator, list[tuple[float, int]]] = defaultdict(list)
+        for trigger_id, p in compiled:
+            groups[p.op].append((p.temp, trigger_id))
+
+        index = TempIndex()
+        for op, thresholds, ids in (
+            (Operator.lt, index.lt_thresholds, index.lt_ids),
+            (Operator.gt, index.gt_thresholds, index.gt_ids),
+        ):
+            for temp, trigger_id in sorted(groups[op]):
+                thresholds.append(temp)
+                ids.append(trigger_id)
+        for temp, trigger_id in groups[Operator.eq]:
+            index.eq.setdefault(temp, []).append(trigger_id)
+        return index
+
+    def evaluate_index(self, payload: dict, index: TempIndex) -> list[int]:
+        temperature = _get_temperature(payload)
+
+        # curr < temp: сработали все пороги строго больше текущей температуры
+        fired = index.lt_ids[bisect_right(index.lt_thresholds, temperature) :]
+        # curr > temp: сработали все пороги строго меньше текущей температуры
+        fired += index.gt_ids[: bisect_left(index.gt_thresholds, temperature)]
+        fired += index.eq.get(temperature, [])
+        return fired
+
     @classmethod
     def describe(cls):
         return {
@@ -1,13 +1,16 @@
 import builtins
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence
 from typing import Any, Generic, TypeVar
 
 from pydantic import BaseModel
-from sqlalchemy import select
+from sqlalchemy import delete, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 ModelType = TypeVar("ModelType")
 
+# asyncpg ограничивает один запрос 32767 параметрами
+MAX_BIND_PARAMS = 32767
+
 
 class BaseRepository(Generic[ModelType]):
     def __init__(self, session: AsyncSession, model: type[ModelType]):
@@ -15,55 +18,151 @@ class BaseRepository(Generic[ModelType]):
         self.model = model
 
     async def create(self, data: BaseModel | dict) -> ModelType | None:
+        """Добавить объект и получить его ID; коммит остаётся за вызывающим кодом."""
         if isinstance(data, BaseModel):
             data = data.model_dump()
         obj = self.model(**data)
         self.session.add(obj)
-        await self.session.commit()
+        await self.session.flush()
         await self.session.refresh(obj)
         return obj
 
     async def add_all(self, objects: list[Any]):
         self.session.add_all(objects)
 
-    async def get(self, obj_id: int, user_id: int | None = None) -> ModelType | None:
-        stmt = select(self.model).where(self.model.id == obj_id)
-
+    def _owned(self, stmt, user_id: int | None):
+        """Ограничить запрос объектами владельца (если у модели есть user_id)."""
         if user_id is not None and hasattr(self.model, "user_id"):
-            stmt = stmt.where(self.model.user_id == user_id, self.model.id == obj_id)
+            stmt = stmt.where(self.model.user_id == user_id)
+        return stmt
+
+    async def get(self, obj_id: int, user_id: int | None = None) -> ModelType | None:
+        stmt = self._owned(select(self.model).where(self.model.id == obj_id), user_id)
 
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
     async def list(self, user_id: int | None = None) -> list[ModelType]:
-        stmt = select(self.model)
-
-        if user_id is not None and hasattr(self.model, "user_id"):
-            stmt = stmt.where(self.model.user_id == user_id)
-        print("user_id", stmt)
+        stmt = self._owned(select(self.model).order_by(self.model.id), user_id)
 
         result = await self.session.execute(stmt)
         return result.scalars().all()
 
-    async def update(self, obj_id: int, data: dict, user_id: int) -> ModelType | None:
-        obj = await self.get(obj_id)
-        if not obj:
-            return None
+    async def list_page(
+        self,
+        user_id: int | None = None,
+        after_id: int | None = None,
+        limit: int = 50,
+        columns: Sequence[str] | None = None,
+    ) -> tuple[builtins.list[Any], int | None]:
+        """
+        Получить страницу объектов по курсору (keyset-пагинация).
+
+        Строки отдаются в порядке `id`, следующая страница начинается
+        после последнего `id` предыдущей (`WHERE id > :after_id ORDER BY id
+        LIMIT n`), поэтому стоимость запроса не растёт с номером страницы
+        и использует индекс по первичному ключу (или `(user_id, id)`).
+
+        Args:
+            user_id (int | None): Фильтр по владельцу.
+            after_id (int | None): Курсор — `id` последнего объекта
+                предыдущей страницы.
+            limit (int): Размер страницы.
+            columns (Sequence[str] | None): Какие колонки выбрать. Если
+                указаны, вместо ORM объектов возвращаются словари (`id`
+                добавляется всегда).
+
+        Returns:
+            tuple[list, int | None]: Объекты страницы и курсор следующей
+                страницы (None, если страница последняя).
+
+        Raises:
+            ValueError: Если среди `columns` есть неизвестная колонка.
+        """
+        if columns:
+            stmt = select(*self._columns(columns))
+        else:
+            stmt = select(self.model)
+        stmt = self._owned(stmt, user_id)
+        if after_id is not None:
+            stmt = stmt.where(self.model.id > after_id)
+        # лишняя строка показывает, есть ли следующая страница, без COUNT(*)
+        stmt = stmt.order_by(self.model.id).limit(limit + 1)
+
+        result = await self.session.execute(stmt)
+        if columns:
+            items = [dict(row) for row in result.mappings().all()]
+        else:
+            items = builtins.list(result.scalars().all())
+        if len(items) <= limit:
+            return items, None
+        items = items[:limit]
+        last = items[-1]
+        return items, last["id"] if columns else last.id
+
+    def _columns(self, names: Iterable[str]) -> builtins.list[Any]:
+        """
+        Колонки модели по именам, `id` всегда первой.
+
+        Raises:
+            ValueError: Если у модели нет такой колонки.
+        """
+        table_columns = self.model.__table__.columns  # type: ignore[attr-defined]
+        selected = ["id", *(name for name in names if name != "id")]
+        unknown = [name for name in selected if name not in table_columns]
+        if unknown:
+            raise ValueError(f"Unknown columns: {', '.join(unknown)}")
+        return [table_columns[name] for name in dict.fromkeys(selected)]
+
+    async def update(
+        self, obj_id: int, data: BaseModel | dict, user_id: int | None = None
+    ) -> ModelType | None:
+        """
+        Обновить объект одним `UPDATE ... WHERE id AND user_id RETURNING *`.
+
+        Коммит остаётся за вызывающим кодом.
+
+        Args:
+            obj_id (int): ID объекта.
+            data (BaseModel | dict): Новые значения (для схемы — только
+                заданные поля).
+            user_id (int | None): Владелец; чужой объект не обновляется.
+
+        Returns:
+            ModelType | None: Обновлённый объект или None, если объект не найден.
+        """
         if isinstance(data, BaseModel):
             data = data.model_dump(exclude_unset=True)
-        for key, value in data.items():
-            setattr(obj, key, value)
-        await self.session.commit()
-        await self.session.refresh(obj)
-        return obj
+        if not data:
+            return await self.get(obj_id, user_id)
+        stmt = self._owned(
+            update(self.model)
+            .where(self.model.id == obj_id)
+            .values(**data)
+            .returning(self.model),
+            user_id,
+        )
+        return (await self.session.scalars(stmt)).one_or_none()
 
-    async def delete(self, obj_id: int, user_id: int) -> bool:
-        obj = await self.get(obj_id)
-        if not obj:
-            return False
-        await self.session.delete(obj)
-        await self.session.commit()
-        return True
+    async def delete(self, obj_id: int, user_id: int | None = None) -> bool:
+        """
+        Удалить объект одним `DELETE ... WHERE id AND user_id RETURNING id`.
+
+        Коммит остаётся за вызывающим кодом.
+
+        Args:
+            obj_id (int): ID объекта.
+            user_id (int | None): Владелец; чужой объект не удаляется.
+
+        Returns:
+            bool: True, если объект был удалён.
+        """
+        stmt = self._owned(
+            delete(self.model).where(self.model.id == obj_id).returning(self.model.id),
+            user_id,
+        )
+        deleted = (await self.session.execute(stmt)).scalar_one_or_none()
+        return deleted is not None
 
     async def create_many(
         self, data: Iterable[BaseModel | dict]
@@ -75,3 +174,84 @@ class BaseRepository(Generic[ModelType]):
         self.session.add_all(objs)
         await self.session.commit()
         return objs
+
+    async def insert_many(
+        self, rows: Sequence[dict], chunk_size: int | None = None
+    ) -> builtins.list[ModelType]:
+        """
+        Вставить строки многострочным `INSERT ... VALUES ... RETURNING`.
+
+        Строки режутся на порции так, чтобы запрос укладывался в лимит
+        параметров asyncpg. Коммит остаётся за вызывающим кодом.
+
+        Args:
+            rows (Sequence[dict]): Значения колонок; у всех строк одинаковые ключи.
+            chunk_size (int | None): Строк в одном запросе. По умолчанию
+                максимум, допустимый лимитом параметров.
+
+        Returns:
+            list: Созданные объекты в порядке `rows`.
+        """
+        if not rows:
+            return []
+        chunk_size = chunk_size or max(1, MAX_BIND_PARAMS // len(rows[0]))
+        created: builtins.list[ModelType] = []
+        for start in range(0, len(rows), chunk_size):
+            chunk = builtins.list(rows[start : start + chunk_size])
+            result = await self.session.scalars(
+                insert(self.model).values(chunk).returning(self.model)
+            )
+            created.extend(result.all())
+        return created
+
+    async def update_many(
+        self, ids: Iterable[int], data: dict, user_id: int | None = None
+    ) -> builtins.list[int]:
+        """
+        Применить одни и те же значения к объектам из списка ID одним
+        `UPDATE ... WHERE id IN (...) RETURNING id` на порцию.
+
+        Коммит остаётся за вызывающим кодом.
+
+        Args:
+            ids (Iterable[int]): ID объектов.
+            data (dict): Новые значения колонок.
+            user_id (int | None): Обновлять только объекты этого владельца.
+
+        Returns:
+            list[int]: ID обновлённых объектов (чужие и несуществующие
+                пропускаются).
+        """
+        stmt = update(self.model).values(**data)
+        return await self._by_ids(stmt, ids, user_id)
+
+    async def delete_many(
+        self, ids: Iterable[int], user_id: int | None = None
+    ) -> builtins.list[int]:
+        """
+        Удалить объекты из списка ID (`DELETE ... WHERE id IN (...) RETURNING id`).
+
+        Коммит остаётся за вызывающим кодом.
+
+        Args:
+            ids (Iterable[int]): ID объектов.
+            user_id (int | None): Удалять только объекты этого владельца.
+
+        Returns:
+            list[int]: ID удалённых объектов.
+        """
+        return await self._by_ids(delete(self.model), ids, user_id)
+
+    async def _by_ids(self, stmt, ids: Iterable[int], user_id: int | None):
+        ids = builtins.list(dict.fromkeys(ids))
+        stmt = self._owned(stmt, user_id)
+        affected: builtins.list[int] = []
+        # запас в параметрах под значения SET и user_id
+        chunk_size = MAX_BIND_PARAMS // 2
+        for start in range(0, len(ids), chunk_size):
+            chunk = ids[start : start + chunk_size]
+            result = await self.session.execute(
+                stmt.where(self.model.id.in_(chunk)).returning(self.model.id)
+            )
+            affected.extend(result.scalars().all())
+        return affected
@@ -1,6 +1,130 @@
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Any
+
 from celery import shared_task
 
+from src.shared.celery_module.worker_loop import worker_loop
+
+errors_logger = logging.getLogger("errors_log")
+
 
 @shared_task(name="sync_articles")
 def sync_articles():
     print("Syncing articles...")
+
+
+async def _with_session(
+    body: Callable[[Any], Awaitable[Any]], readonly: bool = False
+) -> Any:
+    from src.shared.db.session import AsyncReadSessionLocal, AsyncSessionLocal
+
+    factory = AsyncReadSessionLocal if readonly else AsyncSessionLocal
+    try:
+        async with factory() as session:
+            return await body(session)
+    finally:
+        await _push_metrics()
+
+
+async def _push_metrics() -> None:
+    """Отправить метрики воркера в Redis, откуда их читает `/metrics` API."""
+    import redis.asyncio as redis
+
+    from src.shared.services.metrics import metrics
+    from src.shared.services.redis_pool import shared_redis_pool
+
+    try:
+        await metrics.push(shared_redis_pool.client)
+    except (redis.RedisError, OSError) as exc:
+        # приращения не потеряны: уйдут со следующей успешной отправкой
+        errors_logger.warning(f"Pushing worker metrics failed: {exc}")
+
+
+def _run_async(body: Callable[[Any], Awaitable[Any]], readonly: bool = False) -> Any:
+    """
+    Выполнить асинхронное тело задачи с сессией БД в цикле воркера.
+
+    Пулы БД, HTTP, Redis и SMTP живут в цикле процесса воркера и
+    переиспользуются между задачами (см. `WorkerLoop`).
+
+    Args:
+        body: Корутина-функция, принимающая сессию.
+        readonly (bool): Тело только читает — сессия берётся из реплики.
+    """
+    return worker_loop.run(_with_session(body, readonly))
+
+
+async def _poll_sources(session) -> int:
+    from src.modules.notifications.repository.notification_repo import (
+        NotificationRepo,
+    )
+    from src.modules.notifications.services.dispatch_service import (
+        NotificationDispatcher,
+    )
+    from src.modules.rules.repository.rules_repo import RulesRepo
+    from src.modules.source.repository.data_source_repo import DataSourceRepo
+    from src.modules.source.services.polling_service import SourcePollingService
+    from src.modules.trigger.repository.trigger_repo import TriggerRepo
+
+    # Redis-уровень кэша погоды подключён на весь процесс (`worker_loop`)
+    service = SourcePollingService(DataSourceRepo(session), TriggerRepo(session))
+    fired = await service.poll_once()
+    dispatcher = NotificationDispatcher(RulesRepo(session), NotificationRepo(session))
+    await dispatcher.dispatch(fired)
+    return len(fired)
+
+
+@shared_task(name="poll_sources")
+def poll_sources():
+    """Один тик опроса источников: по запросу на каждую уникальную локацию."""
+    # опрос только читает источники, триггеры и правила
+    return _run_async(_poll_sources, readonly=True)
+
+
+async def _sweep_refresh_tokens(session) -> int:
+    from src.modules.auth.repositories.jwt_repo import JWTRepo
+
+    return await JWTRepo(session).delete_expired()
+
+
+@shared_task(name="sweep_refresh_tokens")
+def sweep_refresh_tokens():
+    """Удалить истёкшие и давно отозванные refresh токены порциями."""
+    return _run_async(_sweep_refresh_tokens)
+
+
+def _notify(items: list[list]) -> int:
+    from src.modules.notifications.repository.notification_repo import (
+        NotificationRepo,
+    )
+    from src.modules.notifications.services.dispatch_service import deliver_batch
+
+    async def body(session) -> int:
+        return await deliver_batch(NotificationRepo(session), items)
+
+    return _run_async(body, readonly=True)
+
+
+@shared_task
+def notify_email(items: list[list]) -> int:
+    """Доставить пачку email-уведомлений [[notification_id, payload], ...]."""
+    return _notify(items)
+
+
+@shared_task
+def notify_tg(items: list[list]) -> int:
+    """Доставить пачку Telegram-уведомлений."""
+    return _notify(items)
+
+
+@shared_task
+def notify_sms(items: list[list]) -> int:
+    """Доставить пачку SMS-уведомлений."""
+    return _notify(items)
+
+
+@shared_task
+def notify_default(items: list[list]) -> int:
+    """Доставить пачку уведомлений прочих типов (очередь default)."""
+    return _notify(items)
@@ -0,0 +1,137 @@
+import asyncio
+import logging
+import os
+import threading
+from collections.abc import Awaitable, Callable, Coroutine
+from concurrent.futures import Future
+from typing import Any, TypeVar
+
+from celery.signals import worker_process_shutdown, worker_shutdown
+
+errors_logger = logging.getLogger("errors_log")
+
+T = TypeVar("T")
+
+
+class WorkerLoop:
+    """
+    Один event loop на процесс воркера Celery.
+
+    Loop крутится в фоновом потоке, задачи отправляют в него корутины и
+    ждут результата. Пулы, привязанные к циклу (asyncpg, httpx, redis,
+    SMTP), создаются при первой задаче и переживают следующие, а не
+    пересоздаются на каждую задачу, как при `asyncio.run`. Поток
+    запускается лениво, то есть уже в дочернем процессе после fork.
+    """
+
+    def __init__(
+        self,
+        on_close: Callable[[], Awaitable[None]] | None = None,
+        on_start: Callable[[], None] | None = None,
+    ):
+        """
+        Args:
+            on_close: Корутина-функция, закрывающая ресурсы процесса;
+                выполняется в цикле перед его остановкой.
+            on_start: Функция, подключающая ресурсы процесса; вызывается
+                один раз при запуске цикла (в том числе после fork).
+        """
+        self.on_close = on_close
+        self.on_start = on_start
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._pid: int | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            # после fork поток цикла родителя в дочернем процессе не существует
+            if self._loop is None or self._loop.is_closed() or self._pid != os.getpid():
+                loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=loop.run_forever, name="celery-worker-loop", daemon=True
+                )
+                self._thread.start()
+                self._loop = loop
+                self._pid = os.getpid()
+                if self.on_start is not None:
+                    self.on_start()
+            return self._loop
+
+    def run(self, coro: Coroutine[Any, Any, T], timeout: float | None = None) -> T:
+        """
+        Выполнить корутину в цикле воркера и дождаться результата.
+
+        Если ожидание прервано (например, soft time limit Celery),
+        корутина отменяется.
+
+        Args:
+            coro: Корутина тела задачи.
+            timeout (float | None): Максимальное время ожидания (в секундах).
+
+        Returns:
+            Результат корутины.
+        """
+        future: Future[T] = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        try:
+            return future.result(timeout)
+        except BaseException:
+            future.cancel()
+            raise
+
+    def stop(self) -> None:
+        """Закрыть ресурсы процесса и остановить цикл."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None or loop.is_closed():
+            return
+        if self.on_close is not None:
+            try:
+                asyncio.run_coroutine_threadsafe(self.on_close(), loop).result(30)
+            except Exception as exc:  # noqa: BLE001
+                errors_logger.error(f"Closing worker resources failed: {exc}")
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None:
+            thread.join(timeout=5)
+        loop.close()
+
+
+def open_worker_resources() -> None:
+    """Подключить Redis-уровень кэша OpenWeather на всё время жизни процесса."""
+    from src.modules.source.services.open_weather_service import weather_cache
+    from src.shared.services.redis_pool import shared_redis_pool
+    from src.shared.services.redis_service import RedisService
+
+    weather_cache.bind_redis(RedisService(shared_redis_pool.client))
+
+
+async def close_worker_resources() -> None:
+    """Закрыть пулы соединений процесса воркера."""
+    from src.modules.notifications.types.notifications_types_registry import (
+        NOTIFY_REGISTRY,
+    )
+    from src.modules.source.services.open_weather_service import weather_cache
+    from src.shared.db.engine import dispose_engines
+    from src.shared.services.http_client import shared_http_client
+    from src.shared.services.redis_pool import shared_redis_pool
+
+    weather_cache.bind_redis(None)
+    for notify in NOTIFY_REGISTRY.values():
+        await notify.close()
+    await shared_http_client.close()
+    await shared_redis_pool.close()
+    await dispose_engines()
+
+
+worker_loop = WorkerLoop(
+    on_close=close_worker_resources, on_start=open_worker_resources
+)
+
+
+@worker_process_shutdown.connect
+@worker_shutdown.connect
+def _stop_worker_loop(**kwargs) -> None:
+    # prefork: дочерний процесс; solo/threads: сам воркер
+    worker_loop.stop()
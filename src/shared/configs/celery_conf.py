@@ -55,10 +55,17 @@ task_routes = {
     },
 }
 
-# --- Пример beat-расписания (опционально) ---
-# beat_schedule = {
-#     "cleanup-every-night": {
-#         "task": "src.shared.celery_module.tasks.cleanup",
-#         "schedule": crontab(hour=2, minute=0),
-#     },
-# }
+# --- Beat-расписание ---
+beat_schedule = {
+    "poll-sources": {
+        "task": "poll_sources",
+        "schedule": settings.poll_interval_seconds,
+        # тик, не успевший стартовать до следующего, бесполезен
+        "options": {"expires": settings.poll_interval_seconds},
+    },
+    "sweep-refresh-tokens": {
+        "task": "sweep_refresh_tokens",
+        "schedule": settings.refresh_sweep_interval_seconds,
+        "options": {"expires": settings.refresh_sweep_interval_seconds},
+    },
+}
@@ -1,85 +1,120 @@
-from logging.config import dictConfig
+import atexit
+import logging
+import queue
 from pathlib import Path
 
+from src.shared.configs.get_settings import get_settings
+from src.shared.services.log_queue import (
+    BatchedRotatingFileHandler,
+    BatchingQueueListener,
+    DroppingQueueHandler,
+)
+
+settings = get_settings()
+
 LOG_DIR = Path(__file__).parent.parent.parent.parent / "logs"
 LOG_DIR.mkdir(parents=True, exist_ok=True)
 
+LOG_FORMAT = "[{asctime}] {levelname}: {name}: {message}"
+# поля из `extra`, которые дописываются в строку как ` ключ=значение`
+EXTRA_FIELDS = ("duration_ms",)
+MAX_BYTES = 5 * 1024 * 1024
+BACKUP_COUNT = 5
+
+# файл -> (логгер, уровень обработчика)
+FILES = {
+    "app.log": ("app_log", "INFO"),
+    "errors.log": ("errors_log", "ERROR"),
+    "access.log": ("access_log", "INFO"),
+    "auth.log": ("auth_log", "INFO"),
+    "source.log": ("source_log", "INFO"),
+}
+
+# логгер -> уровень логгера
+LOGGERS = {
+    "app_log": "DEBUG",
+    "access_log": "INFO",
+    "auth_log": "INFO",
+    "source_log": "INFO",
+    "errors_log": "DEBUG",
+}
+
+log_listener: BatchingQueueListener | None = None
+
+
+class ExtraFieldsFormatter(logging.Formatter):
+    """Формат LOG_FORMAT плюс поля EXTRA_FIELDS, если они есть в записи."""
+
+    def formatMessage(self, record: logging.LogRecord) -> str:
+        line = super().formatMessage(record)
+        extra = "".join(
+            f" {name}={getattr(record, name)}"
+            for name in EXTRA_FIELDS
+            if hasattr(record, name)
+        )
+        return line + extra
+
 
-def setup_logger():
-    dictConfig(
-        {
-            "version": 1,
-            "disable_existing_loggers": False,
-            "formatters": {
-                "default": {
-                    "format": "[{asctime}] {levelname}: {name}: {message}",
-                    "style": "{",
-                },
-                "json": {
-                    "()": "pythonjsonlogger.jsonlogger.JsonFormatter",
-                    "format": "%(asctime)s %(levelname)s %(name)s %(message)s",
-                },
-            },
-            "handlers": {
-                "app": {
-                    "class": "logging.handlers.RotatingFileHandler",
-                    "filename": str(LOG_DIR / "app.log"),
-                    "maxBytes": 5 * 1024 * 1024,
-                    "backupCount": 5,
-                    "formatter": "default",
-                    "level": "INFO",
-                },
-                "errors": {
-                    "class": "logging.handlers.RotatingFileHandler",
-                    "filename": str(LOG_DIR / "errors.log"),
-                    "maxBytes": 5 * 1024 * 1024,
-                    "backupCount": 5,
-                    "formatter": "default",
-                    "level": "ERROR",
-                },
-                "access": {
-                    "class": "logging.handlers.RotatingFileHandler",
-                    "filename": str(LOG_DIR / "access.log"),
-                    "maxBytes": 5 * 1024 * 1024,
-                    "backupCount": 5,
-                    "formatter": "default",
-                    "level": "INFO",
-                },
-                "auth": {
-                    "class": "logging.handlers.RotatingFileHandler",
-                    "filename": str(LOG_DIR / "auth.log"),
-                    "maxBytes": 5 * 1024 * 1024,
-                    "backupCount": 5,
-                    "formatter": "default",
-                    "level": "INFO",
-                },
-                "source": {
-                    "class": "logging.handlers.RotatingFileHandler",
-                    "filename": str(LOG_DIR / "source.log"),
-                    "maxBytes": 5 * 1024 * 1024,
-                    "backupCount": 5,
-                    "formatter": "default",
-                    "level": "INFO",
-                },
-            },
-            "loggers": {
-                "app_log": {"handlers": ["app"], "level": "DEBUG", "propagate": False},
-                "access_log": {
-                    "handlers": ["access"],
-                    "level": "INFO",
-                    "propagate": False,
-                },
-                "auth_log": {"handlers": ["auth"], "level": "INFO", "propagate": False},
-                "source_log": {
-                    "handlers": ["source"],
-                    "level": "INFO",
-                    "propagate": False,
-                },
-                "errors_log": {
-                    "handlers": ["errors"],
-                    "level": "DEBUG",
-                    "propagate": False,
-                },
-            },
-        }
+def setup_logger() -> BatchingQueueListener:
+    """
+    Настроить логгеры приложения.
+
+    Логгеры пишут в общую ограниченную очередь (`LOG_QUEUE_SIZE`) и не
+    блокируются на файловом вводе-выводе; файлы пишет и ротирует фоновый
+    поток пачками до `LOG_BATCH_SIZE` записей с одним flush на пачку.
+    При переполнении очереди записи отбрасываются и учитываются.
+
+    Returns:
+        BatchingQueueListener: Запущенный поток записи.
+    """
+    global log_listener
+    shutdown_logger()
+
+    formatter = ExtraFieldsFormatter(LOG_FORMAT, style="{")
+    handlers = []
+    for filename, (logger_name, level) in FILES.items():
+        handler = BatchedRotatingFileHandler(
+            LOG_DIR / filename,
+            maxBytes=MAX_BYTES,
+            backupCount=BACKUP_COUNT,
+            encoding="utf-8",
+            delay=True,
+        )
+        handler.setLevel(level)
+        handler.setFormatter(formatter)
+        # одна очередь на все логгеры: файл принимает записи только своего
+        handler.addFilter(logging.Filter(logger_name))
+        handlers.append(handler)
+
+    log_queue: queue.Queue = queue.Queue(maxsize=settings.log_queue_size)
+    queue_handler = DroppingQueueHandler(log_queue)
+    for name, level in LOGGERS.items():
+        logger = logging.getLogger(name)
+        for old in logger.handlers[:]:
+            logger.removeHandler(old)
+        logger.addHandler(queue_handler)
+        logger.setLevel(level)
+        logger.propagate = False
+
+    log_listener = BatchingQueueListener(
+        log_queue,
+        *handlers,
+        batch_size=settings.log_batch_size,
+        source=queue_handler,
     )
+    log_listener.start()
+    return log_listener
+
+
+def shutdown_logger() -> None:
+    """Дописать записи из очереди, остановить поток записи и закрыть файлы."""
+    global log_listener
+    if log_listener is None:
+        return
+    listener, log_listener = log_listener, None
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+atexit.register(shutdown_logger)
@@ -42,10 +42,27 @@ class Settings(BaseSettings):
     # TTL-ы приходят как int
     access_expire_min: int = Field(15, alias="ACCESS_EXPIRE_MIN")
     refresh_expire_days: int = Field(7, alias="REFRESH_EXPIRE_DAYS")
+    refresh_sweep_interval_seconds: int = Field(
+        3600, alias="REFRESH_SWEEP_INTERVAL_SECONDS"
+    )
+    refresh_sweep_batch_size: int = Field(1000, alias="REFRESH_SWEEP_BATCH_SIZE")
+    refresh_revoked_retention_hours: int = Field(
+        24, alias="REFRESH_REVOKED_RETENTION_HOURS"
+    )
+    jwt_cache_maxsize: int = Field(10000, alias="JWT_CACHE_MAXSIZE")
+    jwt_cache_max_ttl_seconds: float = Field(300.0, alias="JWT_CACHE_MAX_TTL_SECONDS")
+    revocation_bloom_capacity: int = Field(100000, alias="REVOCATION_BLOOM_CAPACITY")
+    revocation_bloom_error_rate: float = Field(
+        0.001, alias="REVOCATION_BLOOM_ERROR_RATE"
+    )
+    revocation_resync_seconds: float = Field(300.0, alias="REVOCATION_RESYNC_SECONDS")
 
     # Passlib (pwd_context)
     pwd_context_schemes: str = Field("bcrypt", alias="PWD_CONTEXT_SCHEMES")
     pwd_context_deprecated: str = Field("auto", alias="PWD_CONTEXT_DEPRECATED")
+    pwd_bcrypt_rounds: int | None = Field(None, alias="PWD_BCRYPT_ROUNDS")
+    password_hash_workers: int = Field(4, alias="PASSWORD_HASH_WORKERS")
+    password_hash_max_queue: int = Field(32, alias="PASSWORD_HASH_MAX_QUEUE")
 
     # Fernet (симметричное шифрование)
     fernet_key: str | None = Field(None, alias="FERNET_KEY")
@@ -56,6 +73,9 @@ class Settings(BaseSettings):
     smtp_username: str | None = Field(None, alias="SMTP_USERNAME")
     smtp_password: str | None = Field(None, alias="SMTP_PASSWORD")
     from_email: str | None = Field(None, alias="FROM_EMAIL")
+    # Пул SMTP-соединений: сколько авторизованных соединений держать на воркер
+    smtp_pool_size: int = Field(3, alias="SMTP_POOL_SIZE")
+    smtp_timeout: float = Field(30.0, alias="SMTP_TIMEOUT")
 
     # === Databases (части + готовые DSN) ===
     postgres_user: str = Field("pgres", alias="POSTGRES_USER")
@@ -67,6 +87,20 @@ class Settings(BaseSettings):
     # Если явно заданы — используем их; иначе соберём из частей выше
     database_url: str | None = Field(None, alias="DATABASE_URL")
     sync_database_url: str | None = Field(None, alias="SYNC_DATABASE_URL")
+    # Реплика для чтения (postgresql+asyncpg://...); пусто — читаем из основной
+    database_replica_url: str | None = Field(None, alias="DATABASE_REPLICA_URL")
+
+    # === Пул соединений БД (на процесс и на каждый движок) ===
+    db_pool_size: int = Field(20, alias="DB_POOL_SIZE")
+    db_max_overflow: int = Field(10, alias="DB_MAX_OVERFLOW")
+    db_pool_timeout: float = Field(30.0, alias="DB_POOL_TIMEOUT")
+    db_pool_recycle: int = Field(1800, alias="DB_POOL_RECYCLE")
+    db_pool_pre_ping: bool = Field(True, alias="DB_POOL_PRE_PING")
+    # Кэши подготовленных запросов asyncpg (0 — выключить, нужно для PgBouncer)
+    db_prepared_statement_cache_size: int = Field(
+        500, alias="DB_PREPARED_STATEMENT_CACHE_SIZE"
+    )
+    db_statement_cache_size: int = Field(500, alias="DB_STATEMENT_CACHE_SIZE")
 
     # === Redis ===
     redis_password: str | None = Field(None, alias="REDIS_PASSWORD")
@@ -74,6 +108,9 @@ class Settings(BaseSettings):
         "redis://localhost:6379/0", alias="DEFAULT_REDIS_URL"
     )
     redis_url_env: str = Field("redis://localhost:6379/0", alias="REDIS_URL_ENV")
+    redis_max_connections: int = Field(50, alias="REDIS_MAX_CONNECTIONS")
+    redis_pool_timeout: float = Field(5.0, alias="REDIS_POOL_TIMEOUT")
+    redis_health_check_interval: int = Field(30, alias="REDIS_HEALTH_CHECK_INTERVAL")
     celery_broker_url: str = Field(
         "redis://localhost:6379/0", alias="CELERY_BROKER_URL"
     )
@@ -85,6 +122,62 @@ class Settings(BaseSettings):
     api_key_openweathermap: str | None = Field(None, alias="API_KEY_OPENWEATHERMAP")
     mailerlite_api_key: str | None = Field(None, alias="MAILERLITE_API_KEY")
 
+    # === HTTP client (общий пул исходящих запросов) ===
+    http_timeout: float = Field(10.0, alias="HTTP_TIMEOUT")
+    http_max_connections: int = Field(100, alias="HTTP_MAX_CONNECTIONS")
+    http_max_keepalive_connections: int = Field(
+        20, alias="HTTP_MAX_KEEPALIVE_CONNECTIONS"
+    )
+    http_per_host_concurrency: int = Field(10, alias="HTTP_PER_HOST_CONCURRENCY")
+    http_http2: bool = Field(True, alias="HTTP_HTTP2")
+    # Квота OpenWeather (бесплатный план — 60 запросов в минуту); параллелизм
+    # считается на процесс, квота — суммарно по всем процессам через Redis
+    openweather_max_concurrency: int = Field(10, alias="OPENWEATHER_MAX_CONCURRENCY")
+    openweather_rate_per_minute: int = Field(60, alias="OPENWEATHER_RATE_PER_MINUTE")
+    # Кэш ответов OpenWeather (локальный LRU + Redis). TTL короче периода
+    # опроса: кэш объединяет запросы воркеров и API в пределах одного тика,
+    # а каждый тик опроса получает свежую погоду
+    weather_cache_ttl_seconds: int = Field(60, alias="WEATHER_CACHE_TTL_SECONDS")
+    geocoding_cache_ttl_seconds: int = Field(
+        30 * 24 * 60 * 60, alias="GEOCODING_CACHE_TTL_SECONDS"
+    )
+    weather_cache_maxsize: int = Field(10_000, alias="WEATHER_CACHE_MAXSIZE")
+
+    # === API ===
+    # Размер страницы списков по умолчанию и максимальный (параметр limit)
+    list_page_size: int = Field(50, alias="LIST_PAGE_SIZE")
+    list_page_size_max: int = Field(500, alias="LIST_PAGE_SIZE_MAX")
+    # Максимум триггеров (и уведомлений) в одном bulk-запросе
+    trigger_bulk_max_items: int = Field(10000, alias="TRIGGER_BULK_MAX_ITEMS")
+
+    # === Logging ===
+    # Очередь записей для фонового потока записи логов (дальше — отбрасываются)
+    log_queue_size: int = Field(10000, alias="LOG_QUEUE_SIZE")
+    # Сколько записей писать за один flush
+    log_batch_size: int = Field(256, alias="LOG_BATCH_SIZE")
+
+    # === Каталоги типов (list_types) ===
+    # Cache-Control: max-age для каталогов; после него клиент перепроверяет ETag
+    catalog_cache_max_age_seconds: int = Field(
+        300, alias="CATALOG_CACHE_MAX_AGE_SECONDS"
+    )
+
+    # === Health checks ===
+    # Период фоновой проверки БД, Redis и брокера для /readyz (секунды)
+    health_check_interval_seconds: float = Field(
+        5.0, alias="HEALTH_CHECK_INTERVAL_SECONDS"
+    )
+    # Таймаут одной проверки зависимости (секунды)
+    health_check_timeout_seconds: float = Field(
+        2.0, alias="HEALTH_CHECK_TIMEOUT_SECONDS"
+    )
+
+    # === Scheduler ===
+    # Период опроса источников celery beat-ом (секунды)
+    poll_interval_seconds: int = Field(300, alias="POLL_INTERVAL_SECONDS")
+    # Сколько пар (notification_id, payload) передавать в одну задачу notify_*
+    notify_batch_size: int = Field(500, alias="NOTIFY_BATCH_SIZE")
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
@@ -1,19 +1,78 @@
+import time
+
 from sqlalchemy import create_engine
-from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from src.shared.configs.get_settings import get_settings
+from src.shared.services.metrics import db_pool_checkout_duration
 
 settings = get_settings()
+
+
+class TimedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """
+    Пул соединений, замеряющий ожидание соединения при checkout.
+
+    В замер входит и открытие нового соединения, если пул его создаёт.
+    """
+
+    engine_label = "primary"
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            db_pool_checkout_duration.observe(
+                time.perf_counter() - started, engine=self.engine_label
+            )
+
+
+def _create_async_engine(url: str, label: str = "primary") -> AsyncEngine:
+    """
+    Асинхронный движок с пулом и кэшами подготовленных запросов из настроек.
+
+    Args:
+        url (str): DSN вида postgresql+asyncpg://...
+        label (str): Метка движка в метриках пула (primary/replica).
+
+    Returns:
+        AsyncEngine: Движок SQLAlchemy.
+    """
+    return create_async_engine(
+        url,
+        echo=settings.debug_db if hasattr(settings, "debug") else False,
+        future=True,
+        # подкласс нужен и после dispose(): пул пересоздаётся через свой класс
+        poolclass=type(
+            "TimedAsyncAdaptedQueuePool",
+            (TimedAsyncAdaptedQueuePool,),
+            {"engine_label": label},
+        ),
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_recycle=settings.db_pool_recycle,
+        pool_pre_ping=settings.db_pool_pre_ping,
+        connect_args={
+            # кэш SQLAlchemy-адаптера (имя запроса -> подготовленный запрос)
+            "prepared_statement_cache_size": settings.db_prepared_statement_cache_size,
+            # собственный LRU asyncpg; за PgBouncer в transaction mode оба — 0
+            "statement_cache_size": settings.db_statement_cache_size,
+        },
+    )
+
+
 # --- Асинхронный движок (для FastAPI) ---
-async_engine = create_async_engine(
-    settings.database_url,  #  type: ignore[misc]
-    echo=settings.debug_db if hasattr(settings, "debug") else False,
-    future=True,
-    pool_size=20,
-    max_overflow=10,
-    pool_timeout=30,
-    pool_recycle=1800,
-    pool_pre_ping=True,
+async_engine = _create_async_engine(settings.database_url)  #  type: ignore[arg-type]
+
+# --- Движок реплики для чтения (GET-запросы, извлечение правил) ---
+# без DATABASE_REPLICA_URL чтение идёт в основную базу тем же пулом
+async_read_engine = (
+    _create_async_engine(settings.database_replica_url, "replica")
+    if settings.database_replica_url
+    else async_engine
 )
 
 # --- Синхронный движок (для Alembic, скриптов, Celery и т.д.) ---
@@ -21,3 +80,10 @@ sync_engine = create_engine(
     settings.sync_database_url,  #  type: ignore[misc]
     echo=settings.debug_db if hasattr(settings, "debug") else False,
 )
+
+
+async def dispose_engines() -> None:
+    """Закрыть соединения обоих асинхронных движков."""
+    await async_engine.dispose()
+    if async_read_engine is not async_engine:
+        await async_read_engine.dispose()
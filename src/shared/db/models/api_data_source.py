@@ -1,4 +1,4 @@
-from sqlalchemy import Boolean, Integer, String
+from sqlalchemy import Boolean, Index, Integer, String, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -7,6 +7,11 @@ from src.shared.db.base import Base
 
 class Sources(Base):
     __tablename__ = "sources"
+    __table_args__ = (
+        Index("ix_sources_user_id_id", "user_id", "id"),
+        # list_active: WHERE is_active ORDER BY id
+        Index("ix_sources_id_active", "id", postgresql_where=text("is_active")),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     user_id: Mapped[int] = mapped_column(Integer, nullable=False)
@@ -25,8 +25,13 @@ class RefreshToken(Base):
     # __table_args__ = {"schema": "auth"}
 
     id: Mapped[int] = mapped_column(primary_key=True)
-    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"))
-    token: Mapped[str] = mapped_column(nullable=False)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), index=True)
+    # храним только SHA-256 токена: поиск по уникальному индексу, утечка БД не выдаёт токены
+    token_hash: Mapped[str] = mapped_column(String(64), unique=True, nullable=False)
+    # цепочка ротаций одного входа; при повторном использовании отзывается целиком
+    family_id: Mapped[str] = mapped_column(String(32), index=True, nullable=False)
     created_at: Mapped[datetime] = mapped_column(default=datetime.utcnow)
-    expires_at: Mapped[datetime]
+    expires_at: Mapped[datetime] = mapped_column(index=True)
     revoked: Mapped[bool] = mapped_column(default=False)
+    # от него считается срок хранения отозванного токена (см. JWTRepo.delete_expired)
+    revoked_at: Mapped[datetime | None] = mapped_column(nullable=True)
@@ -1,4 +1,4 @@
-from sqlalchemy import ARRAY, Boolean, Integer
+from sqlalchemy import ARRAY, Boolean, Index, Integer, UniqueConstraint, text
 from sqlalchemy.orm import Mapped, mapped_column, validates
 
 from src.shared.db.base import Base
@@ -6,6 +6,21 @@ from src.shared.db.base import Base
 
 class Rules(Base):
     __tablename__ = "rules"
+    __table_args__ = (
+        # ключ для INSERT ... ON CONFLICT при инкрементальной материализации
+        UniqueConstraint(
+            "user_id", "source_id", "trigger_id", name="uq_rules_user_source_trigger"
+        ),
+        # правила сработавших триггеров (notification_ids_by_trigger)
+        # и область materialize(trigger_ids=...)
+        Index(
+            "ix_rules_trigger_id_active",
+            "trigger_id",
+            postgresql_where=text("is_active"),
+        ),
+        # область materialize(source_ids=...); user_id покрыт уникальным ключом
+        Index("ix_rules_source_id", "source_id"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     user_id: Mapped[int | None] = mapped_column(Integer, nullable=True)
@@ -1,4 +1,4 @@
-from sqlalchemy import Boolean, Integer, String
+from sqlalchemy import Boolean, Index, Integer, String, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -7,6 +7,16 @@ from src.shared.db.base import Base
 
 class Triggers(Base):
     __tablename__ = "triggers"
+    __table_args__ = (
+        # списки пользователя: WHERE user_id ORDER BY id (keyset)
+        Index("ix_triggers_user_id_id", "user_id", "id"),
+        # активные триггеры опрашиваемых источников (list_active_specs)
+        Index(
+            "ix_triggers_source_id_active",
+            "source_id",
+            postgresql_where=text("is_active"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     user_id: Mapped[int] = mapped_column(Integer, nullable=False)
@@ -1,10 +1,11 @@
 from collections.abc import AsyncGenerator
 from contextlib import contextmanager
 
+from fastapi import Request
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlalchemy.orm import sessionmaker
 
-from src.shared.db.engine import async_engine, sync_engine
+from src.shared.db.engine import async_engine, async_read_engine, sync_engine
 
 AsyncSessionLocal = async_sessionmaker(
     bind=async_engine,
@@ -13,9 +14,29 @@ AsyncSessionLocal = async_sessionmaker(
     autocommit=False,
 )
 
+# Сессии только для чтения: реплика, если она настроена
+AsyncReadSessionLocal = async_sessionmaker(
+    bind=async_read_engine,
+    expire_on_commit=False,
+    autoflush=False,
+    autocommit=False,
+)
+
+READ_METHODS = frozenset({"GET", "HEAD"})
+
+
+async def get_async_session(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Сессия БД для запроса: GET/HEAD читают из реплики, остальные методы
+    работают с основной базой.
 
-async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
-    async with AsyncSessionLocal() as session:
+    Реплика может отставать на время репликации, поэтому чтение сразу
+    после записи через другой запрос может вернуть старые данные.
+    """
+    factory = (
+        AsyncReadSessionLocal if request.method in READ_METHODS else AsyncSessionLocal
+    )
+    async with factory() as session:
         yield session
 
 
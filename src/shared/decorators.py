@@ -1,14 +1,47 @@
 import functools
 import logging
+import time
 from collections.abc import Awaitable
+from string import Formatter
 from typing import Any, Callable
 
 from pydantic import BaseModel
 
 errors_logger = logging.getLogger("errors_log")
 
-
-def log_action(msg: str, logger: logging.Logger):
+_MISSING = object()
+
+
+def _template_fields(msg: str) -> tuple[str, ...]:
+    """Имена верхнего уровня из шаблона `str.format` (`{user.name}` -> `user`)."""
+    names = []
+    for _, field, _, _ in Formatter().parse(msg):
+        if field:
+            name = field.split(".", 1)[0].split("[", 1)[0]
+            if name and name not in names:
+                names.append(name)
+    return tuple(names)
+
+
+def _lookup(name: str, kwargs: dict[str, Any]) -> Any:
+    """Значение поля шаблона: аргумент функции или поле pydantic-модели/словаря."""
+    if name in kwargs:
+        return kwargs[name]
+    for value in kwargs.values():
+        if isinstance(value, BaseModel):
+            if name in type(value).model_fields:
+                return getattr(value, name)
+        elif isinstance(value, dict) and name in value:
+            return value[name]
+    return _MISSING
+
+
+def log_action(
+    msg: str,
+    logger: logging.Logger,
+    level: int = logging.INFO,
+    duration: bool = False,
+):
     """
     Асинхронный декоратор для логирования действий в обработчиках FastAPI или других корутинах.
 
@@ -18,13 +51,17 @@ def log_action(msg: str, logger: logging.Logger):
 
     Аргументы:
         msg (str):
-            Шаблон сообщения для логирования.
-            Поддерживает подстановку аргументов функции через `.format(**kwargs)`.
-            Например: "Update source {source_id} by user {user_id}".
+            Шаблон сообщения для логирования в формате `str.format`.
+            Подставляются аргументы функции и поля переданных ей pydantic-моделей
+            и словарей. Например: "Update source {source_id} by user {user_id}".
         logger (logging.Logger):
             Объект логгера, в который будет отправлено сообщение.
             Можно использовать разные логгеры для разных частей приложения
             (например, `logging.getLogger("auth")`, `logging.getLogger("access")`).
+        level (int):
+            Уровень записи (по умолчанию INFO).
+        duration (bool):
+            Добавить к записи поле `duration_ms` — время выполнения функции.
 
     Использование:
         import logging
@@ -42,34 +79,41 @@ def log_action(msg: str, logger: logging.Logger):
         - Сообщение логируется только после успешного выполнения функции.
         - Если внутри функции произошло исключение, в логгер записывается сообщение
           уровня ERROR с трассировкой стека.
-        - Если в шаблоне `msg` указаны переменные, которых нет в kwargs функции,
-          они игнорируются, и в лог попадает исходный шаблон.
+        - Имена полей шаблона разбираются один раз при декорировании; при вызове
+          достаются только они, без копирования аргументов и `model_dump`.
+        - Если логгер отбросит запись по уровню, сообщение не собирается.
+        - Если в шаблоне `msg` указаны переменные, которых нет среди аргументов
+          функции, в лог попадает исходный шаблон.
     """
+    fields = _template_fields(msg)
 
     def decorator(func: Callable[..., Awaitable[Any]]):
         @functools.wraps(func)
         async def wrapper(*args, **kwargs):
-            ctx: dict[str, Any] = dict(kwargs)
-
-            for v in kwargs.values():
-                if isinstance(v, BaseModel):
-                    ctx.update(v.model_dump(exclude_unset=True))
-                elif isinstance(v, dict):
-                    ctx.update(v)
-
-            try:
-                text = msg.format(**ctx)
-            except KeyError:
-                text = msg
-
+            started = time.perf_counter() if duration else 0.0
             try:
                 result = await func(*args, **kwargs)
-                logger.info(text)
-                return result
             except Exception:
                 errors_logger.exception(f"Errors in functions -- {func.__name__}")
                 raise
 
+            if logger.isEnabledFor(level):
+                text = msg
+                if fields:
+                    ctx = {name: _lookup(name, kwargs) for name in fields}
+                    if all(value is not _MISSING for value in ctx.values()):
+                        try:
+                            text = msg.format_map(ctx)
+                        except (AttributeError, IndexError, KeyError, ValueError):
+                            text = msg
+                extra = None
+                if duration:
+                    extra = {
+                        "duration_ms": round((time.perf_counter() - started) * 1000, 3)
+                    }
+                logger.log(level, text, extra=extra)
+            return result
+
         return wrapper
 
     return decorator
@@ -2,7 +2,7 @@ from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jose import JWTError
 
-from src.shared.services.jwt_service import decode_token
+from src.shared.services.token_verifier import token_verifier
 
 token_scheme = HTTPBearer()
 
@@ -20,11 +20,11 @@ async def authenticate_user(
         dict: Расшифрованный payload из токена.
 
     Raises:
-        HTTPException: Если токен некорректен или просрочен.
+        HTTPException: Если токен некорректен, просрочен или отозван.
     """
     token = credentials.credentials
     try:
-        return decode_token(token)
+        return await token_verifier.verify(token)
     except JWTError as exc:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -1,21 +1,13 @@
-import os
-
 import redis.asyncio as redis
 from fastapi import Depends
 
+from src.shared.services.redis_pool import shared_redis_pool
 from src.shared.services.redis_service import RedisService
 
-REDIS_URL_ENV = "REDIS_URL"
-DEFAULT_REDIS_URL = "redis://localhost:6379/0"
-
 
-async def get_redis_client():
-    url = os.getenv(REDIS_URL_ENV, DEFAULT_REDIS_URL)
-    client = redis.from_url(url, decode_responses=True)
-    try:
-        yield client
-    finally:
-        await client.aclose()
+async def get_redis_client() -> redis.Redis:
+    # Клиент общий: соединение возвращается в пул после каждой команды
+    return shared_redis_pool.client
 
 
 async def get_redis_service(
@@ -0,0 +1,93 @@
+from dataclasses import dataclass
+from typing import Any
+
+from fastapi import HTTPException, Query, Response, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+from src.shared.configs.get_settings import get_settings
+
+settings = get_settings()
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+@dataclass(frozen=True)
+class PageParams:
+    """Параметры страницы списка: размер, курсор и проекция колонок."""
+
+    limit: int
+    cursor: int | None = None
+    fields: list[str] | None = None
+
+
+def get_page_params(schema: type[BaseModel]):
+    """
+    Фабрика зависимости с параметрами страницы для списка объектов `schema`.
+
+    Args:
+        schema (type[BaseModel]): Схема ответа; `fields` можно выбирать
+            только из её полей.
+
+    Returns:
+        Callable: Зависимость FastAPI, возвращающая `PageParams`.
+    """
+    allowed = set(schema.model_fields)
+
+    async def _get(
+        limit: int = Query(
+            settings.list_page_size,
+            ge=1,
+            le=settings.list_page_size_max,
+            description="Размер страницы",
+        ),
+        cursor: int | None = Query(
+            None,
+            ge=0,
+            description=f"ID последнего объекта предыдущей страницы "
+            f"(из заголовка {NEXT_CURSOR_HEADER})",
+        ),
+        fields: str | None = Query(
+            None, description="Поля через запятую, например `id,name,is_active`"
+        ),
+    ) -> PageParams:
+        names = None
+        if fields:
+            names = [name.strip() for name in fields.split(",") if name.strip()]
+            unknown = sorted(set(names) - allowed)
+            if unknown:
+                raise HTTPException(
+                    status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                    detail=f"Unknown fields: {', '.join(unknown)}",
+                )
+        return PageParams(limit=limit, cursor=cursor, fields=names)
+
+    return _get
+
+
+def page_response(
+    response: Response,
+    items: list[Any],
+    next_cursor: int | None,
+    page: PageParams,
+):
+    """
+    Отдать страницу списка.
+
+    Курсор следующей страницы передаётся в заголовке `X-Next-Cursor`
+    (на последней странице заголовка нет), тело остаётся списком объектов.
+    При проекции (`fields`) строки отдаются как есть, минуя `response_model`,
+    иначе FastAPI потребовал бы все обязательные поля схемы.
+
+    Args:
+        response (Response): Ответ эндпоинта (для заголовков).
+        items (list[Any]): Объекты страницы.
+        next_cursor (int | None): Курсор следующей страницы.
+        page (PageParams): Параметры запроса.
+    """
+    headers = {} if next_cursor is None else {NEXT_CURSOR_HEADER: str(next_cursor)}
+    if page.fields:
+        return JSONResponse(jsonable_encoder(items), headers=headers)
+    response.headers.update(headers)
+    return items
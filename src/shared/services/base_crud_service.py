@@ -10,7 +10,11 @@ class BaseCRUDService(Generic[RepoType]):
     async def create(self, data, user_id=None):
         if not data.get("user_id") or data["user_id"] == 0:
             data["user_id"] = user_id
-        return await self.repo.create(data)
+        obj = await self.repo.create(data)
+        if obj is not None:
+            await self.on_change(obj.id, obj, user_id)
+        await self.repo.session.commit()
+        return obj
 
     async def get(self, obj_id: int, user_id=None):
         return await self.repo.get(obj_id, user_id)
@@ -18,8 +22,32 @@ class BaseCRUDService(Generic[RepoType]):
     async def list(self, user_id=None):
         return await self.repo.list(user_id)
 
+    async def list_page(self, user_id=None, after_id=None, limit=50, columns=None):
+        return await self.repo.list_page(user_id, after_id, limit, columns)
+
     async def update(self, obj_id: int, data, user_id=None):
-        return await self.repo.update(obj_id, data, user_id)
+        obj = await self.repo.update(obj_id, data, user_id)
+        if obj is not None:
+            await self.on_change(obj_id, obj, user_id)
+        await self.repo.session.commit()
+        return obj
 
     async def delete(self, obj_id: int, user_id=None):
-        return await self.repo.delete(obj_id, user_id)
+        deleted = await self.repo.delete(obj_id, user_id)
+        if deleted:
+            await self.on_change(obj_id, None, user_id)
+        await self.repo.session.commit()
+        return deleted
+
+    async def on_change(self, obj_id: int, obj=None, user_id=None):
+        """
+        Хук после успешного create/update/delete.
+
+        Выполняется в транзакции изменения до коммита: если хук падает,
+        изменение не сохраняется.
+
+        Args:
+            obj_id (int): ID изменённого объекта.
+            obj: Объект после изменения (None после удаления).
+            user_id: ID пользователя из запроса.
+        """
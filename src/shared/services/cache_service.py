@@ -0,0 +1,133 @@
+import asyncio
+import json
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from src.shared.services.redis_service import RedisService
+
+errors_logger = logging.getLogger("errors_log")
+
+_MISS = object()
+
+
+class TTLCache:
+    """In-process LRU кэш с временем жизни записей."""
+
+    def __init__(self, maxsize: int = 1024):
+        """
+        Args:
+            maxsize (int): Максимум записей; самые давние вытесняются.
+        """
+        self.maxsize = maxsize
+        self._data: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        item = self._data.get(key)
+        if item is None:
+            return default
+        expires_at, value = item
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+
+class ResponseCache:
+    """
+    Двухуровневый кэш ответов внешних API с объединением запросов.
+
+    Сначала проверяется локальный LRU, затем Redis (общий для всех
+    воркеров). Конкурентные промахи по одному ключу ждут один и тот же
+    запрос к провайдеру (single-flight).
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        maxsize: int = 1024,
+        redis: RedisService | None = None,
+    ):
+        """
+        Args:
+            namespace (str): Префикс ключей в Redis.
+            maxsize (int): Размер локального LRU.
+            redis (RedisService | None): Общий кэш воркеров. Без него
+                используется только локальный уровень.
+        """
+        self.namespace = namespace
+        self.local = TTLCache(maxsize)
+        self.redis = redis
+        self._inflight: dict[str, asyncio.Future] = {}
+
+    def bind_redis(self, redis: RedisService | None) -> None:
+        """Подключить (или отключить) Redis-уровень кэша."""
+        self.redis = redis
+
+    async def get_or_fetch(
+        self, key: str, ttl: float, fetch: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """
+        Вернуть значение из кэша или получить его через `fetch`.
+
+        Args:
+            key (str): Ключ кэша (без namespace).
+            ttl (float): Время жизни значения в секундах.
+            fetch (Callable): Корутина-фабрика запроса к провайдеру.
+                Результат должен сериализоваться в JSON.
+
+        Returns:
+            Any: Закэшированный или свежий ответ.
+        """
+        value = self.local.get(key, _MISS)
+        if value is not _MISS:
+            return value
+
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._load(key, ttl, fetch))
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # shield: отмена одного ожидающего не должна отменять общий запрос
+        return await asyncio.shield(future)
+
+    async def _load(
+        self, key: str, ttl: float, fetch: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        redis_key = f"{self.namespace}:{key}"
+        if self.redis is not None:
+            try:
+                raw, remaining = await self.redis.get_with_ttl(redis_key)
+            except Exception as exc:  # noqa: BLE001
+                errors_logger.warning(f"Cache read {redis_key} failed: {exc}")
+                raw, remaining = None, None
+            if raw is not None:
+                value = json.loads(raw)
+                # локальная копия не переживает запись Redis: иначе значение
+                # отдавалось бы до ~2×ttl с момента запроса к провайдеру
+                self.local.set(key, value, min(ttl, remaining or ttl))
+                return value
+
+        value = await fetch()
+        self.local.set(key, value, ttl)
+        if self.redis is not None:
+            try:
+                await self.redis.set(redis_key, json.dumps(value), int(ttl))
+            except Exception as exc:  # noqa: BLE001
+                errors_logger.warning(f"Cache write {redis_key} failed: {exc}")
+        return value
@@ -0,0 +1,229 @@
+import asyncio
+import importlib.util
+import logging
+import random
+import time
+from dataclasses import dataclass
+from urllib.parse import urlsplit
+
+import httpx
+import redis.asyncio as redis
+
+from src.shared.configs.get_settings import get_settings
+from src.shared.services.redis_pool import shared_redis_pool
+
+settings = get_settings()
+errors_logger = logging.getLogger("errors_log")
+
+RATE_PREFIX = "ratelimit:"
+
+
+class TokenBucket:
+    """
+    Асинхронный token bucket: не более `rate` запросов в секунду
+    с допустимым всплеском до `capacity`.
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None):
+        """
+        Args:
+            rate (float): Скорость пополнения (токенов в секунду).
+            capacity (float | None): Размер корзины. По умолчанию max(rate, 1).
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = capacity or max(rate, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock: asyncio.Lock | None = None
+
+    async def acquire(self) -> None:
+        """Дождаться свободного токена и забрать его."""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class RedisRateLimiter:
+    """
+    Квота запросов в минуту, общая для всех процессов.
+
+    Счётчик фиксированного окна (минута) в Redis: INCR ключа окна, и если
+    квота окна исчерпана — ожидание начала следующего окна. Так квота
+    провайдера соблюдается суммарно по всем воркерам uvicorn и Celery,
+    а не умножается на их число. Если Redis недоступен, проверка
+    пропускается: остаётся локальный `TokenBucket` процесса.
+    """
+
+    def __init__(
+        self, name: str, rate_per_minute: int, redis_client: redis.Redis | None = None
+    ):
+        """
+        Args:
+            name (str): Имя квоты (часть ключа Redis).
+            rate_per_minute (int): Запросов в минуту на все процессы.
+            redis_client (redis.Redis | None): Клиент Redis. По умолчанию
+                общий пул процесса.
+        """
+        self.name = name
+        self.rate_per_minute = rate_per_minute
+        self._redis = redis_client
+
+    @property
+    def redis(self) -> redis.Redis:
+        return self._redis or shared_redis_pool.client
+
+    async def acquire(self) -> None:
+        """Дождаться места в квоте текущей минуты и занять его."""
+        while True:
+            now = time.time()
+            window = int(now // 60)
+            key = f"{RATE_PREFIX}{self.name}:{window}"
+            try:
+                pipe = self.redis.pipeline(transaction=False)
+                pipe.incr(key)
+                pipe.expire(key, 120)
+                count, _ = await pipe.execute()
+            except (redis.RedisError, OSError) as exc:
+                errors_logger.warning(f"Shared rate limit {self.name} skipped: {exc}")
+                return
+            if count <= self.rate_per_minute:
+                return
+            # разброс, чтобы ждущие процессы не пришли в новое окно разом
+            await asyncio.sleep((window + 1) * 60 - now + random.uniform(0, 1))
+
+
+@dataclass
+class HostLimit:
+    concurrency: int
+    rate_per_minute: int | None = None
+    semaphore: asyncio.Semaphore | None = None
+    bucket: TokenBucket | None = None
+    shared: RedisRateLimiter | None = None
+
+    def reset(self) -> None:
+        """Пересоздать примитивы синхронизации (они привязаны к event loop)."""
+        self.semaphore = asyncio.Semaphore(self.concurrency)
+        self.bucket = (
+            TokenBucket(self.rate_per_minute / 60) if self.rate_per_minute else None
+        )
+
+
+class SharedHttpClient:
+    """
+    Общий на процесс `httpx.AsyncClient` с keep-alive пулом соединений,
+    ограничением параллельных запросов на хост и rate limit по квоте провайдера.
+
+    Клиент создаётся лениво при первом запросе и закрывается в lifespan
+    приложения (или в конце задачи Celery).
+    """
+
+    def __init__(
+        self,
+        timeout: float = settings.http_timeout,
+        max_connections: int = settings.http_max_connections,
+        max_keepalive_connections: int = settings.http_max_keepalive_connections,
+        per_host_concurrency: int = settings.http_per_host_concurrency,
+        http2: bool = settings.http_http2,
+    ):
+        self.timeout = timeout
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+        )
+        self.per_host_concurrency = per_host_concurrency
+        # HTTP/2 требует пакет h2 (httpx[http2]); без него остаёмся на HTTP/1.1
+        self.http2 = http2 and importlib.util.find_spec("h2") is not None
+        self._client: httpx.AsyncClient | None = None
+        self._hosts: dict[str, HostLimit] = {}
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout, limits=self.limits, http2=self.http2
+            )
+        return self._client
+
+    def limit_host(
+        self,
+        host: str,
+        concurrency: int | None = None,
+        rate_per_minute: int | None = None,
+        shared: bool = False,
+    ) -> None:
+        """
+        Задать лимиты для хоста.
+
+        Args:
+            host (str): Имя хоста (например, "api.openweathermap.org").
+            concurrency (int | None): Максимум одновременных запросов
+                (на процесс).
+            rate_per_minute (int | None): Квота запросов в минуту.
+            shared (bool): Квота общая для всех процессов (через Redis);
+                иначе она действует в каждом процессе отдельно.
+        """
+        self._hosts[host] = HostLimit(
+            concurrency or self.per_host_concurrency,
+            rate_per_minute,
+            shared=(
+                RedisRateLimiter(host, rate_per_minute)
+                if shared and rate_per_minute
+                else None
+            ),
+        )
+
+    def _host_limit(self, url: str) -> HostLimit:
+        host = urlsplit(url).hostname or ""
+        limit = self._hosts.get(host)
+        if limit is None:
+            limit = self._hosts[host] = HostLimit(self.per_host_concurrency)
+        if limit.semaphore is None:
+            limit.reset()
+        return limit
+
+    async def request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """
+        Выполнить запрос через общий пул с учётом лимитов хоста.
+
+        Args:
+            method (str): HTTP-метод.
+            url (str): Абсолютный адрес.
+            **kwargs: Параметры `httpx.AsyncClient.request`.
+
+        Returns:
+            httpx.Response: Ответ сервиса.
+        """
+        limit = self._host_limit(url)
+        async with limit.semaphore:  # type: ignore[union-attr]
+            if limit.bucket is not None:
+                await limit.bucket.acquire()
+            if limit.shared is not None:
+                await limit.shared.acquire()
+            return await self.client.request(method=method, url=url, **kwargs)
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def close(self) -> None:
+        """Закрыть пул соединений и сбросить примитивы синхронизации."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        for limit in self._hosts.values():
+            limit.semaphore = None
+            limit.bucket = None
+
+
+shared_http_client = SharedHttpClient()
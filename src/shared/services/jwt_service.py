@@ -1,4 +1,6 @@
+import hashlib
 from datetime import datetime, timedelta
+from uuid import uuid4
 
 from jose import jwt
 
@@ -19,6 +21,8 @@ def create_token(data: dict, expires_delta: timedelta) -> str:
         str: JWT токен.
     """
     to_encode = data.copy()
+    # jti — идентификатор токена для списка отзыва
+    to_encode.setdefault("jti", uuid4().hex)
     expire = datetime.utcnow() + expires_delta
     to_encode["exp"] = expire
     return jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
@@ -71,3 +75,16 @@ def decode_token(token: str):
         JWTError: Если токен недействителен или истёк.
     """
     return jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
+
+
+def token_digest(token: str) -> str:
+    """
+    SHA-256 токена в hex — ключ для хранения и поиска без самого токена.
+
+    Args:
+        token (str): JWT токен.
+
+    Returns:
+        str: 64 hex-символа.
+    """
+    return hashlib.sha256(token.encode()).hexdigest()
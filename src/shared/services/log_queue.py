@@ -0,0 +1,137 @@
+import logging
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+DROPPED_LOGGER = "errors_log"
+
+
+class DroppingQueueHandler(QueueHandler):
+    """
+    Кладёт записи в ограниченную очередь и никогда не блокирует вызывающий
+    поток: если очередь заполнена, запись отбрасывается и учитывается в
+    `dropped`.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+        self._lock = threading.Lock()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Очередь внутри процесса: достаточно подставить аргументы, чтобы
+        # запись не зависела от объектов, которые изменятся позже.
+        # Форматирование и трассировка стека — в потоке записи.
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+
+
+class BatchedRotatingFileHandler(RotatingFileHandler):
+    """
+    RotatingFileHandler без flush и stat на каждую запись.
+
+    Размер файла отслеживается счётчиком, поэтому проверка ротации не
+    делает системных вызовов; буфер сбрасывается на диск в `flush`,
+    который вызывает `BatchingQueueListener` один раз на пачку.
+    """
+
+    def _open(self):
+        stream = super()._open()
+        self._size = stream.seek(0, 2)
+        return stream
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            msg = self.format(record) + self.terminator
+            size = len(msg.encode(self.encoding or "utf-8", "replace"))
+            if self.maxBytes > 0 and self._size and self._size + size > self.maxBytes:
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+            self.stream.write(msg)
+            self._size += size
+        except Exception:  # noqa: BLE001
+            self.handleError(record)
+
+
+class BatchingQueueListener(QueueListener):
+    """
+    Фоновый поток записи логов: забирает из очереди до `batch_size` записей
+    за раз, раздаёт их обработчикам и делает один flush на пачку. Об
+    отброшенных при переполнении записях пишет в `errors_log`.
+    """
+
+    def __init__(
+        self,
+        log_queue: queue.Queue,
+        *handlers: logging.Handler,
+        batch_size: int = 256,
+        source: DroppingQueueHandler | None = None,
+    ):
+        super().__init__(log_queue, *handlers, respect_handler_level=True)
+        self.batch_size = batch_size
+        self.source = source
+        self._reported_dropped = 0
+
+    def enqueue_sentinel(self) -> None:
+        # очередь может быть заполнена — ждём, пока поток записи её разберёт
+        self.queue.put(self._sentinel)
+
+    def _monitor(self) -> None:
+        q = self.queue
+        stop = False
+        while not stop:
+            batch = [q.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(q.get_nowait())
+                except queue.Empty:
+                    break
+            for record in batch:
+                if record is self._sentinel:
+                    stop = True
+                else:
+                    self.handle(record)
+            self._report_dropped()
+            for handler in self.handlers:
+                handler.flush()
+
+    def _report_dropped(self) -> None:
+        if self.source is None:
+            return
+        dropped = self.source.dropped
+        if dropped > self._reported_dropped:
+            self.handle(
+                logging.makeLogRecord(
+                    {
+                        "name": DROPPED_LOGGER,
+                        "levelno": logging.ERROR,
+                        "levelname": "ERROR",
+                        "msg": f"Log queue overflow: dropped "
+                        f"{dropped - self._reported_dropped} records",
+                    }
+                )
+            )
+            self._reported_dropped = dropped
+
+    def stats(self) -> dict[str, int]:
+        """
+        Состояние очереди логов.
+
+        Returns:
+            dict[str, int]: queued (ждут записи) и dropped (отброшено всего).
+        """
+        return {
+            "queued": self.queue.qsize(),
+            "dropped": self.source.dropped if self.source else 0,
+        }
@@ -0,0 +1,354 @@
+import json
+import logging
+import math
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable, Sequence
+
+import redis.asyncio as redis
+
+errors_logger = logging.getLogger("errors_log")
+
+PUSH_PREFIX = "metrics:"
+
+# Границы гистограмм задержек (в секундах)
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+Sample = tuple[str, dict[str, str], float]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_sample(name: str, labels: dict[str, str], value: float) -> str:
+    if labels:
+        pairs = ",".join(f'{k}="{_escape(str(v))}"' for k, v in labels.items())
+        name = f"{name}{{{pairs}}}"
+    if math.isinf(value):
+        text = "+Inf" if value > 0 else "-Inf"
+    else:
+        text = repr(float(value))
+    return f"{name} {text}"
+
+
+def _format_le(bound: float) -> str:
+    return "+Inf" if math.isinf(bound) else repr(float(bound))
+
+
+class _Metric(ABC):
+    kind = ""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        shared: bool = False,
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        # значения из воркеров Celery приходят через Redis (см. `push`)
+        self.shared = shared
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict[str, str]) -> tuple[str, ...]:
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _labels(self, key: Sequence[str]) -> dict[str, str]:
+        return dict(zip(self.labelnames, key, strict=True))
+
+    @property
+    def family_name(self) -> str:
+        """Имя семейства в строках HELP/TYPE."""
+        return self.name
+
+    @abstractmethod
+    def fields(self) -> dict[str, float]:
+        """Текущие значения в виде полей хэша Redis (для `push`)."""
+
+    @abstractmethod
+    def samples(self, pushed: dict[str, float] | None = None) -> list[Sample]:
+        """Строки экспозиции с учётом значений, присланных воркерами."""
+
+
+class Counter(_Metric):
+    """Монотонно растущий счётчик."""
+
+    kind = "counter"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    @property
+    def family_name(self) -> str:
+        # как в prometheus_client: TYPE объявляется для имени с `_total`,
+        # иначе парсер считает ряды `<name>_total` нетипизированными
+        return f"{self.name}_total"
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def fields(self) -> dict[str, float]:
+        with self._lock:
+            return {json.dumps(key): value for key, value in self._values.items()}
+
+    def samples(self, pushed: dict[str, float] | None = None) -> list[Sample]:
+        totals = {json.dumps(key): value for key, value in self._values.items()}
+        for field, value in (pushed or {}).items():
+            totals[field] = totals.get(field, 0.0) + value
+        return [
+            (f"{self.name}_total", self._labels(json.loads(field)), value)
+            for field, value in sorted(totals.items())
+        ]
+
+
+class Histogram(_Metric):
+    """Распределение значений по фиксированным корзинам."""
+
+    kind = "histogram"
+
+    def __init__(self, *args, buckets: Sequence[float] = LATENCY_BUCKETS, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.buckets = (*sorted(buckets), math.inf)
+        # по ключу меток: счётчики корзин (не накопительные), сумма, количество
+        self._values: dict[tuple[str, ...], list[float]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        index = next(i for i, bound in enumerate(self.buckets) if value <= bound)
+        with self._lock:
+            row = self._values.get(key)
+            if row is None:
+                row = self._values[key] = [0.0] * (len(self.buckets) + 2)
+            row[index] += 1
+            row[-2] += value
+            row[-1] += 1
+
+    def time(self, **labels: str) -> "_Timer":
+        """Контекстный менеджер, замеряющий время блока."""
+        return _Timer(self, labels)
+
+    def fields(self) -> dict[str, float]:
+        with self._lock:
+            return {
+                f"{i}|{json.dumps(key)}": value
+                for key, row in self._values.items()
+                for i, value in enumerate(row)
+            }
+
+    def samples(self, pushed: dict[str, float] | None = None) -> list[Sample]:
+        rows = {key: list(row) for key, row in self._values.items()}
+        for field, value in (pushed or {}).items():
+            index, _, raw_key = field.partition("|")
+            key = tuple(json.loads(raw_key))
+            row = rows.setdefault(key, [0.0] * (len(self.buckets) + 2))
+            if int(index) < len(row):
+                row[int(index)] += value
+
+        samples: list[Sample] = []
+        for key, row in sorted(rows.items()):
+            labels = self._labels(key)
+            cumulative = 0.0
+            for bound, count in zip(self.buckets, row, strict=False):
+                cumulative += count
+                samples.append(
+                    (
+                        f"{self.name}_bucket",
+                        {**labels, "le": _format_le(bound)},
+                        cumulative,
+                    )
+                )
+            samples.append((f"{self.name}_sum", labels, row[-2]))
+            samples.append((f"{self.name}_count", labels, row[-1]))
+        return samples
+
+
+class _Timer:
+    def __init__(self, histogram: Histogram, labels: dict[str, str]):
+        self.histogram = histogram
+        self.labels = labels
+
+    def __enter__(self) -> "_Timer":
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.histogram.observe(time.perf_counter() - self.started, **self.labels)
+
+
+class MetricsRegistry:
+    """
+    Реестр метрик процесса с экспозицией в текстовом формате Prometheus.
+
+    Счётчики и гистограммы обновляются на горячем пути; значения-снимки
+    (размеры пулов, длины очередей) собираются коллекторами только в момент
+    запроса `/metrics`. Метрики с `shared=True` обновляются в воркерах
+    Celery: воркер после задачи отправляет приращения в Redis (`push`),
+    а API суммирует их со своими значениями при выдаче (`render`).
+    """
+
+    def __init__(self):
+        self._metrics: dict[str, _Metric] = {}
+        self._collectors: list[Callable] = []
+        self._pushed: dict[str, dict[str, float]] = {}
+
+    def counter(self, name: str, documentation: str, labelnames=(), shared=False):
+        return self._register(Counter(name, documentation, labelnames, shared))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames=(),
+        shared=False,
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ):
+        return self._register(
+            Histogram(name, documentation, labelnames, shared, buckets=buckets)
+        )
+
+    def _register(self, metric):
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def collector(self, func: Callable) -> Callable:
+        """
+        Зарегистрировать коллектор значений-снимков.
+
+        Коллектор — корутина-функция без аргументов, возвращающая
+        итерируемое из (имя, тип, описание, [(метки, значение), ...]).
+        """
+        self._collectors.append(func)
+        return func
+
+    async def push(self, client: redis.Redis) -> None:
+        """Отправить в Redis приращения shared-метрик с прошлой отправки."""
+        pipe = client.pipeline(transaction=False)
+        sent: dict[str, dict[str, float]] = {}
+        for metric in self._metrics.values():
+            if not metric.shared:
+                continue
+            last = self._pushed.get(metric.name, {})
+            current = metric.fields()
+            for field, value in current.items():
+                delta = value - last.get(field, 0.0)
+                if delta:
+                    pipe.hincrbyfloat(f"{PUSH_PREFIX}{metric.name}", field, delta)
+            sent[metric.name] = current
+        if len(pipe):
+            await pipe.execute()
+        self._pushed.update(sent)
+
+    async def _pulled(self, client: redis.Redis | None) -> dict[str, dict]:
+        shared = [m.name for m in self._metrics.values() if m.shared]
+        if client is None or not shared:
+            return {}
+        try:
+            pipe = client.pipeline(transaction=False)
+            for name in shared:
+                pipe.hgetall(f"{PUSH_PREFIX}{name}")
+            rows = await pipe.execute()
+        except redis.RedisError as exc:
+            errors_logger.warning(f"Reading pushed metrics failed: {exc}")
+            return {}
+        return {
+            name: {field: float(value) for field, value in row.items()}
+            for name, row in zip(shared, rows, strict=True)
+        }
+
+    async def render(self, client: redis.Redis | None = None) -> str:
+        """
+        Текстовая экспозиция всех метрик.
+
+        Args:
+            client (redis.Redis | None): Redis, из которого берутся значения
+                shared-метрик воркеров.
+        """
+        pulled = await self._pulled(client)
+        lines: list[str] = []
+        for metric in self._metrics.values():
+            self._family(
+                lines,
+                metric.family_name,
+                metric.kind,
+                metric.documentation,
+                metric.samples(pulled.get(metric.name)),
+            )
+        for collect in self._collectors:
+            try:
+                families = await collect()
+            except Exception as exc:  # noqa: BLE001
+                errors_logger.warning(f"Metrics collector {collect.__name__}: {exc}")
+                continue
+            for name, kind, documentation, values in families:
+                self._family(
+                    lines,
+                    name,
+                    kind,
+                    documentation,
+                    [(name, labels, value) for labels, value in values],
+                )
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _family(
+        lines: list[str],
+        name: str,
+        kind: str,
+        documentation: str,
+        samples: Iterable[Sample],
+    ) -> None:
+        lines.append(f"# HELP {name} {documentation}")
+        lines.append(f"# TYPE {name} {kind}")
+        lines.extend(_format_sample(*sample) for sample in samples)
+
+
+metrics = MetricsRegistry()
+
+http_request_duration = metrics.histogram(
+    "http_request_duration_seconds",
+    "Время обработки HTTP-запроса",
+    ("method", "route", "status"),
+)
+db_pool_checkout_duration = metrics.histogram(
+    "db_pool_checkout_seconds",
+    "Ожидание соединения из пула БД",
+    ("engine",),
+)
+redis_command_duration = metrics.histogram(
+    "redis_command_duration_seconds",
+    "Время выполнения команды Redis",
+    ("command",),
+)
+upstream_request_duration = metrics.histogram(
+    "upstream_request_duration_seconds",
+    "Время запроса к внешнему API",
+    ("upstream", "endpoint"),
+    shared=True,
+)
+upstream_request_errors = metrics.counter(
+    "upstream_request_errors",
+    "Ошибки запросов к внешнему API",
+    ("upstream", "endpoint", "reason"),
+    shared=True,
+)
+trigger_evaluations = metrics.counter(
+    "trigger_evaluations",
+    "Проверено триггеров",
+    ("trigger_type",),
+    shared=True,
+)
+triggers_fired = metrics.counter(
+    "triggers_fired",
+    "Сработало триггеров",
+    ("trigger_type",),
+    shared=True,
+)
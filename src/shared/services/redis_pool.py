@@ -0,0 +1,115 @@
+import os
+import time
+
+import redis.asyncio as redis
+
+from src.shared.configs.get_settings import get_settings
+from src.shared.services.metrics import redis_command_duration
+
+settings = get_settings()
+
+REDIS_URL_ENV = "REDIS_URL"
+DEFAULT_REDIS_URL = "redis://localhost:6379/0"
+
+
+class InstrumentedRedis(redis.Redis):
+    """Клиент Redis, замеряющий время каждой команды (вместе с ожиданием пула)."""
+
+    async def execute_command(self, *args, **options):
+        started = time.perf_counter()
+        try:
+            return await super().execute_command(*args, **options)
+        finally:
+            redis_command_duration.observe(
+                time.perf_counter() - started, command=str(args[0]).upper()
+            )
+
+
+class SharedRedisPool:
+    """
+    Общий на процесс пул соединений Redis.
+
+    Запросы API и задачи Celery берут соединение из пула и возвращают его
+    после команды, вместо того чтобы открывать новое соединение на каждый
+    запрос. При исчерпании пула вызывающий ждёт свободное соединение
+    до `timeout` секунд (BlockingConnectionPool).
+
+    Пул создаётся лениво и закрывается в lifespan приложения
+    (или в конце задачи Celery).
+    """
+
+    def __init__(
+        self,
+        url: str | None = None,
+        max_connections: int = settings.redis_max_connections,
+        timeout: float = settings.redis_pool_timeout,
+        health_check_interval: int = settings.redis_health_check_interval,
+    ):
+        """
+        Args:
+            url (str | None): URL Redis. По умолчанию переменная REDIS_URL.
+            max_connections (int): Максимум соединений в пуле.
+            timeout (float): Сколько ждать свободного соединения (в секундах).
+            health_check_interval (int): Через сколько секунд простоя
+                соединение проверяется PING перед использованием.
+        """
+        self.url = url
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self.health_check_interval = health_check_interval
+        self._pool: redis.BlockingConnectionPool | None = None
+        self._client: redis.Redis | None = None
+
+    @property
+    def pool(self) -> redis.BlockingConnectionPool:
+        if self._pool is None:
+            self._pool = redis.BlockingConnectionPool.from_url(
+                self.url or os.getenv(REDIS_URL_ENV, DEFAULT_REDIS_URL),
+                max_connections=self.max_connections,
+                timeout=self.timeout,
+                health_check_interval=self.health_check_interval,
+                decode_responses=True,
+            )
+        return self._pool
+
+    @property
+    def client(self) -> redis.Redis:
+        """Клиент Redis поверх общего пула (закрывать его не нужно)."""
+        if self._client is None:
+            self._client = InstrumentedRedis(connection_pool=self.pool)
+        return self._client
+
+    def stats(self) -> dict[str, int]:
+        """
+        Текущее состояние пула.
+
+        Returns:
+            dict[str, int]: max, created, in_use и idle соединения.
+        """
+        if self._pool is None:
+            return {"max": self.max_connections, "created": 0, "in_use": 0, "idle": 0}
+        in_use = len(self._pool._in_use_connections)
+        idle = len(self._pool._available_connections)
+        return {
+            "max": self.max_connections,
+            "created": in_use + idle,
+            "in_use": in_use,
+            "idle": idle,
+        }
+
+    async def ping(self) -> bool:
+        """Проверить доступность Redis через соединение из пула."""
+        try:
+            return bool(await self.client.ping())
+        except (redis.RedisError, OSError):
+            return False
+
+    async def close(self) -> None:
+        """Закрыть все соединения пула."""
+        if self._pool is not None:
+            await self._pool.aclose()
+        self._pool = None
+        self._client = None
+
+
+shared_redis_pool = SharedRedisPool()
@@ -1,3 +1,5 @@
+from collections.abc import Mapping, Sequence
+
 import redis.asyncio as redis
 
 
@@ -38,6 +40,23 @@ class RedisService:
         """
         await self.client.set(key, value, ex=ex)
 
+    async def get_with_ttl(self, key: str) -> tuple[str | None, float | None]:
+        """
+        Получить значение и оставшееся время жизни ключа за один round-trip.
+
+        Args:
+            key (str): Ключ.
+
+        Returns:
+            tuple[str | None, float | None]: Значение (None — ключа нет) и
+                оставшийся TTL в секундах (None — ключ без срока или уже истёк).
+        """
+        async with self.client.pipeline(transaction=False) as pipe:
+            pipe.get(key)
+            pipe.pttl(key)
+            value, pttl = await pipe.execute()
+        return value, (pttl / 1000 if pttl > 0 else None)
+
     async def delete(self, key: str):
         """
         Удалить ключ из Redis.
@@ -59,5 +78,37 @@ class RedisService:
         """
         return await self.client.exists(key) == 1
 
+    async def mget(self, keys: Sequence[str]) -> list[str | None]:
+        """
+        Получить значения нескольких ключей одной командой MGET.
+
+        Args:
+            keys (Sequence[str]): Ключи.
+
+        Returns:
+            list[str | None]: Значения в порядке `keys` (None — ключа нет).
+        """
+        if not keys:
+            return []
+        return await self.client.mget(list(keys))
+
+    async def mset(self, mapping: Mapping[str, str], ex: int = 3600):
+        """
+        Установить несколько ключей с общим сроком жизни за один round-trip.
+
+        MSET не поддерживает TTL, поэтому команды SET EX отправляются
+        пайплайном без транзакции.
+
+        Args:
+            mapping (Mapping[str, str]): Ключ -> значение.
+            ex (int): Время жизни ключей в секундах.
+        """
+        if not mapping:
+            return
+        async with self.client.pipeline(transaction=False) as pipe:
+            for key, value in mapping.items():
+                pipe.set(key, value, ex=ex)
+            await pipe.execute()
+
 
 # redis_service = RedisService(url="redis://redis:6379/0")
@@ -0,0 +1,95 @@
+import hashlib
+import json
+from collections.abc import Callable
+from typing import Any
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+
+from src.shared.configs.get_settings import get_settings
+
+settings = get_settings()
+
+# все каталоги процесса, чтобы прогреть их при старте (`warm_catalogs`)
+CATALOGS: list["StaticCatalog"] = []
+
+
+def _etag_matches(header: str | None, etag: str) -> bool:
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    # для GET достаточно слабого сравнения: W/"x" совпадает с "x"
+    return any(tag.strip().removeprefix("W/") == etag for tag in header.split(","))
+
+
+class StaticCatalog:
+    """
+    Неизменяемый в рамках процесса JSON-ответ с ETag.
+
+    Содержимое строится один раз (при старте приложения, см. `warm_catalogs`)
+    и хранится уже сериализованным. ETag — хэш тела, поэтому он одинаков на
+    всех инстансах с одним кодом и меняется только вместе с содержимым.
+    Запрос с совпавшим If-None-Match получает 304 без тела.
+    """
+
+    def __init__(
+        self,
+        build: Callable[[], Any],
+        max_age: int = settings.catalog_cache_max_age_seconds,
+    ):
+        """
+        Args:
+            build (Callable[[], Any]): Функция, возвращающая содержимое каталога.
+            max_age (int): Сколько клиент может не перепроверять ответ
+                (в секундах, Cache-Control: max-age).
+        """
+        self.build = build
+        self.max_age = max_age
+        self._body: bytes | None = None
+        self._etag: str | None = None
+        CATALOGS.append(self)
+
+    def load(self) -> None:
+        """Построить и сериализовать каталог (повторный вызов ничего не делает)."""
+        if self._body is not None:
+            return
+        body = json.dumps(
+            jsonable_encoder(self.build()), ensure_ascii=False, separators=(",", ":")
+        ).encode()
+        self._etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+        self._body = body
+
+    @property
+    def body(self) -> bytes:
+        self.load()
+        return self._body  # type: ignore[return-value]
+
+    @property
+    def etag(self) -> str:
+        self.load()
+        return self._etag  # type: ignore[return-value]
+
+    def response(self, request: Request) -> Response:
+        """
+        Ответ на GET каталога с учётом If-None-Match.
+
+        Args:
+            request (Request): Входящий запрос.
+
+        Returns:
+            Response: 304 без тела при совпадении ETag, иначе 200 с JSON.
+        """
+        headers = {
+            "ETag": self.etag,
+            "Cache-Control": f"public, max-age={self.max_age}",
+        }
+        if _etag_matches(request.headers.get("if-none-match"), self.etag):
+            return Response(status_code=304, headers=headers)
+        return Response(self.body, media_type="application/json", headers=headers)
+
+
+def warm_catalogs() -> None:
+    """Построить все каталоги заранее (в lifespan приложения)."""
+    for catalog in CATALOGS:
+        catalog.load()
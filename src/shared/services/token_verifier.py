@@ -0,0 +1,207 @@
+import asyncio
+import hashlib
+import logging
+import math
+import time
+
+import redis.asyncio as redis
+from jose import JWTError
+
+from src.shared.configs.get_settings import get_settings
+from src.shared.services.cache_service import TTLCache
+from src.shared.services.jwt_service import decode_token, token_digest
+from src.shared.services.redis_pool import shared_redis_pool
+
+settings = get_settings()
+errors_logger = logging.getLogger("errors_log")
+
+REVOKED_PREFIX = "revoked:"
+REVOKED_CHANNEL = "auth:revoked"
+
+
+class BloomFilter:
+    """
+    Фильтр Блума для строковых ключей.
+
+    Не даёт ложноотрицательных ответов: если ключ добавлен, `in` всегда
+    вернёт True. Ложноположительные ответы возможны с вероятностью
+    около `error_rate` при заполнении до `capacity`.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        """
+        Args:
+            capacity (int): Ожидаемое количество ключей.
+            error_rate (float): Допустимая доля ложноположительных ответов.
+        """
+        capacity = max(capacity, 1)
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        # двойное хеширование: k позиций из двух независимых хешей
+        return ((h1 + i * h2) % self.size for i in range(self.hashes))
+
+    def add(self, key: str) -> None:
+        for pos in self._positions(key):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        return all(
+            self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key)
+        )
+
+
+class TokenVerifier:
+    """
+    Проверка access токенов с локальным кэшем и списком отзыва.
+
+    Успешно проверенные токены кэшируются по SHA-256 токена не дольше
+    их `exp`, поэтому повторный запрос с тем же токеном обходится без
+    проверки подписи. Отозванные `jti` хранятся в Redis
+    (`revoked:<jti>` с TTL до истечения токена) и зеркалируются в
+    локальный фильтр Блума: обновления приходят через pub/sub, а полная
+    пересборка по Redis выполняется раз в `resync_seconds`. Обычный токен
+    проверяется без обращения к Redis; в Redis идёт только редкое
+    срабатывание фильтра.
+    """
+
+    def __init__(
+        self,
+        redis_client: redis.Redis | None = None,
+        cache_maxsize: int = settings.jwt_cache_maxsize,
+        cache_max_ttl: float = settings.jwt_cache_max_ttl_seconds,
+        bloom_capacity: int = settings.revocation_bloom_capacity,
+        bloom_error_rate: float = settings.revocation_bloom_error_rate,
+        resync_seconds: float = settings.revocation_resync_seconds,
+    ):
+        """
+        Args:
+            redis_client (redis.Redis | None): Клиент Redis. По умолчанию
+                общий пул процесса.
+            cache_maxsize (int): Максимум токенов в кэше.
+            cache_max_ttl (float): Верхняя граница жизни записи кэша (в секундах).
+            bloom_capacity (int): Ожидаемое число одновременно отозванных токенов.
+            bloom_error_rate (float): Доля ложноположительных срабатываний фильтра.
+            resync_seconds (float): Период полной пересборки фильтра.
+        """
+        self._redis = redis_client
+        self.cache = TTLCache(maxsize=cache_maxsize)
+        self.cache_max_ttl = cache_max_ttl
+        self.bloom_capacity = bloom_capacity
+        self.bloom_error_rate = bloom_error_rate
+        self.resync_seconds = resync_seconds
+        self.revoked = BloomFilter(bloom_capacity, bloom_error_rate)
+        self._listener: asyncio.Task | None = None
+
+    @property
+    def redis(self) -> redis.Redis:
+        return self._redis or shared_redis_pool.client
+
+    async def verify(self, token: str) -> dict:
+        """
+        Проверить токен.
+
+        Args:
+            token (str): JWT токен.
+
+        Returns:
+            dict: Payload токена.
+
+        Raises:
+            JWTError: Если токен недействителен, истёк или отозван.
+        """
+        key = token_digest(token)
+        payload = self.cache.get(key)
+        if payload is None:
+            payload = decode_token(token)
+            ttl = min(payload["exp"] - time.time(), self.cache_max_ttl)
+            if ttl > 0:
+                self.cache.set(key, payload, ttl)
+        elif payload["exp"] <= time.time():
+            raise JWTError("Signature has expired.")
+
+        jti = payload.get("jti")
+        if jti is not None and jti in self.revoked and await self._is_revoked(jti):
+            raise JWTError("Token has been revoked")
+        return payload
+
+    async def _is_revoked(self, jti: str) -> bool:
+        try:
+            return await self.redis.exists(f"{REVOKED_PREFIX}{jti}") == 1
+        except redis.RedisError as exc:
+            # фильтр сказал «возможно отозван», а подтвердить нечем — отказываем
+            errors_logger.warning(f"Revocation check for {jti} failed: {exc}")
+            return True
+
+    async def revoke(self, payload: dict) -> None:
+        """
+        Отозвать токен до его истечения.
+
+        Args:
+            payload (dict): Payload токена (нужны `jti` и `exp`).
+        """
+        jti = payload.get("jti")
+        if jti is None:
+            return
+        ttl = max(1, int(payload["exp"] - time.time()))
+        self.revoked.add(jti)
+        await self.redis.set(f"{REVOKED_PREFIX}{jti}", "1", ex=ttl)
+        await self.redis.publish(REVOKED_CHANNEL, jti)
+
+    async def resync(self) -> None:
+        """Пересобрать фильтр по актуальным ключам Redis (истёкшие выпадают)."""
+        revoked = BloomFilter(self.bloom_capacity, self.bloom_error_rate)
+        async for key in self.redis.scan_iter(match=f"{REVOKED_PREFIX}*", count=1000):
+            revoked.add(key.removeprefix(REVOKED_PREFIX))
+        self.revoked = revoked
+
+    async def _listen(self) -> None:
+        while True:
+            pubsub = self.redis.pubsub()
+            try:
+                # подписка до пересборки, чтобы не потерять отзывы между ними
+                await pubsub.subscribe(REVOKED_CHANNEL)
+                await self.resync()
+                next_resync = time.monotonic() + self.resync_seconds
+                while True:
+                    message = await pubsub.get_message(
+                        ignore_subscribe_messages=True, timeout=1.0
+                    )
+                    if message is not None:
+                        self.revoked.add(message["data"])
+                    if time.monotonic() >= next_resync:
+                        await self.resync()
+                        next_resync = time.monotonic() + self.resync_seconds
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:  # noqa: BLE001
+                errors_logger.error(f"Revocation listener failed: {exc}")
+                await asyncio.sleep(1)
+            finally:
+                await pubsub.aclose()
+
+    def start(self) -> None:
+        """Запустить синхронизацию списка отзыва (в lifespan приложения)."""
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        """Остановить синхронизацию и очистить кэш."""
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+        self.cache.clear()
+
+
+token_verifier = TokenVerifier()
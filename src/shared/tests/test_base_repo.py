@@ -0,0 +1,201 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import HTTPException, Response
+from sqlalchemy.dialects import postgresql
+
+from src.modules.trigger.api.v1.trigger_schemas import TriggerOut
+from src.shared.base_repo import BaseRepository
+from src.shared.db import Triggers
+from src.shared.deps.pagination import (
+    NEXT_CURSOR_HEADER,
+    PageParams,
+    get_page_params,
+    page_response,
+)
+
+
+def _sql(stmt) -> str:
+    return str(
+        stmt.compile(
+            dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+        )
+    )
+
+
+def _session(scalars=None, mappings=None):
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = scalars or []
+    result.mappings.return_value.all.return_value = mappings or []
+    session = AsyncMock()
+    session.execute = AsyncMock(return_value=result)
+    return session
+
+
+@pytest.mark.anyio
+async def test_list_page_uses_keyset_and_returns_cursor():
+    rows = [SimpleNamespace(id=i) for i in (11, 12, 13)]
+    session = _session(scalars=rows)
+
+    items, cursor = await BaseRepository(session, Triggers).list_page(
+        user_id=7, after_id=10, limit=2
+    )
+
+    sql = _sql(session.execute.await_args.args[0])
+    assert "triggers.user_id = 7" in sql
+    assert "triggers.id > 10" in sql
+    assert "ORDER BY triggers.id" in sql
+    assert sql.endswith("LIMIT 3")
+    assert [item.id for item in items] == [11, 12]
+    assert cursor == 12
+
+
+@pytest.mark.anyio
+async def test_list_page_last_page_has_no_cursor():
+    session = _session(scalars=[SimpleNamespace(id=1)])
+
+    items, cursor = await BaseRepository(session, Triggers).list_page(limit=2)
+
+    assert "triggers.id >" not in _sql(session.execute.await_args.args[0])
+    assert len(items) == 1
+    assert cursor is None
+
+
+@pytest.mark.anyio
+async def test_list_page_projects_columns():
+    session = _session(mappings=[{"id": 1, "name": "a"}, {"id": 2, "name": "b"}])
+
+    items, cursor = await BaseRepository(session, Triggers).list_page(
+        limit=1, columns=["name", "id"]
+    )
+
+    sql = _sql(session.execute.await_args.args[0])
+    assert sql.startswith("SELECT triggers.id, triggers.name \nFROM triggers")
+    assert items == [{"id": 1, "name": "a"}]
+    assert cursor == 1
+
+
+@pytest.mark.anyio
+async def test_list_page_rejects_unknown_column():
+    with pytest.raises(ValueError, match="password"):
+        await BaseRepository(_session(), Triggers).list_page(columns=["password"])
+
+
+@pytest.mark.anyio
+async def test_page_params_validate_fields():
+    get_params = get_page_params(TriggerOut)
+
+    page = await get_params(limit=10, cursor=None, fields="id, name")
+    assert page == PageParams(limit=10, fields=["id", "name"])
+
+    with pytest.raises(HTTPException) as exc:
+        await get_params(limit=10, cursor=None, fields="name,secret")
+    assert exc.value.status_code == 422
+
+
+def test_page_response_sets_cursor_header():
+    response = Response()
+    items = [SimpleNamespace(id=1)]
+
+    assert page_response(response, items, 1, PageParams(limit=1)) is items
+    assert response.headers[NEXT_CURSOR_HEADER] == "1"
+
+    projected = page_response(
+        Response(), [{"id": 1}], None, PageParams(limit=1, fields=["id"])
+    )
+    assert projected.body == b'[{"id":1}]'
+    assert NEXT_CURSOR_HEADER not in projected.headers
+
+
+@pytest.mark.anyio
+async def test_insert_many_chunks_multirow_insert():
+    session = AsyncMock()
+    session.scalars = AsyncMock(
+        side_effect=lambda stmt: MagicMock(all=MagicMock(return_value=["row"]))
+    )
+    rows = [{"user_id": 1, "name": str(i)} for i in range(5)]
+
+    created = await BaseRepository(session, Triggers).insert_many(rows, chunk_size=2)
+
+    statements = [call.args[0] for call in session.scalars.await_args_list]
+    assert len(statements) == 3
+    assert len(created) == 3
+    sql = _sql(statements[0])
+    assert sql.startswith("INSERT INTO triggers (user_id, name")
+    assert "VALUES (1, '0'" in sql and "(1, '1'" in sql and "'2'" not in sql
+    assert "RETURNING triggers.id" in sql
+
+
+@pytest.mark.anyio
+async def test_insert_many_skips_empty():
+    session = AsyncMock()
+
+    assert await BaseRepository(session, Triggers).insert_many([]) == []
+    session.scalars.assert_not_awaited()
+
+
+@pytest.mark.anyio
+async def test_update_and_delete_many_by_id_list():
+    session = _session(scalars=[3])
+    repo = BaseRepository(session, Triggers)
+
+    assert await repo.update_many([3, 4, 3], {"is_active": False}, user_id=7) == [3]
+    update_sql = _sql(session.execute.await_args.args[0])
+    assert update_sql.startswith("UPDATE triggers SET is_active=false")
+    assert "triggers.user_id = 7 AND triggers.id IN (3, 4)" in update_sql
+    assert update_sql.endswith("RETURNING triggers.id")
+
+    await repo.delete_many([3, 4])
+    delete_sql = _sql(session.execute.await_args.args[0])
+    assert delete_sql.startswith("DELETE FROM triggers WHERE triggers.id IN (3, 4)")
+
+
+@pytest.mark.anyio
+async def test_update_is_single_owned_statement():
+    row = SimpleNamespace(id=3, name="new")
+    session = AsyncMock()
+    session.scalars = AsyncMock(
+        return_value=MagicMock(one_or_none=MagicMock(return_value=row))
+    )
+
+    obj = await BaseRepository(session, Triggers).update(3, {"name": "new"}, 7)
+
+    assert obj is row
+    sql = _sql(session.scalars.await_args.args[0])
+    assert sql.startswith("UPDATE triggers SET name='new'")
+    assert "triggers.id = 3 AND triggers.user_id = 7" in sql
+    assert "RETURNING triggers.id, triggers.user_id" in sql
+    session.execute.assert_not_awaited()
+    session.refresh.assert_not_awaited()
+    session.commit.assert_not_awaited()
+
+
+@pytest.mark.anyio
+async def test_update_of_foreign_object_returns_none():
+    session = AsyncMock()
+    session.scalars = AsyncMock(
+        return_value=MagicMock(one_or_none=MagicMock(return_value=None))
+    )
+
+    assert await BaseRepository(session, Triggers).update(3, {"name": "x"}, 8) is None
+
+
+@pytest.mark.anyio
+async def test_delete_is_single_owned_statement():
+    session = AsyncMock()
+    session.execute = AsyncMock(
+        side_effect=[
+            MagicMock(scalar_one_or_none=MagicMock(return_value=3)),
+            MagicMock(scalar_one_or_none=MagicMock(return_value=None)),
+        ]
+    )
+    repo = BaseRepository(session, Triggers)
+
+    assert await repo.delete(3, 7) is True
+    sql = _sql(session.execute.await_args.args[0])
+    assert sql == (
+        "DELETE FROM triggers WHERE triggers.id = 3 AND triggers.user_id = 7 "
+        "RETURNING triggers.id"
+    )
+    assert await repo.delete(4, 7) is False
@@ -0,0 +1,99 @@
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.shared.services.cache_service import ResponseCache, TTLCache
+from src.shared.services.redis_service import RedisService
+
+
+def test_ttl_cache_expires_and_evicts(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(
+        "src.shared.services.cache_service.time.monotonic", lambda: now[0]
+    )
+    cache = TTLCache(maxsize=2)
+
+    cache.set("a", 1, ttl=10)
+    cache.set("b", 2, ttl=10)
+    assert cache.get("a") == 1
+    cache.set("c", 3, ttl=10)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    now[0] = 111.0
+    assert cache.get("a", "miss") == "miss"
+    assert len(cache) == 1
+
+
+@pytest.mark.anyio
+async def test_concurrent_misses_are_coalesced():
+    cache = ResponseCache("test")
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"temp": 20}
+
+    results = await asyncio.gather(
+        *(cache.get_or_fetch("k", 60, fetch) for _ in range(10))
+    )
+
+    assert calls == 1
+    assert results == [{"temp": 20}] * 10
+    assert await cache.get_or_fetch("k", 60, fetch) == {"temp": 20}
+    assert calls == 1
+
+
+@pytest.mark.anyio
+async def test_fetch_error_is_not_cached():
+    cache = ResponseCache("test")
+    fetch = AsyncMock(side_effect=[RuntimeError("upstream"), {"ok": True}])
+
+    with pytest.raises(RuntimeError):
+        await cache.get_or_fetch("k", 60, fetch)
+
+    assert await cache.get_or_fetch("k", 60, fetch) == {"ok": True}
+
+
+@pytest.mark.anyio
+async def test_redis_level_is_shared_and_failures_are_ignored():
+    redis = MagicMock(spec=RedisService)
+    redis.get_with_ttl = AsyncMock(return_value=(json.dumps({"from": "redis"}), 60))
+    redis.set = AsyncMock()
+    cache = ResponseCache("ow", redis=redis)
+    fetch = AsyncMock()
+
+    assert await cache.get_or_fetch("k", 60, fetch) == {"from": "redis"}
+    redis.get_with_ttl.assert_awaited_once_with("ow:k")
+    fetch.assert_not_awaited()
+
+    redis.get_with_ttl = AsyncMock(side_effect=ConnectionError("down"))
+    fetch.return_value = {"from": "api"}
+    assert await cache.get_or_fetch("other", 30, fetch) == {"from": "api"}
+    redis.set.assert_awaited_once_with("ow:other", json.dumps({"from": "api"}), 30)
+
+
+@pytest.mark.anyio
+async def test_redis_hit_fills_local_level_with_remaining_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(
+        "src.shared.services.cache_service.time.monotonic", lambda: now[0]
+    )
+    redis = MagicMock(spec=RedisService)
+    redis.get_with_ttl = AsyncMock(return_value=(json.dumps({"temp": 1}), 5.0))
+    cache = ResponseCache("ow", redis=redis)
+    fetch = AsyncMock(return_value={"temp": 2})
+
+    assert await cache.get_or_fetch("k", 600, fetch) == {"temp": 1}
+    now[0] += 4
+    assert await cache.get_or_fetch("k", 600, fetch) == {"temp": 1}
+    assert redis.get_with_ttl.await_count == 1
+
+    now[0] += 2
+    redis.get_with_ttl = AsyncMock(return_value=(None, None))
+    assert await cache.get_or_fetch("k", 600, fetch) == {"temp": 2}
+    fetch.assert_awaited_once()
@@ -0,0 +1,97 @@
+import logging
+from unittest.mock import MagicMock
+
+import pytest
+from pydantic import BaseModel
+
+from src.shared.decorators import _template_fields, log_action
+
+
+class Credentials(BaseModel):
+    username: str
+    password: str
+
+    def model_dump(self, *args, **kwargs):
+        raise AssertionError("log_action must not dump models")
+
+
+@pytest.fixture
+def logger():
+    logger = MagicMock(spec=logging.Logger)
+    logger.isEnabledFor.return_value = True
+    return logger
+
+
+def test_template_fields_are_parsed_once():
+    assert _template_fields("{user.name} {a[0]} {b:>5} {a} {{raw}}") == (
+        "user",
+        "a",
+        "b",
+    )
+
+
+@pytest.mark.anyio
+async def test_fields_come_from_kwargs_and_models(logger):
+    @log_action("User {username} on {host}", logger)
+    async def login(data: Credentials, host: str):
+        return "ok"
+
+    assert (
+        await login(data=Credentials(username="vasya", password="x"), host="h") == "ok"
+    )
+
+    logger.log.assert_called_once_with(logging.INFO, "User vasya on h", extra=None)
+
+
+@pytest.mark.anyio
+async def test_missing_field_logs_template(logger):
+    @log_action("Registered {email}", logger)
+    async def register(data: dict):
+        return None
+
+    await register(data={"username": "vasya"})
+
+    logger.log.assert_called_once_with(logging.INFO, "Registered {email}", extra=None)
+
+
+@pytest.mark.anyio
+async def test_disabled_logger_skips_building_message(logger):
+    logger.isEnabledFor.return_value = False
+    data = MagicMock()
+
+    @log_action("User {username}", logger)
+    async def login(data):
+        return None
+
+    await login(data=data)
+
+    logger.log.assert_not_called()
+    assert data.mock_calls == []
+
+
+@pytest.mark.anyio
+async def test_duration_is_structured_field(logger):
+    @log_action("done", logger, duration=True)
+    async def handler():
+        return None
+
+    await handler()
+
+    extra = logger.log.call_args.kwargs["extra"]
+    assert extra["duration_ms"] >= 0
+
+
+@pytest.mark.anyio
+async def test_errors_are_logged_and_reraised(logger, monkeypatch):
+    errors = MagicMock()
+    monkeypatch.setattr("src.shared.decorators.errors_logger", errors)
+
+    @log_action("never", logger)
+    async def broken():
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        await broken()
+
+    errors.exception.assert_called_once()
+    logger.log.assert_not_called()
@@ -0,0 +1,93 @@
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from src.main_app import health as health_module
+from src.main_app.health import HealthMonitor, health_router
+
+
+async def _ok():
+    return None
+
+
+async def _down():
+    raise ConnectionError("refused")
+
+
+async def _hangs():
+    await asyncio.sleep(10)
+
+
+@pytest.mark.anyio
+async def test_refresh_marks_failed_and_slow_checks_unavailable():
+    monitor = HealthMonitor(
+        {"database": _ok, "redis": _down, "broker": _hangs}, timeout=0.05
+    )
+
+    await monitor.refresh()
+
+    assert monitor.results == {
+        "database": "ok",
+        "redis": "unavailable",
+        "broker": "unavailable",
+    }
+    assert not monitor.ready
+
+
+@pytest.mark.anyio
+async def test_stale_result_is_not_ready(monkeypatch):
+    monitor = HealthMonitor({"database": _ok}, interval=1)
+    assert not monitor.ready
+
+    await monitor.refresh()
+    assert monitor.ready
+
+    monkeypatch.setattr(
+        health_module.time, "monotonic", lambda: monitor.checked_at + 10
+    )
+    assert not monitor.ready
+    assert monitor.snapshot()["status"] == "unavailable"
+
+
+@pytest.mark.anyio
+async def test_probes_read_cached_result_without_running_checks(monkeypatch):
+    calls = []
+
+    async def counted():
+        calls.append(1)
+
+    monitor = HealthMonitor({"database": counted})
+    await monitor.refresh()
+    monkeypatch.setattr(health_module, "health_monitor", monitor)
+    app = FastAPI()
+    app.include_router(health_router)
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        live = await client.get("/livez")
+        ready = [await client.get("/readyz") for _ in range(5)]
+        legacy = await client.get("/health_check")
+
+    assert live.json() == {"status": "ok"}
+    assert all(r.status_code == 200 for r in ready)
+    assert ready[0].json()["database"] == "ok"
+    assert legacy.status_code == 200
+    assert len(calls) == 1
+
+
+@pytest.mark.anyio
+async def test_readiness_is_503_before_first_check(monkeypatch):
+    monkeypatch.setattr(health_module, "health_monitor", HealthMonitor({"db": _ok}))
+    app = FastAPI()
+    app.include_router(health_router)
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        response = await client.get("/readyz")
+
+    assert response.status_code == 503
+    assert response.json()["db"] == "unknown"
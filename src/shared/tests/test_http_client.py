@@ -0,0 +1,145 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+import redis.asyncio as redis
+
+from src.shared.services import http_client as http_module
+from src.shared.services.http_client import (
+    RedisRateLimiter,
+    SharedHttpClient,
+    TokenBucket,
+)
+
+
+class _CounterRedis:
+    """INCR/EXPIRE в памяти; `fail` имитирует недоступный Redis."""
+
+    def __init__(self, fail: bool = False):
+        self.counts: dict[str, int] = {}
+        self.fail = fail
+
+    def pipeline(self, transaction=True):
+        return _CounterPipeline(self)
+
+
+class _CounterPipeline:
+    def __init__(self, redis_):
+        self.redis = redis_
+        self.ops = []
+
+    def incr(self, key):
+        self.ops.append(key)
+
+    def expire(self, key, seconds):
+        self.ops.append(None)
+
+    async def execute(self):
+        if self.redis.fail:
+            raise redis.ConnectionError("down")
+        results = []
+        for key in self.ops:
+            if key is None:
+                results.append(True)
+            else:
+                self.redis.counts[key] = self.redis.counts.get(key, 0) + 1
+                results.append(self.redis.counts[key])
+        return results
+
+
+def _client_with(handler) -> SharedHttpClient:
+    client = SharedHttpClient(per_host_concurrency=2, http2=False)
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+@pytest.mark.anyio
+async def test_token_bucket_limits_rate():
+    bucket = TokenBucket(rate=20)
+    start = time.monotonic()
+    for _ in range(25):
+        await bucket.acquire()
+    # 20 токенов в корзине сразу, ещё 5 — по 1/20 с
+    assert time.monotonic() - start >= 0.2
+
+
+def test_token_bucket_rejects_non_positive_rate():
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
+
+
+@pytest.mark.anyio
+async def test_request_respects_per_host_concurrency():
+    in_flight = 0
+    peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, json={"host": request.url.host})
+
+    client = _client_with(handler)
+    client.limit_host("limited.test", concurrency=1)
+
+    await asyncio.gather(*(client.get("https://limited.test/x") for _ in range(5)))
+    assert peak == 1
+
+    peak = 0
+    responses = await asyncio.gather(
+        *(client.get("https://other.test/x") for _ in range(5))
+    )
+    assert peak == 2
+    assert responses[0].json() == {"host": "other.test"}
+    await client.close()
+
+
+@pytest.mark.anyio
+async def test_close_resets_client_and_limits():
+    client = _client_with(lambda request: httpx.Response(204))
+    await client.get("https://a.test/")
+
+    await client.close()
+
+    assert client._client is None
+    assert client._hosts["a.test"].semaphore is None
+
+
+@pytest.mark.anyio
+async def test_shared_rate_limit_waits_for_next_window(monkeypatch):
+    clock = {"now": 600.0}
+    sleeps = []
+
+    async def fake_sleep(seconds):
+        sleeps.append(seconds)
+        clock["now"] += seconds
+
+    monkeypatch.setattr(http_module.time, "time", lambda: clock["now"])
+    monkeypatch.setattr(http_module.asyncio, "sleep", fake_sleep)
+    monkeypatch.setattr(http_module.random, "uniform", lambda a, b: 0)
+    store = _CounterRedis()
+    # два процесса с общей квотой 2 в минуту
+    first = RedisRateLimiter("api.example", 2, redis_client=store)
+    second = RedisRateLimiter("api.example", 2, redis_client=store)
+
+    await first.acquire()
+    await second.acquire()
+    assert sleeps == []
+
+    await first.acquire()
+    assert sleeps == [60.0]
+    assert store.counts == {
+        "ratelimit:api.example:10": 3,
+        "ratelimit:api.example:11": 1,
+    }
+
+
+@pytest.mark.anyio
+async def test_shared_rate_limit_skipped_when_redis_is_down():
+    limiter = RedisRateLimiter("api.example", 1, redis_client=_CounterRedis(fail=True))
+
+    await asyncio.wait_for(limiter.acquire(), 1)
+    await asyncio.wait_for(limiter.acquire(), 1)
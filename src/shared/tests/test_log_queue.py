@@ -0,0 +1,106 @@
+import logging
+import queue
+
+import pytest
+
+from src.shared.configs import log_conf
+from src.shared.services.log_queue import (
+    BatchedRotatingFileHandler,
+    BatchingQueueListener,
+    DroppingQueueHandler,
+)
+
+
+def _record(name: str, msg: str, *args, level=logging.INFO) -> logging.LogRecord:
+    return logging.LogRecord(name, level, __file__, 1, msg, args, None)
+
+
+def test_queue_handler_drops_when_full():
+    handler = DroppingQueueHandler(queue.Queue(maxsize=2))
+
+    for i in range(5):
+        handler.handle(_record("auth_log", "login %s", i))
+
+    assert handler.dropped == 3
+    first = handler.queue.get_nowait()
+    assert first.msg == "login 0"
+    assert first.args is None
+
+
+def test_file_handler_rotates_by_counted_size(tmp_path):
+    handler = BatchedRotatingFileHandler(
+        tmp_path / "app.log", maxBytes=30, backupCount=2, encoding="utf-8", delay=True
+    )
+    handler.setFormatter(logging.Formatter("{message}", style="{"))
+
+    for i in range(4):
+        handler.handle(_record("app_log", f"record-{i:02d}-payload"))
+    handler.close()
+
+    assert (tmp_path / "app.log").read_text() == "record-03-payload\n"
+    assert (tmp_path / "app.log.1").read_text() == "record-02-payload\n"
+    assert not (tmp_path / "app.log.3").exists()
+
+
+def test_listener_flushes_batches_and_reports_drops(tmp_path):
+    log_queue: queue.Queue = queue.Queue(maxsize=3)
+    source = DroppingQueueHandler(log_queue)
+    errors = BatchedRotatingFileHandler(tmp_path / "errors.log", delay=True)
+    errors.addFilter(logging.Filter("errors_log"))
+    auth = BatchedRotatingFileHandler(tmp_path / "auth.log", delay=True)
+    auth.addFilter(logging.Filter("auth_log"))
+    for i in range(5):
+        source.handle(_record("auth_log", "login %s", i))
+
+    listener = BatchingQueueListener(
+        log_queue, errors, auth, batch_size=2, source=source
+    )
+    listener.start()
+    listener.stop()
+
+    assert (tmp_path / "auth.log").read_text().splitlines() == [
+        "login 0",
+        "login 1",
+        "login 2",
+    ]
+    assert "dropped 2 records" in (tmp_path / "errors.log").read_text()
+    assert listener.stats() == {"queued": 0, "dropped": 2}
+
+
+@pytest.fixture
+def log_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(log_conf, "LOG_DIR", tmp_path)
+    yield tmp_path
+    log_conf.shutdown_logger()
+
+
+def test_setup_logger_routes_loggers_to_their_files(log_dir):
+    log_conf.setup_logger()
+
+    logging.getLogger("auth_log").info("user %s logged in", "vasya")
+    logging.getLogger("source_log").debug("below level")
+    logging.getLogger("errors_log").error("failure")
+    log_conf.shutdown_logger()
+
+    assert "auth_log: user vasya logged in" in (log_dir / "auth.log").read_text()
+    assert "failure" in (log_dir / "errors.log").read_text()
+    assert "failure" not in (log_dir / "auth.log").read_text()
+    assert not (log_dir / "source.log").exists()
+
+
+@pytest.mark.anyio
+async def test_log_action_duration_reaches_auth_log(log_dir):
+    from src.shared.decorators import log_action
+
+    log_conf.setup_logger()
+
+    @log_action("login {username}", logging.getLogger("auth_log"), duration=True)
+    async def login(username: str):
+        return None
+
+    await login(username="vasya")
+    log_conf.shutdown_logger()
+
+    line = (log_dir / "auth.log").read_text().strip()
+    assert "auth_log: login vasya duration_ms=" in line
+    assert float(line.rsplit("duration_ms=", 1)[1]) >= 0
@@ -0,0 +1,146 @@
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from src.main_app.metrics import MetricsMiddleware
+from src.shared.services.metrics import MetricsRegistry
+
+
+class _FakeRedis:
+    """Хэши Redis в памяти: только то, что нужно push/render."""
+
+    def __init__(self):
+        self.hashes: dict[str, dict[str, float]] = {}
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self)
+
+
+class _FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.ops = []
+
+    def __len__(self):
+        return len(self.ops)
+
+    def hincrbyfloat(self, key, field, amount):
+        self.ops.append(("incr", key, field, amount))
+
+    def hgetall(self, key):
+        self.ops.append(("get", key, None, None))
+
+    async def execute(self):
+        results = []
+        for op, key, field, amount in self.ops:
+            row = self.redis.hashes.setdefault(key, {})
+            if op == "incr":
+                row[field] = row.get(field, 0.0) + amount
+                results.append(row[field])
+            else:
+                results.append({f: str(v) for f, v in row.items()})
+        return results
+
+
+@pytest.mark.anyio
+async def test_render_histogram_buckets_are_cumulative():
+    registry = MetricsRegistry()
+    latency = registry.histogram(
+        "latency_seconds", "Задержка", ("route",), buckets=(0.1, 1)
+    )
+    latency.observe(0.05, route="/a")
+    latency.observe(0.5, route="/a")
+    latency.observe(5, route="/a")
+
+    text = await registry.render()
+
+    assert "# TYPE latency_seconds histogram" in text
+    assert 'latency_seconds_bucket{route="/a",le="0.1"} 1.0' in text
+    assert 'latency_seconds_bucket{route="/a",le="1.0"} 2.0' in text
+    assert 'latency_seconds_bucket{route="/a",le="+Inf"} 3.0' in text
+    assert 'latency_seconds_count{route="/a"} 3.0' in text
+    assert 'latency_seconds_sum{route="/a"} 5.55' in text
+
+
+@pytest.mark.anyio
+async def test_shared_metrics_are_pushed_as_deltas_and_merged_on_render():
+    redis = _FakeRedis()
+    worker = MetricsRegistry()
+    evaluations = worker.counter("evals", "Проверки", ("type",), shared=True)
+    local_only = worker.counter("local", "Не уходит в Redis")
+    local_only.inc()
+
+    evaluations.inc(10, type="temp")
+    await worker.push(redis)
+    evaluations.inc(5, type="temp")
+    await worker.push(redis)
+    await worker.push(redis)
+
+    assert list(redis.hashes) == ["metrics:evals"]
+    api = MetricsRegistry()
+    api_evaluations = api.counter("evals", "Проверки", ("type",), shared=True)
+    api_evaluations.inc(1, type="temp")
+    text = await api.render(redis)
+
+    assert 'evals_total{type="temp"} 16.0' in text
+    assert "# HELP evals_total Проверки" in text
+    assert "# TYPE evals_total counter" in text
+    assert "# TYPE evals counter" not in text
+
+
+@pytest.mark.anyio
+async def test_failing_collector_does_not_break_render():
+    registry = MetricsRegistry()
+
+    @registry.collector
+    async def broken():
+        raise RuntimeError("broker is down")
+
+    @registry.collector
+    async def queues():
+        return [("queue_length", "gauge", "Очередь", [({"queue": "default"}, 3)])]
+
+    text = await registry.render()
+
+    assert 'queue_length{queue="default"} 3.0' in text
+
+
+def test_metric_base_is_abstract():
+    from src.shared.services.metrics import _Metric
+
+    with pytest.raises(TypeError):
+        _Metric("incomplete", "Без fields/samples")
+
+
+def test_duplicate_metric_name_is_rejected():
+    registry = MetricsRegistry()
+    registry.counter("evals", "Проверки")
+
+    with pytest.raises(ValueError):
+        registry.counter("evals", "Проверки")
+
+
+@pytest.mark.anyio
+async def test_middleware_labels_requests_by_route_template(monkeypatch):
+    from src.main_app import metrics as app_metrics
+
+    registry = MetricsRegistry()
+    histogram = registry.histogram("http", "Запросы", ("method", "route", "status"))
+    monkeypatch.setattr(app_metrics, "http_request_duration", histogram)
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware)
+
+    @app.get("/items/{item_id}")
+    async def item(item_id: int):
+        return {"id": item_id}
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        await client.get("/items/1")
+        await client.get("/items/2")
+        await client.get("/missing")
+
+    text = await registry.render()
+    assert 'http_count{method="GET",route="/items/{item_id}",status="200"} 2.0' in text
+    assert 'http_count{method="GET",route="unmatched",status="404"} 1.0' in text
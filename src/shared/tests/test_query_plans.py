@@ -0,0 +1,156 @@
+"""
+Планы горячих запросов на настоящем Postgres.
+
+Запускается, если задан TEST_DATABASE_URL (postgresql+asyncpg://...);
+таблицы создаются в отдельной схеме и удаляются после прогона.
+"""
+
+import os
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.modules.rules.repository.rules_repo import RulesRepo
+from src.modules.trigger.repository.trigger_repo import TriggerRepo
+from src.shared.db import Notifications, Rules, Sources, Triggers, TriggersTypes
+
+TEST_DATABASE_URL_ENV = "TEST_DATABASE_URL"
+SCHEMA = "test_query_plans"
+
+# движок модульный, поэтому и тесты, и фикстура живут в одном цикле модуля
+pytestmark = [
+    pytest.mark.skipif(
+        not os.getenv(TEST_DATABASE_URL_ENV),
+        reason=f"{TEST_DATABASE_URL_ENV} is not set",
+    ),
+    pytest.mark.asyncio(loop_scope="module"),
+]
+
+SEED = [
+    "INSERT INTO triggers_types (id, name, description, config) "
+    "VALUES (1, 'temp_trigger', 'test', '{}')",
+    # 2000 пользователей: по 4 источника, 5 триггеров на источник,
+    # 3 уведомления (одно выключено)
+    """
+    INSERT INTO sources (user_id, source_type_id, name, config, is_active)
+    SELECT u, 1, 'test', '{}'::jsonb, s % 4 <> 0
+    FROM generate_series(1, 2000) AS u, generate_series(1, 4) AS s
+    """,
+    """
+    INSERT INTO notifications (user_id, notification_type_id, name, config, is_active)
+    SELECT u, 1, 'test', '{}'::jsonb, n <> 3
+    FROM generate_series(1, 2000) AS u, generate_series(1, 3) AS n
+    """,
+    """
+    INSERT INTO triggers (user_id, source_id, trigger_type_id, name, config, is_active)
+    SELECT s.user_id, s.id, 1, 'test', '{}'::jsonb, t <> 5
+    FROM sources AS s, generate_series(1, 5) AS t
+    """,
+    """
+    INSERT INTO rules (user_id, source_id, trigger_id, user_notification_ids, is_active)
+    SELECT user_id, source_id, id, ARRAY[1, 2], is_active FROM triggers
+    """,
+]
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def engine():
+    engine = create_async_engine(
+        os.environ[TEST_DATABASE_URL_ENV],
+        connect_args={"server_settings": {"search_path": SCHEMA}},
+    )
+    tables = [
+        model.__table__
+        for model in (TriggersTypes, Sources, Notifications, Triggers, Rules)
+    ]
+    async with engine.begin() as conn:
+        await conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        await conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+        await conn.run_sync(lambda sync: Rules.metadata.create_all(sync, tables=tables))
+        for stmt in SEED:
+            await conn.execute(text(stmt))
+        await conn.execute(text("ANALYZE"))
+    yield engine
+    async with engine.begin() as conn:
+        await conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+    await engine.dispose()
+
+
+async def _captured(call) -> object:
+    """Запрос, который метод репозитория отправил бы в сессию."""
+    # результат — обычный MagicMock: scalars().all() и all() синхронные
+    session = MagicMock(execute=AsyncMock(return_value=MagicMock()))
+    await call(session)
+    return session.execute.await_args.args[0]
+
+
+async def _plan_nodes(engine, stmt) -> list[dict]:
+    sql = stmt.compile(
+        dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+    )
+    async with engine.connect() as conn:
+        result = await conn.execute(text(f"EXPLAIN (FORMAT JSON) {sql}"))
+        plan = result.scalar_one()[0]["Plan"]
+
+    nodes = []
+    pending = [plan]
+    while pending:
+        node = pending.pop()
+        nodes.append(node)
+        pending.extend(node.get("Plans", []))
+    return nodes
+
+
+def _assert_indexed(nodes, *indexes: str, tables=None) -> None:
+    seq_scans = [
+        node["Relation Name"]
+        for node in nodes
+        if node["Node Type"] == "Seq Scan"
+        and (tables is None or node["Relation Name"] in tables)
+    ]
+    assert not seq_scans, seq_scans
+    # у Bitmap Heap Scan имя индекса — в дочернем Bitmap Index Scan
+    used = {node["Index Name"] for node in nodes if "Index Name" in node}
+    assert set(indexes) <= used, used
+
+
+async def test_list_page_uses_user_id_index(engine):
+    stmt = await _captured(
+        lambda session: TriggerRepo(session).list_page(user_id=5, after_id=10)
+    )
+
+    _assert_indexed(await _plan_nodes(engine, stmt), "ix_triggers_user_id_id")
+
+
+async def test_trigger_by_source_uses_partial_index(engine):
+    stmt = await _captured(lambda session: TriggerRepo(session).list_active_specs([7]))
+
+    # справочник типов из одной строки читается последовательно — это нормально
+    _assert_indexed(
+        await _plan_nodes(engine, stmt),
+        "ix_triggers_source_id_active",
+        tables={"triggers"},
+    )
+
+
+async def test_rules_by_trigger_uses_partial_index(engine):
+    stmt = await _captured(
+        lambda session: RulesRepo(session).notification_ids_by_trigger([7, 8])
+    )
+
+    _assert_indexed(await _plan_nodes(engine, stmt), "ix_rules_trigger_id_active")
+
+
+async def test_scoped_rules_select_joins_by_index(engine):
+    # materialize(user_ids=[5]) после изменения уведомлений пользователя
+    stmt = RulesRepo._rules_select(Triggers.user_id.in_([5]))
+
+    _assert_indexed(
+        await _plan_nodes(engine, stmt),
+        "ix_triggers_user_id_id",
+        "ix_notifications_user_id_active",
+    )
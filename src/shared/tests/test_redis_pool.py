@@ -0,0 +1,59 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+import redis.asyncio as redis
+
+from src.shared.services.redis_pool import SharedRedisPool
+from src.shared.services.redis_service import RedisService
+
+
+def test_client_is_shared_and_bound_to_pool():
+    pool = SharedRedisPool(url="redis://redis.test:6379/0", max_connections=7)
+
+    client = pool.client
+
+    assert pool.client is client
+    assert client.connection_pool is pool.pool
+    assert pool.pool.max_connections == 7
+    assert pool.stats() == {"max": 7, "created": 0, "in_use": 0, "idle": 0}
+
+
+@pytest.mark.anyio
+async def test_close_resets_pool():
+    pool = SharedRedisPool(url="redis://redis.test:6379/0")
+    first = pool.pool
+
+    await pool.close()
+
+    assert pool.pool is not first
+
+
+@pytest.mark.anyio
+async def test_ping_reports_unavailable_redis(monkeypatch):
+    pool = SharedRedisPool(url="redis://redis.test:6379/0")
+    monkeypatch.setattr(
+        redis.Redis, "ping", AsyncMock(side_effect=redis.ConnectionError("down"))
+    )
+
+    assert await pool.ping() is False
+
+
+@pytest.mark.anyio
+async def test_mset_pipelines_set_with_ttl():
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[True, True])
+    pipe.__aenter__ = AsyncMock(return_value=pipe)
+    pipe.__aexit__ = AsyncMock(return_value=None)
+    client = MagicMock()
+    client.pipeline.return_value = pipe
+    client.mget = AsyncMock(return_value=["1", None])
+    service = RedisService(client)
+
+    await service.mset({"a": "1", "b": "2"}, ex=60)
+
+    client.pipeline.assert_called_once_with(transaction=False)
+    pipe.set.assert_any_call("a", "1", ex=60)
+    pipe.set.assert_any_call("b", "2", ex=60)
+    pipe.execute.assert_awaited_once()
+    assert await service.mget(["a", "b"]) == ["1", None]
+    assert await service.mget([]) == []
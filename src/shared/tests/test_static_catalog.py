@@ -0,0 +1,65 @@
+import json
+
+import pytest
+from fastapi import FastAPI, Request
+from httpx import ASGITransport, AsyncClient
+
+from src.shared.services.static_catalog import StaticCatalog
+
+
+def _app(catalog: StaticCatalog) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/list_types")
+    async def list_types(request: Request):
+        return catalog.response(request)
+
+    return app
+
+
+def test_catalog_is_built_once_with_stable_etag():
+    calls = []
+
+    def build():
+        calls.append(1)
+        return [{"name": "temp", "params": {"op": "<"}}]
+
+    first = StaticCatalog(build)
+    second = StaticCatalog(build)
+
+    assert first.etag == second.etag
+    assert first.etag.startswith('"') and first.etag.endswith('"')
+    assert json.loads(first.body) == [{"name": "temp", "params": {"op": "<"}}]
+    first.load()
+    assert len(calls) == 2
+
+
+@pytest.mark.anyio
+async def test_matching_if_none_match_returns_304():
+    catalog = StaticCatalog(lambda: [{"name": "email"}], max_age=60)
+
+    async with AsyncClient(
+        transport=ASGITransport(app=_app(catalog)), base_url="http://test"
+    ) as client:
+        fresh = await client.get("/list_types")
+        cached = await client.get(
+            "/list_types", headers={"If-None-Match": f'"other", W/{catalog.etag}'}
+        )
+        stale = await client.get("/list_types", headers={"If-None-Match": '"other"'})
+
+    assert fresh.status_code == 200
+    assert fresh.json() == [{"name": "email"}]
+    assert fresh.headers["etag"] == catalog.etag
+    assert fresh.headers["cache-control"] == "public, max-age=60"
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["etag"] == catalog.etag
+    assert stale.status_code == 200
+
+
+def test_registry_catalogs_build():
+    from src.modules.notifications.api.v1.router import notify_types_catalog
+    from src.modules.trigger.api.v1.trigger_router import trigger_types_catalog
+
+    for catalog in (notify_types_catalog, trigger_types_catalog):
+        assert isinstance(json.loads(catalog.body), list)
@@ -0,0 +1,91 @@
+import time
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from jose import JWTError
+
+from src.shared.services import token_verifier as verifier_module
+from src.shared.services.jwt_service import create_token, decode_token
+from src.shared.services.token_verifier import BloomFilter, TokenVerifier
+
+
+def _redis(revoked_keys=()):
+    client = MagicMock()
+    client.exists = AsyncMock(return_value=1)
+    client.set = AsyncMock()
+    client.publish = AsyncMock()
+
+    async def scan_iter(match, count):
+        for key in revoked_keys:
+            yield key
+
+    client.scan_iter = scan_iter
+    return client
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    keys = [f"jti-{i}" for i in range(1000)]
+    for key in keys:
+        bloom.add(key)
+
+    assert all(key in bloom for key in keys)
+    false_positives = sum(f"other-{i}" in bloom for i in range(10000))
+    assert false_positives < 300
+
+
+@pytest.mark.anyio
+async def test_verify_caches_decoded_token(monkeypatch):
+    decode = MagicMock(side_effect=decode_token)
+    monkeypatch.setattr(verifier_module, "decode_token", decode)
+    verifier = TokenVerifier(redis_client=_redis())
+    token = create_token({"sub": "1"}, timedelta(minutes=5))
+
+    first = await verifier.verify(token)
+    second = await verifier.verify(token)
+
+    assert first == second
+    assert first["sub"] == "1"
+    decode.assert_called_once_with(token)
+
+
+@pytest.mark.anyio
+async def test_cache_entry_does_not_outlive_token(monkeypatch):
+    verifier = TokenVerifier(redis_client=_redis(), cache_max_ttl=300)
+    token = create_token({"sub": "1"}, timedelta(seconds=30))
+    payload = await verifier.verify(token)
+
+    monkeypatch.setattr(verifier_module.time, "time", lambda: payload["exp"] + 1)
+
+    with pytest.raises(JWTError):
+        await verifier.verify(token)
+
+
+@pytest.mark.anyio
+async def test_revoked_token_is_rejected_and_others_skip_redis():
+    client = _redis()
+    verifier = TokenVerifier(redis_client=client)
+    revoked = create_token({"sub": "1"}, timedelta(minutes=5))
+    other = create_token({"sub": "2"}, timedelta(minutes=5))
+    payload = await verifier.verify(revoked)
+
+    await verifier.revoke(payload)
+
+    with pytest.raises(JWTError, match="revoked"):
+        await verifier.verify(revoked)
+    assert (await verifier.verify(other))["sub"] == "2"
+    client.exists.assert_awaited_once_with(f"revoked:{payload['jti']}")
+    ttl = client.set.await_args.kwargs["ex"]
+    assert 0 < ttl <= payload["exp"] - time.time() + 1
+    client.publish.assert_awaited_once_with("auth:revoked", payload["jti"])
+
+
+@pytest.mark.anyio
+async def test_resync_loads_revocations_from_redis():
+    verifier = TokenVerifier(redis_client=_redis(["revoked:abc", "revoked:def"]))
+
+    await verifier.resync()
+
+    assert "abc" in verifier.revoked
+    assert "def" in verifier.revoked
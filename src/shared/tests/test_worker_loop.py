@@ -0,0 +1,82 @@
+import asyncio
+import threading
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+import pytest
+
+from src.shared.celery_module.worker_loop import WorkerLoop
+
+
+async def _current_loop():
+    return asyncio.get_running_loop(), threading.current_thread().name
+
+
+@pytest.fixture
+def worker():
+    closed = []
+
+    async def on_close():
+        closed.append(asyncio.get_running_loop())
+
+    worker = WorkerLoop(on_close=on_close)
+    worker.closed = closed  # type: ignore[attr-defined]
+    yield worker
+    worker.stop()
+
+
+def test_tasks_share_one_background_loop(worker):
+    first_loop, thread_name = worker.run(_current_loop())
+    second_loop, _ = worker.run(_current_loop())
+
+    assert first_loop is second_loop
+    assert thread_name == "celery-worker-loop"
+
+
+def test_errors_propagate_and_loop_survives(worker):
+    async def fail():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        worker.run(fail())
+    assert worker.run(asyncio.sleep(0, result=5)) == 5
+
+
+def test_timeout_cancels_coroutine(worker):
+    cancelled = asyncio.Event()
+
+    async def slow():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    with pytest.raises(FutureTimeoutError):
+        worker.run(slow(), timeout=0.05)
+    worker.run(asyncio.wait_for(cancelled.wait(), 1))
+
+
+def test_stop_closes_resources_on_the_loop_and_restarts_lazily(worker):
+    loop, _ = worker.run(_current_loop())
+
+    worker.stop()
+
+    assert worker.closed == [loop]
+    assert loop.is_closed()
+    new_loop, _ = worker.run(_current_loop())
+    assert new_loop is not loop
+
+
+def test_on_start_runs_once_per_loop():
+    started = []
+    worker = WorkerLoop(on_start=lambda: started.append(True))
+    try:
+        worker.run(_current_loop())
+        worker.run(_current_loop())
+        assert started == [True]
+
+        worker.stop()
+        worker.run(_current_loop())
+        assert started == [True, True]
+    finally:
+        worker.stop()